@@ -5,6 +5,7 @@ This module defines the serializer for user registration and validation.
 """
 
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
 
@@ -68,6 +69,10 @@ class UserSerializer(serializers.ModelSerializer):
 
         Returns:
             User: Newly created User instance.
+
+        Raises:
+            serializers.ValidationError: If a concurrent registration took the
+                email after validate() checked it (unique index violation).
         """
                 
         validated_data.pop('repeated_password')
@@ -77,13 +82,17 @@ class UserSerializer(serializers.ModelSerializer):
         first_name = parts[0]
         last_name = parts[1] if len(parts) > 1 else ''
 
-        user = User.objects.create_user(
-            username=validated_data['email'],
-            email=validated_data['email'],
-            password=validated_data['password'],
-            first_name=first_name,
-            last_name=last_name
-        )
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=validated_data['email'],
+                    email=validated_data['email'],
+                    password=validated_data['password'],
+                    first_name=first_name,
+                    last_name=last_name
+                )
+        except IntegrityError:
+            raise serializers.ValidationError({'email': ['Email already exists.']})
 
         Token.objects.create(user=user)
 
@@ -3,6 +3,9 @@ Views for the authentication API of Kanmind.
 
 This module defines API endpoints for user registration, login, and logout.
 It uses token-based authentication with Django REST Framework's authtoken system.
+
+Every view declares `query_budget`, the number of SQL queries per HTTP method,
+enforced by kanban_app.tests.QueryBudgetTests.
 """
 
 from django.contrib.auth import authenticate
@@ -26,6 +29,8 @@ class RegistrationView(APIView):
     """
         
     permission_classes = [AllowAny]
+    # Includes the savepoint around the user INSERT (see UserSerializer.create).
+    query_budget = {'POST': 6}
 
     def post(self, request):
         """
@@ -66,6 +71,7 @@ class LoginView(APIView):
     """
         
     permission_classes = [AllowAny]
+    query_budget = {'POST': 2}
 
     def post(self, request):
         """
@@ -111,9 +117,12 @@ class LogoutView(APIView):
     
     Methods:
         post: Deletes the current user's authentication token.
+
+    Deleting the token also evicts it from the token authentication cache.
     """
         
     permission_classes = [IsAuthenticated]
+    query_budget = {'POST': 1}
 
     def post(self, request):
         """
@@ -17,3 +17,7 @@ class AuthAppConfig(AppConfig):
         
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'auth_app'
+
+    def ready(self):
+        """Connect the signal handlers that keep the token cache consistent."""
+        from auth_app import signals  # noqa: F401
@@ -0,0 +1,184 @@
+"""
+Cached token authentication for Kanmind.
+
+DRF's TokenAuthentication joins Token and User in the database on every
+request. CachedTokenAuthentication keeps resolved tokens in a bounded,
+thread-safe LRU with a time-to-live, optionally backed by a Django cache
+alias shared between worker processes, so authenticated requests usually
+cost no authentication query at all.
+
+Entries are evicted immediately when a token is deleted (e.g. by LogoutView)
+and when a user is saved or deleted (e.g. deactivated), see auth_app.signals.
+With a shared CACHE_ALIAS, an eviction also increments a per-user generation
+counter in the shared cache. Every process checks that counter before it
+trusts an entry of its own LRU, so an eviction takes effect in all worker
+processes right away. This costs one shared cache read per request, but no
+database query.
+
+Configuration (settings.KANMIND_TOKEN_CACHE):
+    MAX_SIZE (int): Maximum number of tokens kept per process.
+    TTL (float): Seconds a resolved token stays valid in the cache.
+    CACHE_ALIAS (str|None): Django cache alias used as shared second level.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+DEFAULTS = {
+    'MAX_SIZE': 10000,
+    'TTL': 60,
+    'CACHE_ALIAS': None,
+}
+
+CACHE_KEY = 'kanmind:token:{key}'
+GENERATION_KEY = 'kanmind:token-generation:{user_id}'
+
+
+class TokenCache:
+    """
+    Bounded LRU of resolved tokens with a TTL and an optional shared cache level.
+
+    Values are (user, token) tuples. All methods are thread-safe.
+
+    In-process entries remember the generation of their user in the shared
+    cache at the time they were stored; get() drops them once it changed.
+    """
+
+    def __init__(self, max_size, ttl, cache_alias=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.shared = caches[cache_alias] if cache_alias else None
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached (user, token) for `key`, or None if missing, expired or evicted."""
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires, generation, value = entry
+                if expires <= now:
+                    del self.entries[key]
+                    entry = None
+                else:
+                    self.entries.move_to_end(key)
+
+        if entry is not None:
+            if self.shared is None or generation == self.get_generation(value[0].pk):
+                return value
+            with self.lock:
+                self.entries.pop(key, None)
+
+        if self.shared is not None:
+            value = self.shared.get(CACHE_KEY.format(key=key))
+            if value is not None:
+                self.store_local(key, value)
+                return value
+        return None
+
+    def set(self, key, value):
+        """Cache the (user, token) tuple for `key`."""
+        self.store_local(key, value)
+        if self.shared is not None:
+            self.shared.set(CACHE_KEY.format(key=key), value, self.ttl)
+
+    def store_local(self, key, value):
+        generation = self.get_generation(value[0].pk) if self.shared is not None else 0
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, generation, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def get_generation(self, user_id):
+        """Return the eviction generation of the user with `user_id` in the shared cache."""
+        return self.shared.get(GENERATION_KEY.format(user_id=user_id), 0)
+
+    def bump_generation(self, user_id):
+        """Invalidate the in-process entries of the user with `user_id` in every process."""
+        generation_key = GENERATION_KEY.format(user_id=user_id)
+        self.shared.add(generation_key, 0, None)
+        try:
+            self.shared.incr(generation_key)
+        except ValueError:
+            # The key vanished between add() and incr(); any new value still differs.
+            self.shared.set(generation_key, time.time_ns(), None)
+
+    def evict(self, *keys, user_id=None):
+        """
+        Remove the given token keys from both cache levels.
+
+        Pass the `user_id` the tokens belong to, so that the in-process
+        entries of other processes are dropped as well.
+        """
+
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+        if self.shared is not None:
+            if keys:
+                self.shared.delete_many([CACHE_KEY.format(key=key) for key in keys])
+            if user_id is not None:
+                self.bump_generation(user_id)
+
+    def evict_user(self, user_id):
+        """Remove every cached token that belongs to the user with `user_id`."""
+        with self.lock:
+            keys = {key for key, (_, _, (user, _)) in self.entries.items() if user.pk == user_id}
+        if self.shared is not None:
+            keys.update(Token.objects.filter(user_id=user_id).values_list('key', flat=True))
+        self.evict(*keys, user_id=user_id)
+
+    def clear(self):
+        """Remove all entries of the in-process level."""
+        with self.lock:
+            self.entries.clear()
+
+
+_token_cache = None
+
+
+def get_token_cache():
+    """Return the process-wide TokenCache, configured from settings.KANMIND_TOKEN_CACHE."""
+    global _token_cache
+    if _token_cache is None:
+        options = {**DEFAULTS, **getattr(settings, 'KANMIND_TOKEN_CACHE', {})}
+        _token_cache = TokenCache(options['MAX_SIZE'], options['TTL'], options['CACHE_ALIAS'])
+    return _token_cache
+
+
+@receiver(setting_changed)
+def reset_token_cache(setting, **kwargs):
+    """Rebuild the TokenCache when its settings are overridden (e.g. in tests)."""
+    global _token_cache
+    if setting == 'KANMIND_TOKEN_CACHE':
+        _token_cache = None
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that resolves tokens through the TokenCache.
+
+    On a cache miss the token is loaded by DRF's TokenAuthentication (one
+    Token + User query) and cached. Each request receives its own copy of the
+    cached user, so per-request attributes never leak between requests.
+    """
+
+    def authenticate_credentials(self, key):
+        token_cache = get_token_cache()
+        cached = token_cache.get(key)
+        if cached is None:
+            cached = super().authenticate_credentials(key)
+            token_cache.set(key, cached)
+        user, token = cached
+        return (copy.copy(user), token)
@@ -0,0 +1,51 @@
+# Indexes on auth_user.email, the login identifier of Kanmind.
+#
+# auth_user_email_idx serves the `email = %s` lookups of EmailAuthBackend,
+# EmailCheckView and UserSerializer. auth_user_email_uniq enforces unique
+# emails; it is partial because users created without an email (e.g. via
+# createsuperuser) store an empty string.
+#
+# check_duplicate_emails runs first and stops the migration with a list of the
+# conflicting emails, instead of the bare IntegrityError of CREATE UNIQUE INDEX.
+# Merge or change those accounts (e.g. in the admin), then migrate again.
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def check_duplicate_emails(apps, schema_editor):
+    User = apps.get_model('auth', 'User')
+    duplicates = (
+        User.objects.using(schema_editor.connection.alias)
+        .exclude(email='')
+        .values('email')
+        .annotate(users=Count('id'))
+        .filter(users__gt=1)
+        .order_by('email')
+    )
+    if duplicates:
+        lines = '\n'.join(f"  {row['email']}: {row['users']} users" for row in duplicates)
+        raise RuntimeError(
+            'Cannot create the unique index on auth_user.email, these emails are used by more than one user:\n'
+            f'{lines}\nGive each of these users a distinct email and run the migration again.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('auth_app', '0002_delete_userprofile'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.RunSQL(
+            sql='CREATE INDEX auth_user_email_idx ON auth_user (email);',
+            reverse_sql='DROP INDEX auth_user_email_idx;',
+        ),
+        migrations.RunSQL(
+            sql="CREATE UNIQUE INDEX auth_user_email_uniq ON auth_user (email) WHERE email <> '';",
+            reverse_sql='DROP INDEX auth_user_email_uniq;',
+        ),
+    ]
@@ -0,0 +1,26 @@
+"""
+Signal handlers for the authentication app of Kanmind.
+
+They evict entries from the token authentication cache as soon as a token is
+deleted (logout) or its user is saved or deleted (e.g. deactivated), so that
+revoked credentials stop working immediately.
+"""
+
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from auth_app.authentication import get_token_cache
+
+
+@receiver(post_delete, sender=Token)
+def evict_deleted_token(sender, instance, **kwargs):
+    """Evict a deleted token from the token cache."""
+    get_token_cache().evict(instance.key, user_id=instance.user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def evict_user_tokens(sender, instance, **kwargs):
+    """Evict all cached tokens of a saved or deleted user."""
+    get_token_cache().evict_user(instance.pk)
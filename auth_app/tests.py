@@ -1,3 +1,108 @@
-#from django.test import TestCase
+"""
+Tests for the Kanmind authentication app.
+"""
 
-# Create your tests here.
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from auth_app.api.serializers import UserSerializer
+from auth_app.authentication import TokenCache
+
+
+@override_settings(KANMIND_TOKEN_CACHE={'MAX_SIZE': 2, 'TTL': 60, 'CACHE_ALIAS': None})
+class CachedTokenAuthenticationTests(APITestCase):
+    """
+    Tests for CachedTokenAuthentication and its eviction rules.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='user@example.com', email='user@example.com', password='secret-pass')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_cached_token_needs_no_auth_query(self):
+        self.client.get(reverse('boards-list'))
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('boards-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_logout_evicts_token(self):
+        self.client.get(reverse('boards-list'))
+
+        response = self.client.post(reverse('logout'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('boards-list'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivation_evicts_token(self):
+        self.client.get(reverse('boards-list'))
+
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(reverse('boards-list'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class SharedTokenCacheTests(APITestCase):
+    """
+    Tests that evictions reach the in-process level of every process sharing a cache.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='user@example.com', email='user@example.com', password='secret-pass')
+        self.token = Token.objects.create(user=self.user)
+        # Two worker processes: separate in-process LRUs over one shared cache.
+        self.this_process = TokenCache(10, 60, 'default')
+        self.other_process = TokenCache(10, 60, 'default')
+        self.this_process.set(self.token.key, (self.user, self.token))
+        self.assertIsNotNone(self.other_process.get(self.token.key))
+
+    def test_token_eviction_reaches_other_processes(self):
+        self.this_process.evict(self.token.key, user_id=self.user.pk)
+
+        self.assertIsNone(self.other_process.get(self.token.key))
+
+    def test_user_eviction_reaches_other_processes(self):
+        self.this_process.evict_user(self.user.pk)
+
+        self.assertIsNone(self.other_process.get(self.token.key))
+
+    def test_entries_of_other_users_stay_cached(self):
+        other = User.objects.create_user(username='other@example.com', email='other@example.com', password='secret-pass')
+        self.this_process.evict_user(other.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.other_process.get(self.token.key), (self.user, self.token))
+
+
+class RegistrationTests(APITestCase):
+    """
+    Tests for RegistrationView.
+    """
+
+    def test_email_taken_after_validation_is_a_field_error(self):
+        User.objects.create_user(username='user@example.com', email='user@example.com', password='secret-pass')
+        data = {
+            'fullname': 'Second User',
+            'email': 'user@example.com',
+            'password': 'secret-pass',
+            'repeated_password': 'secret-pass'
+        }
+
+        # Simulate a concurrent registration that wins after validate() checked the email.
+        with patch.object(UserSerializer, 'validate', lambda self, data: data):
+            response = self.client.post(reverse('registration'), data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'email': ['Email already exists.']})
+        self.assertEqual(User.objects.filter(email='user@example.com').count(), 1)
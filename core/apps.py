@@ -0,0 +1,24 @@
+"""
+Django App configuration for the project package of Kanmind.
+
+`core` holds the project-wide settings, middleware and database tuning. It is
+installed as an app only so that its signal receivers are connected before
+the first database connection, independent of the other apps.
+"""
+
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """
+    Configuration class for the project package.
+
+    Attributes:
+        name (str): Name of the Django application.
+    """
+
+    name = 'core'
+
+    def ready(self):
+        """Connect the receivers that tune and instrument new database connections."""
+        from core import middleware, sqlite  # noqa: F401
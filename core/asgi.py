@@ -3,6 +3,10 @@ ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Besides the synchronous DRF views, the ASGI application serves the native
+async read endpoints under /api/async/ (kanban_app.api.async_views), which
+use Django's async ORM instead of occupying a thread per request.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -0,0 +1,208 @@
+"""
+Request instrumentation middleware for Kanmind.
+
+RequestInstrumentationMiddleware measures every request, independent of
+DEBUG, and reports:
+- the number of SQL queries and the total SQL time,
+- the slowest statement,
+- the time spent producing serializer data (Serializer.data),
+- the total time of the request through the view and inner middleware,
+- SQL shapes repeated more often than the N+1 threshold.
+
+The queries are recorded by record_query(), an execute wrapper installed once
+on every database connection when it is opened (connection_created, connected
+by core.apps.CoreConfig). It forwards each statement to the RequestRecorder
+of the current request, held in a ContextVar. The ORM calls of concurrent
+ASGI requests share the threads of sync_to_async, but each call runs in the
+context of its request, so requests never record each other's queries. The
+timings are returned in a Server-Timing header and
+every request is logged as one JSON object to the `kanmind.requests` logger,
+at WARNING level if the request was slow or showed an N+1 pattern.
+
+Configuration (settings.KANMIND_INSTRUMENTATION):
+    SERVER_TIMING (bool): Add the Server-Timing header.
+    SLOW_REQUEST_MS (float): Requests taking longer are flagged as slow.
+    N_PLUS_ONE_THRESHOLD (int): SQL shapes repeated more often are flagged.
+"""
+
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from rest_framework import serializers
+
+
+logger = logging.getLogger('kanmind.requests')
+
+DEFAULTS = {
+    'SERVER_TIMING': True,
+    'SLOW_REQUEST_MS': 500,
+    'N_PLUS_ONE_THRESHOLD': 10,
+}
+
+IN_LIST = re.compile(r'\((?:\s*%s\s*,)+\s*%s\s*\)')
+
+current_recorder = ContextVar('kanmind_request_recorder', default=None)
+
+
+def get_config():
+    """Return KANMIND_INSTRUMENTATION merged with the defaults."""
+    return {**DEFAULTS, **getattr(settings, 'KANMIND_INSTRUMENTATION', {})}
+
+
+def get_sql_shape(sql):
+    """Return `sql` with IN lists collapsed, so queries differing only in their parameters compare equal."""
+    return IN_LIST.sub('(%s, ...)', sql)
+
+
+class RequestRecorder:
+    """
+    Collects the queries and timings of one request.
+
+    The middleware makes an instance the current recorder, which
+    record_query() calls for every statement of the request. Instances can
+    also be installed directly with connection.execute_wrapper().
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.sql_time = 0.0
+        self.slowest = (0.0, None)
+        self.shapes = Counter()
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.query_count += 1
+            self.sql_time += duration
+            self.shapes[get_sql_shape(sql)] += 1
+            if duration > self.slowest[0]:
+                self.slowest = (duration, sql)
+
+    def get_report(self, request, response):
+        """Return the measurements of the finished request as a JSON-serializable dict."""
+        config = get_config()
+        total_ms = (time.perf_counter() - self.started) * 1000
+        repeated = [
+            {'sql': shape, 'count': count}
+            for shape, count in self.shapes.most_common()
+            if count > config['N_PLUS_ONE_THRESHOLD']
+        ]
+        return {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': round(total_ms, 2),
+            'queries': self.query_count,
+            'sql_ms': round(self.sql_time * 1000, 2),
+            'slowest_sql_ms': round(self.slowest[0] * 1000, 2),
+            'slowest_sql': self.slowest[1],
+            'serializer_ms': round(self.serializer_time * 1000, 2),
+            'slow': total_ms > config['SLOW_REQUEST_MS'],
+            'n_plus_one': repeated,
+        }
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper passing every statement to the recorder of the current request, if any."""
+    recorder = current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    """Install record_query() on a new connection (once, it survives reconnects)."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def timed_serializer_data(data_property):
+    """Wrap the Serializer.data property so that its time is added to the current request."""
+
+    def data(self):
+        recorder = current_recorder.get()
+        if recorder is None or recorder.serializer_depth:
+            return data_property.fget(self)
+        recorder.serializer_depth += 1
+        started = time.perf_counter()
+        try:
+            return data_property.fget(self)
+        finally:
+            recorder.serializer_time += time.perf_counter() - started
+            recorder.serializer_depth -= 1
+
+    data.instrumented = True
+    return property(data)
+
+
+def instrument_serializers():
+    """Install the Serializer.data timing once per process."""
+    if not getattr(serializers.BaseSerializer.data.fget, 'instrumented', False):
+        serializers.BaseSerializer.data = timed_serializer_data(serializers.BaseSerializer.data)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Records SQL, serializer and total time of every request.
+
+    Works for WSGI and ASGI requests: the recorder is bound to the request's
+    context, which sync_to_async carries into the threads running its ORM calls.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        instrument_serializers()
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        recorder = RequestRecorder()
+        token = current_recorder.set(recorder)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        return self.finish(recorder, request, response)
+
+    async def __acall__(self, request):
+        recorder = RequestRecorder()
+        token = current_recorder.set(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        return self.finish(recorder, request, response)
+
+    def finish(self, recorder, request, response):
+        report = recorder.get_report(request, response)
+        if get_config()['SERVER_TIMING']:
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={report["sql_ms"]};desc="{report["queries"]} queries"',
+                f'db-slowest;dur={report["slowest_sql_ms"]}',
+                f'serializer;dur={report["serializer_ms"]}',
+                f'total;dur={report["total_ms"]}',
+            ])
+        level = logging.WARNING if report['slow'] or report['n_plus_one'] else logging.INFO
+        logger.log(level, json.dumps(report))
+        return response
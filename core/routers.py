@@ -0,0 +1,146 @@
+"""
+Read-replica routing for Kanmind.
+
+ReplicaRouter (settings.DATABASE_ROUTERS) sends the reads of selected GET
+requests to a replica alias and everything else to `default`:
+
+- ReplicaRoutingMiddleware gives every request a RoutingState and records
+  whether the request wrote anything.
+- Views that tolerate replication lag use kanban_app.api.mixins.ReplicaReadMixin,
+  which allows replica reads for safe methods once the user is authenticated.
+- After a request that wrote, its user is pinned to the primary for
+  STICKY_SECONDS (stored in a Django cache), so users always read their own
+  changes even if the replicas lag behind.
+
+Reads outside of an allowing view (other requests, management commands,
+signal handlers) and all writes go to `default`.
+
+Configuration (settings.KANMIND_READ_REPLICAS):
+    ALIASES (list[str]): Database aliases of the replicas; empty disables routing.
+    STICKY_SECONDS (int): Seconds a user reads from the primary after a write.
+    CACHE_ALIAS (str): Django cache alias holding the pins. Use a shared
+        backend when running several worker processes.
+"""
+
+import random
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+
+
+DEFAULTS = {
+    'ALIASES': [],
+    'STICKY_SECONDS': 5,
+    'CACHE_ALIAS': 'default',
+}
+
+PIN_KEY = 'kanmind:replica-pin:{user_id}'
+
+current_state = ContextVar('kanmind_routing_state', default=None)
+
+
+def get_config():
+    """Return KANMIND_READ_REPLICAS merged with the defaults."""
+    return {**DEFAULTS, **getattr(settings, 'KANMIND_READ_REPLICAS', {})}
+
+
+class RoutingState:
+    """Routing decisions of one request."""
+
+    def __init__(self):
+        self.use_replicas = False
+        self.wrote = False
+
+
+def is_pinned(user):
+    """Return True if `user` wrote recently and must read from the primary."""
+    if not user.is_authenticated:
+        return False
+    return caches[get_config()['CACHE_ALIAS']].get(PIN_KEY.format(user_id=user.pk)) is not None
+
+
+def pin(user):
+    """Pin `user` to the primary for STICKY_SECONDS."""
+    config = get_config()
+    if config['ALIASES'] and config['STICKY_SECONDS'] and user is not None and user.is_authenticated:
+        caches[config['CACHE_ALIAS']].set(PIN_KEY.format(user_id=user.pk), True, config['STICKY_SECONDS'])
+
+
+def allow_replica_reads(user):
+    """
+    Let the remaining reads of the current request use a replica, unless `user` is pinned.
+
+    Does nothing outside of ReplicaRoutingMiddleware or without replicas.
+    """
+
+    state = current_state.get()
+    if state is not None and get_config()['ALIASES'] and not is_pinned(user):
+        state.use_replicas = True
+
+
+class ReplicaRouter:
+    """Routes reads of allowing requests to a random replica and all writes to the primary."""
+
+    def db_for_read(self, model, **hints):
+        state = current_state.get()
+        if state is not None and state.use_replicas and not state.wrote:
+            aliases = get_config()['ALIASES']
+            if aliases:
+                return random.choice(aliases)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = current_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_config()['ALIASES']}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Tracks the routing state of every request and pins users who wrote to the primary.
+
+    Works for WSGI and ASGI requests.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        state = RoutingState()
+        token = current_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_state.reset(token)
+        if state.wrote:
+            pin(getattr(request, 'user', None))
+        return response
+
+    async def __acall__(self, request):
+        state = RoutingState()
+        token = current_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_state.reset(token)
+        if state.wrote:
+            await sync_to_async(pin)(getattr(request, 'user', None))
+        return response
@@ -39,12 +39,15 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework.authtoken',
+    'core',
     'auth_app',
     'kanban_app',
     'corsheaders',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestInstrumentationMiddleware',
+    'core.routers.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -78,11 +81,47 @@ WSGI_APPLICATION = 'core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Transactions start with BEGIN IMMEDIATE, so a transaction that writes waits
+# for the write lock (busy_timeout) up front instead of failing with "database
+# is locked" when it upgrades from a read lock.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+    # Stand-in read replica for local testing: a second SQLite file, refreshed
+    # from the primary with `python manage.py sync_replicas`. Only used once
+    # its alias is listed in KANMIND_READ_REPLICAS['ALIASES'].
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db-replica.sqlite3',
+    },
+}
+
+# Reads of selected GET requests go to the replicas, writes to 'default' (see
+# core.routers). After a write the user reads from 'default' for
+# STICKY_SECONDS; with several worker processes, point CACHE_ALIAS at a
+# shared cache backend.
+DATABASE_ROUTERS = ['core.routers.ReplicaRouter']
+
+KANMIND_READ_REPLICAS = {
+    'ALIASES': [],
+    'STICKY_SECONDS': 5,
+    'CACHE_ALIAS': 'default',
+}
+
+# PRAGMAs applied to every new SQLite connection (see core.sqlite). None keeps
+# SQLite's default for a PRAGMA.
+KANMIND_SQLITE_PRAGMAS = {
+    'busy_timeout': 5000,
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,
+    'temp_store': 'MEMORY',
 }
 
 
@@ -132,7 +171,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated'
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication'
+        'auth_app.authentication.CachedTokenAuthentication'
     ],
     'EXCEPTION_HANDLER': 'kanban_app.api.exceptions.global_exception_handler',
 }
@@ -145,3 +184,85 @@ AUTHENTICATION_BACKENDS = [
 CORS_ALLOWED_ORIGINS = [
     "http://127.0.0.1:5500",
 ]
+
+# The default local-memory cache also holds the per-user response cache
+# (KANMIND_RESPONSE_CACHE). With several worker processes, switch it to a
+# shared backend, e.g. 'django.core.cache.backends.filebased.FileBasedCache'
+# with a LOCATION directory, or 'django.core.cache.backends.redis.RedisCache'.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Cross-request cache for the board IDs a user may access (seconds, 0 disables).
+# Entries are invalidated on membership and owner changes; use a shared cache
+# backend when running several worker processes.
+KANMIND_MEMBERSHIP_CACHE_TIMEOUT = 0
+
+# In-process cache of resolved authentication tokens (see auth_app.authentication).
+# Set CACHE_ALIAS to a shared Django cache alias to share entries between processes
+# and to revoke tokens in all of them at once.
+KANMIND_TOKEN_CACHE = {
+    'MAX_SIZE': 10000,
+    'TTL': 60,
+    'CACHE_ALIAS': None,
+}
+
+# Delivery backend of the board event hub (see kanban_app.events). LocalBackend
+# reaches subscribers of the same process only; with several worker processes
+# use 'kanban_app.events.FileBackend' and OPTIONS {'PATH': '/path/to/events.log'}
+# (optionally 'MAX_BYTES', the spool size at which it is rotated).
+KANMIND_EVENTS_BACKEND = 'kanban_app.events.LocalBackend'
+KANMIND_EVENTS_OPTIONS = {}
+
+# Seconds between keepalive comments on idle board event streams.
+KANMIND_EVENTS_KEEPALIVE = 15
+
+# Lifetime in seconds of the signed `?ticket=` that browsers (EventSource) use
+# to open a board event stream without an Authorization header.
+KANMIND_EVENTS_TICKET_MAX_AGE = 60
+
+# Per-user cache of read responses, keyed by board versions (see
+# kanban_app.response_cache). TIMEOUT in seconds, 0 disables the cache.
+KANMIND_RESPONSE_CACHE = {
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 300,
+}
+
+# Dashboard summary (see kanban_app.dashboard). Cached responses are keyed by
+# the board versions, so task writes invalidate them; the short timeout bounds
+# how long the overdue and due-soon counts lag behind after midnight.
+KANMIND_DASHBOARD = {
+    'DUE_SOON_DAYS': 7,
+    'MAX_DUE_SOON_DAYS': 90,
+    'CACHE_TIMEOUT': 60,
+}
+
+# Per-request SQL and timing instrumentation (see core.middleware). Reports go
+# to the Server-Timing header and, as JSON, to the `kanmind.requests` logger.
+KANMIND_INSTRUMENTATION = {
+    'SERVER_TIMING': True,
+    'SLOW_REQUEST_MS': 500,
+    'N_PLUS_ONE_THRESHOLD': 10,
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'kanmind.requests': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
+
+# Mutes the `kanmind.requests` log while the tests run (see core.test_runner).
+TEST_RUNNER = 'core.test_runner.KanmindTestRunner'
@@ -0,0 +1,87 @@
+"""
+SQLite connection tuning for Kanmind.
+
+configure_sqlite() runs for every new database connection (connection_created
+signal, connected by core.apps.CoreConfig) and applies the PRAGMAs configured in settings.KANMIND_SQLITE_PRAGMAS
+to SQLite connections. The defaults target several worker processes sharing
+one database file:
+
+- journal_mode=WAL: readers no longer block the writer and vice versa.
+- synchronous=NORMAL: in WAL mode only checkpoints are synced, commits stay
+  durable against application crashes (not against power loss).
+- busy_timeout: milliseconds a connection waits for a lock before failing
+  with "database is locked".
+- mmap_size: bytes of the database file read through memory mapping.
+- cache_size: page cache per connection, negative values are KiB.
+- temp_store=MEMORY: temporary tables and indexes (sorts) stay in memory.
+
+The journal mode is stored in the database file; the other PRAGMAs apply to
+the connection only. Set a PRAGMA to None to keep SQLite's default.
+
+Configuration (settings.KANMIND_SQLITE_PRAGMAS): dict of PRAGMA name to value,
+merged with DEFAULTS and applied in that order.
+"""
+
+import re
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+DEFAULTS = {
+    'busy_timeout': 5000,
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+NAME = re.compile(r'^[a-z_]+$')
+KEYWORD = re.compile(r'^[A-Za-z]+$')
+
+
+def get_pragmas():
+    """Return KANMIND_SQLITE_PRAGMAS merged with the defaults, without disabled entries."""
+    pragmas = {**DEFAULTS, **getattr(settings, 'KANMIND_SQLITE_PRAGMAS', {})}
+    return {name: value for name, value in pragmas.items() if value is not None}
+
+
+def get_statements(pragmas):
+    """
+    Return the PRAGMA statements for `pragmas`.
+
+    PRAGMA values cannot be passed as query parameters, so names and values
+    are validated instead.
+
+    Raises:
+        ImproperlyConfigured: If a name or value is neither an integer nor a keyword.
+    """
+
+    statements = []
+    for name, value in pragmas.items():
+        if not NAME.match(name):
+            raise ImproperlyConfigured(f'Invalid SQLite PRAGMA name: {name!r}.')
+        if isinstance(value, bool) or not (isinstance(value, int) or KEYWORD.match(str(value))):
+            raise ImproperlyConfigured(f'Invalid value for SQLite PRAGMA {name}: {value!r}.')
+        statements.append(f'PRAGMA {name} = {value}')
+    return statements
+
+
+def apply_pragmas(cursor, pragmas):
+    """Execute the PRAGMA statements for `pragmas` with a DB-API cursor."""
+    for statement in get_statements(pragmas):
+        cursor.execute(statement)
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    """Apply the configured PRAGMAs to a new SQLite connection."""
+    if connection.vendor != 'sqlite':
+        return
+    cursor = connection.connection.cursor()
+    try:
+        apply_pragmas(cursor, get_pragmas())
+    finally:
+        cursor.close()
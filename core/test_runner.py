@@ -0,0 +1,25 @@
+"""
+Test runner for Kanmind.
+
+Silences the `kanmind.requests` logger of the instrumentation middleware
+while the tests run, so slow or N+1 requests in the tests do not print their
+JSON reports. Tests that check the reports use assertLogs(), which lowers
+the level again for their duration.
+"""
+
+import logging
+from django.test.runner import DiscoverRunner
+
+
+class KanmindTestRunner(DiscoverRunner):
+    """DiscoverRunner that mutes the per-request log during the test run."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        request_logger = logging.getLogger('kanmind.requests')
+        self.request_log_level = request_logger.level
+        request_logger.setLevel(logging.CRITICAL + 1)
+
+    def teardown_test_environment(self, **kwargs):
+        logging.getLogger('kanmind.requests').setLevel(self.request_log_level)
+        super().teardown_test_environment(**kwargs)
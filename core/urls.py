@@ -5,6 +5,7 @@ This module defines the top-level URL routing:
 - Admin interface
 - Authentication API endpoints
 - Kanban application API endpoints
+- Async read endpoints for ASGI deployments
 
 Each included module provides its own URL patterns.
 """
@@ -20,6 +21,9 @@ urlpatterns = [
     # Authentication endpoints
     path('api/', include('auth_app.api.urls')),
 
+    # Async read endpoints (served natively under core/asgi.py)
+    path('api/async/', include('kanban_app.api.async_urls')),
+
     # Kanban API endpoints
     path('api/', include('kanban_app.api.urls'))
 ]
@@ -0,0 +1,20 @@
+"""
+URL routes for the async read endpoints of the Kanmind API.
+
+They are mounted under /api/async/ and mirror the GET routes of urls.py.
+Serve them with an ASGI server (core/asgi.py) to benefit from the async ORM.
+"""
+
+from django.urls import path
+from .async_views import boards_list, board_detail, board_events, tasks_assigned_to_me, tasks_reviewing, comments_list
+
+urlpatterns = [
+    path('boards/', boards_list, name='async-boards-list'),
+    path('boards/<int:pk>/', board_detail, name='async-board-detail'),
+    path('boards/<int:pk>/events/', board_events, name='async-board-events'),
+
+    path('tasks/assigned-to-me/', tasks_assigned_to_me, name='async-tasks-assigned-to-me'),
+    path('tasks/reviewing/', tasks_reviewing, name='async-tasks-reviewing'),
+
+    path('tasks/<int:pk>/comments/', comments_list, name='async-comments-list')
+]
@@ -0,0 +1,288 @@
+"""
+Native async read views for the Kanmind API.
+
+The DRF views in views.py are synchronous, so under an ASGI server every
+request occupies a thread while it waits for the database. The views in this
+module are `async def` Django views that use the async ORM and async cache
+APIs, so one worker can serve many concurrent slow clients. They mirror the
+GET responses of their synchronous counterparts byte for byte:
+
+- boards_list: BoardsView (GET)
+- board_detail: BoardDetail (GET, with ETag)
+- tasks_assigned_to_me: TasksAssignedToMeView
+- tasks_reviewing: TasksReviewingView
+- comments_list: CommentsView (GET, with ETag)
+
+board_events has no synchronous counterpart: it streams the change events of
+a board (kanban_app.events) as Server-Sent Events.
+
+Authentication uses the same token cache as CachedTokenAuthentication.
+board_events also accepts a `?ticket=` from EventTicketView, because
+browsers subscribe with EventSource, which cannot send headers.
+Serialization reuses the DRF serializers on fully loaded objects, or the lean
+serializers of values_serializers.py on `.values()` rows for the task and
+comment lists, so it never touches the database from the event loop.
+"""
+
+import asyncio
+import copy
+import json
+from functools import wraps
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import Prefetch, aprefetch_related_objects
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import APIException, NotFound, PermissionDenied
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from auth_app.authentication import get_token_cache
+from kanban_app.events import OVERFLOW, get_hub, read_ticket
+from kanban_app.membership import aget_board_ids, aload_board_ids
+from kanban_app.models import Board, Task, Comment
+from .filters import TaskOrdering, filter_tasks
+from .mixins import make_etag, is_not_modified
+from .pagination import CommentCursorPagination
+from .serializers import BoardSerializer, BoardDetailSerializer
+from .values_serializers import CommentValuesSerializer, TaskAssignedOrReviewingValuesSerializer
+
+
+def json_response(data, status_code=status.HTTP_200_OK, headers=None):
+    """Render `data` exactly like DRF's JSONRenderer and wrap it in an HttpResponse."""
+    content = JSONRenderer().render(data) if data is not None else b''
+    return HttpResponse(content, status=status_code, headers=headers, content_type='application/json')
+
+
+async def authenticate(request):
+    """
+    Resolve the user of a `Authorization: Token <key>` header.
+
+    Returns:
+        tuple: (user, None) on success, or (None, error message) on failure.
+    """
+
+    parts = request.headers.get('Authorization', '').split()
+    if not parts or parts[0].lower() != 'token':
+        return None, 'Authentication credentials were not provided.'
+    if len(parts) != 2:
+        return None, 'Invalid token header.'
+
+    key = parts[1]
+    token_cache = get_token_cache()
+    cached = token_cache.get(key)
+    if cached is None:
+        try:
+            token = await Token.objects.select_related('user').aget(key=key)
+        except Token.DoesNotExist:
+            return None, 'Invalid token.'
+        if not token.user.is_active:
+            return None, 'User inactive or deleted.'
+        cached = (token.user, token)
+        token_cache.set(key, cached)
+    return copy.copy(cached[0]), None
+
+
+async def authenticate_ticket(ticket, board_id):
+    """
+    Resolve the user of an event stream ticket for `board_id`.
+
+    Returns:
+        tuple: (user, None) on success, or (None, error message) on failure.
+    """
+
+    user_id = read_ticket(ticket, board_id)
+    if user_id is None:
+        return None, 'Invalid or expired ticket.'
+    user = await User.objects.filter(pk=user_id, is_active=True).afirst()
+    if user is None:
+        return None, 'User inactive or deleted.'
+    return user, None
+
+
+def async_api_view(view=None, *, tickets=False):
+    """
+    Turn an async function into a GET-only, token-authenticated API view.
+
+    With `tickets=True`, requests without an Authorization header may
+    authenticate with a `?ticket=` for the board in the `pk` URL argument
+    (see kanban_app.events.make_ticket).
+
+    DRF APIExceptions raised by the view are rendered as `{"detail": ...}`
+    responses (validation errors as their field errors) with the
+    exception's status code, as DRF would do.
+    """
+
+    if view is None:
+        return lambda view: async_api_view(view, tickets=tickets)
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method != 'GET':
+            return json_response(
+                {'detail': f'Method "{request.method}" not allowed.'},
+                status.HTTP_405_METHOD_NOT_ALLOWED,
+                headers={'Allow': 'GET'}
+            )
+
+        if tickets and 'Authorization' not in request.headers and 'ticket' in request.GET:
+            user, error = await authenticate_ticket(request.GET['ticket'], kwargs['pk'])
+        else:
+            user, error = await authenticate(request)
+        if user is None:
+            return json_response(
+                {'detail': error},
+                status.HTTP_401_UNAUTHORIZED,
+                headers={'WWW-Authenticate': 'Token'}
+            )
+        request.user = user
+
+        try:
+            return await view(request, *args, **kwargs)
+        except APIException as exc:
+            data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+            return json_response(data, exc.status_code)
+
+    return wrapper
+
+
+async def check_board_access(request, board_id):
+    """Raise PermissionDenied unless the user owns or is a member of the board."""
+    if board_id not in await aget_board_ids(request):
+        raise PermissionDenied("You are not a member of this board.")
+
+
+@async_api_view
+async def boards_list(request):
+    """GET /api/async/boards/ - async counterpart of BoardsView."""
+    boards = Board.objects.for_user(request.user).select_related('stats')
+    return json_response(BoardSerializer([board async for board in boards], many=True).data)
+
+
+@async_api_view
+async def board_detail(request, pk):
+    """GET /api/async/boards/<pk>/ - async counterpart of BoardDetail."""
+    board = await Board.objects.filter(pk=pk).afirst()
+    if board is None:
+        raise NotFound(f'Board with ID {pk} not found.')
+    await check_board_access(request, pk)
+
+    etag = make_etag('board', pk, board.version)
+    if is_not_modified(request, etag):
+        return json_response(None, status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+    tasks = Task.objects.select_related('assignee', 'reviewer').with_comments_count()
+    await aprefetch_related_objects([board], 'members', Prefetch('tasks', queryset=tasks))
+    return json_response(BoardDetailSerializer(board).data, headers={'ETag': etag})
+
+
+async def list_tasks(request, tasks):
+    """Respond with the filtered and ordered tasks like the assigned/reviewing list views."""
+    tasks = TaskOrdering().filter_queryset(Request(request), filter_tasks(tasks, request.GET), None)
+    rows = tasks.with_comments_count().values(*TaskAssignedOrReviewingValuesSerializer.values)
+    return json_response(TaskAssignedOrReviewingValuesSerializer([row async for row in rows]).data)
+
+
+@async_api_view
+async def tasks_assigned_to_me(request):
+    """GET /api/async/tasks/assigned-to-me/ - async counterpart of TasksAssignedToMeView."""
+    return await list_tasks(request, Task.objects.filter(assignee=request.user))
+
+
+@async_api_view
+async def tasks_reviewing(request):
+    """GET /api/async/tasks/reviewing/ - async counterpart of TasksReviewingView."""
+    return await list_tasks(request, Task.objects.filter(reviewer=request.user))
+
+
+@async_api_view
+async def comments_list(request, pk):
+    """GET /api/async/tasks/<pk>/comments/ - async counterpart of CommentsView."""
+    row = await (
+        Task.objects.filter(pk=pk)
+        .with_is_member(request.user)
+        .values_list('board__version', 'is_member')
+        .afirst()
+    )
+    if row is None:
+        raise NotFound(f"Task mit ID {pk} existiert nicht.")
+    version, is_member = row
+    if not is_member:
+        raise PermissionDenied("You are not a member of this board.")
+
+    etag = make_etag('comments', pk, version)
+    if is_not_modified(request, etag):
+        return json_response(None, status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+    rows = Comment.objects.filter(task_id=pk).values(*CommentValuesSerializer.values)
+    data = await sync_to_async(paginate)(CommentCursorPagination(), rows, request, CommentValuesSerializer)
+    return json_response(data, headers={'ETag': etag})
+
+
+def paginate(paginator, rows, request, serializer_class):
+    """
+    Return the paginated response data of `rows` like a DRF list view.
+
+    DRF's paginators evaluate the queryset synchronously, so this runs in a
+    worker thread (sync_to_async).
+    """
+
+    page = paginator.paginate_queryset(rows, Request(request))
+    return paginator.get_paginated_response(serializer_class(page).data).data
+
+
+def format_event(event_type, data):
+    """Frame one Server-Sent Event."""
+    return f'event: {event_type}\ndata: {json.dumps(data, separators=(",", ":"))}\n\n'
+
+
+@async_api_view(tickets=True)
+async def board_events(request, pk):
+    """
+    GET /api/async/boards/<pk>/events/ - stream the change events of a board.
+
+    Authenticates with the Authorization header or, for EventSource, with
+    `?ticket=` from POST /api/boards/<pk>/events/ticket/.
+
+    The response is a text/event-stream. Every event carries its type as the
+    SSE event name and the event dict as JSON data. Idle streams receive a
+    keepalive comment every KANMIND_EVENTS_KEEPALIVE seconds. The stream ends
+    with a `resync` event if the client fell behind (re-fetch BoardDetail and
+    reconnect), and without one if the board is deleted or the user loses
+    access to it.
+    """
+
+    if not await Board.objects.filter(pk=pk).aexists():
+        raise NotFound(f'Board with ID {pk} not found.')
+    await check_board_access(request, pk)
+
+    user = request.user
+    keepalive = getattr(settings, 'KANMIND_EVENTS_KEEPALIVE', 15)
+    hub = get_hub()
+    subscription = hub.subscribe(pk)
+
+    async def stream():
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), keepalive)
+                except asyncio.TimeoutError:
+                    yield ': keepalive\n\n'
+                    continue
+                if event is OVERFLOW:
+                    yield format_event('resync', {'board': pk})
+                    return
+                yield format_event(event['type'], event)
+                if event['type'] == 'board.deleted':
+                    return
+                if event['type'].startswith('members.') and pk not in await aload_board_ids(user):
+                    return
+        finally:
+            hub.unsubscribe(subscription)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
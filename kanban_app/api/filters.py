@@ -0,0 +1,101 @@
+"""
+Filter backends for the task list endpoints of the Kanmind API.
+
+Query parameters (all optional, combined with AND):
+    status: One or more statuses, repeated or comma-separated (`status=to_do,review`).
+    priority: One or more priorities, repeated or comma-separated.
+    board: ID of a board.
+    assignee, reviewer: ID of a user.
+    due_from, due_to: Inclusive due date range (YYYY-MM-DD).
+    ordering: `due_date`, `title` or `id`, prefixed with `-` for descending
+        order; several fields are comma-separated. Other fields are ignored.
+
+The filters become plain column predicates in the list query, which the
+(board, status), (board, priority), (board, due_date), (assignee, due_date)
+and (reviewer, due_date) indexes of Task serve. Invalid values are rejected
+with 400 instead of being ignored, so a typo never returns unfiltered data.
+"""
+
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+from kanban_app.models import Task
+
+
+TASK_ORDERING_FIELDS = ('due_date', 'title', 'id')
+
+
+class MultipleChoiceParamField(serializers.MultipleChoiceField):
+    """MultipleChoiceField that also accepts comma-separated values in one parameter."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = [data]
+        values = [value.strip() for item in data for value in str(item).split(',') if value.strip()]
+        return super().to_internal_value(values)
+
+
+class TaskFilterSerializer(serializers.Serializer):
+    """Validates the filter query parameters of the task lists."""
+
+    status = MultipleChoiceParamField(choices=Task.STATUS_CHOICES, required=False)
+    priority = MultipleChoiceParamField(choices=Task.PRIORITY_CHOICES, required=False)
+    board = serializers.IntegerField(min_value=1, required=False)
+    assignee = serializers.IntegerField(min_value=1, required=False)
+    reviewer = serializers.IntegerField(min_value=1, required=False)
+    due_from = serializers.DateField(required=False)
+    due_to = serializers.DateField(required=False)
+
+    def validate(self, data):
+        if 'due_from' in data and 'due_to' in data and data['due_from'] > data['due_to']:
+            raise serializers.ValidationError({'due_to': 'Must not be before due_from.'})
+        return data
+
+
+def filter_tasks(queryset, params):
+    """
+    Apply the filter query parameters in `params` to a Task queryset.
+
+    Raises:
+        ValidationError: If a parameter has an invalid value.
+    """
+
+    serializer = TaskFilterSerializer(data=params)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+    lookups = {}
+    if data.get('status'):
+        lookups['status__in'] = sorted(data['status'])
+    if data.get('priority'):
+        lookups['priority__in'] = sorted(data['priority'])
+    for name in ('board', 'assignee', 'reviewer'):
+        if name in data:
+            lookups[f'{name}_id'] = data[name]
+    if 'due_from' in data:
+        lookups['due_date__gte'] = data['due_from']
+    if 'due_to' in data:
+        lookups['due_date__lte'] = data['due_to']
+    return queryset.filter(**lookups) if lookups else queryset
+
+
+class TaskFilter(BaseFilterBackend):
+    """Filters task lists by status, priority, board, assignee, reviewer and due date."""
+
+    def filter_queryset(self, request, queryset, view):
+        return filter_tasks(queryset, request.query_params)
+
+
+class TaskOrdering(OrderingFilter):
+    """
+    Orders task lists by the whitelisted TASK_ORDERING_FIELDS.
+
+    The task ID is appended as a tie-breaker, so pages and unpaginated lists
+    have a stable order. Cursor pagination picks the ordering up as well.
+    """
+
+    ordering_fields = TASK_ORDERING_FIELDS
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if ordering and not {'id', '-id'} & set(ordering):
+            ordering = [*ordering, 'id']
+        return ordering
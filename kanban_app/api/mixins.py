@@ -0,0 +1,173 @@
+"""
+View mixins for the Kanmind API.
+
+- BoardVersionETagMixin: Conditional GET support based on Board.version.
+- ResponseCacheMixin: Per-user caching of read responses keyed by board versions.
+- ReplicaReadMixin: Reads of safe requests from a read replica (see core.routers).
+- ValuesListMixin: list() served from `.values()` rows by a lean read serializer.
+
+The helpers make_etag() and is_not_modified() are shared with the async views.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+from core import routers
+from kanban_app import response_cache
+from kanban_app.membership import is_board_member
+
+
+def make_etag(prefix, pk, version):
+    """Return the quoted ETag of resource `pk` derived from its board's `version`."""
+    return quote_etag(f'{prefix}-{pk}-v{version}')
+
+
+def is_not_modified(request, etag):
+    """Return True if the request's If-None-Match header matches `etag`."""
+    if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+    return etag in if_none_match or '*' in if_none_match
+
+
+class BoardVersionETagMixin:
+    """
+    Adds an ETag derived from the version of the related board to GET responses.
+
+    Board.version changes whenever the board, its members, its tasks or their
+    comments change, so it identifies every representation that is derived
+    from the board. If the request's If-None-Match matches, a 304 response
+    is returned before the view loads or serializes anything.
+
+    Renaming a user does not change Board.version, so a 304 may confirm a
+    representation that still embeds the user's previous name or email until
+    the board changes otherwise.
+
+    Subclasses set `etag_prefix` and must implement get_board_version(),
+    which returns (board_id, version) of the board the requested resource
+    belongs to and raises NotFound if the resource does not exist. They may
+    override check_board_access(), e.g. to reuse a membership flag loaded by
+    get_board_version().
+    """
+
+    etag_prefix = None
+
+    def get_etag(self, version):
+        return make_etag(self.etag_prefix, self.kwargs['pk'], version)
+
+    def check_board_access(self, board_id):
+        """Raise PermissionDenied unless the user owns or is a member of the board."""
+        if not is_board_member(self.request, board_id):
+            raise PermissionDenied("You are not a member of this board.")
+
+    def get(self, request, *args, **kwargs):
+        if not hasattr(self, 'get_board_version'):
+            raise ImproperlyConfigured(
+                f'{type(self).__name__} uses BoardVersionETagMixin but does not implement get_board_version().'
+            )
+        board_id, version = self.get_board_version()
+        self.check_board_access(board_id)
+
+        etag = self.get_etag(version)
+        if is_not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response['ETag'] = etag
+        return response
+
+
+class ResponseCacheMixin:
+    """
+    Serves the data of list() and retrieve() from the per-user response cache.
+
+    The cache key contains the versions of the boards returned by
+    get_cache_versions(), so any write to one of them causes a miss (see
+    kanban_app.response_cache). Permission checks that run before list() or
+    retrieve() (e.g. in BoardVersionETagMixin.get()) still run on every hit.
+    Responses carry an `X-Cache: HIT` or `X-Cache: MISS` header.
+
+    User names and emails embedded in the responses are not versioned by a
+    board: after a user is renamed, cached responses may show the previous
+    values for up to the configured TIMEOUT.
+
+    Subclasses must implement get_cache_versions(), which returns the
+    (board_id, version) pairs the response is derived from, and may shorten
+    the lifetime of their entries with get_cache_timeout().
+    """
+
+    def get_cache_timeout(self):
+        """Return the seconds an entry is kept (None: the configured TIMEOUT, 0: not cached)."""
+        return None
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        if not hasattr(self, 'get_cache_versions'):
+            raise ImproperlyConfigured(
+                f'{type(self).__name__} uses ResponseCacheMixin but does not implement get_cache_versions().'
+            )
+        timeout = self.get_cache_timeout()
+        if not response_cache.is_enabled() or timeout == 0:
+            return handler(request, *args, **kwargs)
+
+        key = response_cache.make_key(
+            type(self).__name__,
+            request.user,
+            request.get_full_path(),
+            self.get_cache_versions()
+        )
+        data = response_cache.load(key)
+        if data is not None:
+            return Response(data, headers={'X-Cache': 'HIT'})
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response_cache.store(key, response.data, timeout)
+        response['X-Cache'] = 'MISS'
+        return response
+
+
+class ReplicaReadMixin:
+    """
+    Lets GET and HEAD requests of the view read from a replica.
+
+    Replica reads are allowed once authentication, permission and throttle
+    checks have passed, unless the user wrote recently and is pinned to the
+    primary. Only views whose responses may lag slightly behind writes by
+    other users should use this mixin.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS:
+            routers.allow_replica_reads(request.user)
+
+
+class ValuesListMixin:
+    """
+    Serves list() with a `.values()` based serializer instead of the ModelSerializer.
+
+    The queryset of get_queryset() is filtered and paginated as usual, but
+    yields dicts with the columns the serializer needs, so no model
+    instances are created. The response data is identical to the one of
+    get_serializer_class() (see kanban_app.api.values_serializers).
+
+    Subclasses set `values_serializer_class`.
+    """
+
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.values_serializer_class
+        rows = self.filter_queryset(self.get_queryset()).values(*serializer_class.values)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer_class(page).data)
+        return Response(serializer_class(rows).data)
@@ -0,0 +1,122 @@
+"""
+Pagination classes for the Kanmind API.
+
+Cursor (keyset) pagination is used for potentially long lists: each page is
+fetched with a `WHERE <ordering field> > <last value> ... LIMIT n` query, so
+its cost does not depend on the size of the table or on how far the client
+has already scrolled.
+
+Search results are ranked by relevance rather than by a column, so they are
+paginated by page number instead (SearchPagination).
+"""
+
+from collections import OrderedDict
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Keyset pagination for task lists, ordered by task ID.
+
+    Query parameters:
+        cursor: Opaque cursor returned as `next`/`previous` by the previous page.
+        page_size: Number of tasks per page (default 50, at most 200).
+    """
+
+    ordering = 'id'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class TaskInboxCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the task inbox, earliest due date first.
+
+    Tasks due on the same day are ordered by ID; `ordering=-due_date` (see
+    filters.TaskOrdering) reverses the order.
+
+    Query parameters:
+        cursor: Opaque cursor returned as `next`/`previous` by the previous page.
+        page_size: Number of tasks per page (default 50, at most 200).
+    """
+
+    ordering = ('due_date', 'id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class CommentCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the comments of a task, oldest first.
+
+    Pages are read through the (task, created_at) index; comments created at
+    the same moment are ordered by ID.
+
+    Query parameters:
+        cursor: Opaque cursor returned as `next`/`previous` by the previous page.
+        page_size: Number of comments per page (default 50, at most 200).
+    """
+
+    ordering = ('created_at', 'id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class SearchPagination(BasePagination):
+    """
+    Page number pagination for search results, without a total count.
+
+    One row more than the page size is fetched to find out whether a next
+    page exists, so every page costs a single query.
+
+    Query parameters:
+        page: Page number, starting at 1.
+        page_size: Number of results per page (default 20, at most 100).
+    """
+
+    page_query_param = 'page'
+    page_size_query_param = 'page_size'
+    page_size = 20
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return the requested page of `queryset`, which only has to support slicing."""
+        try:
+            self.page = _positive_int(request.query_params.get(self.page_query_param, 1), strict=True)
+        except ValueError:
+            raise NotFound('Invalid page.')
+        try:
+            size = _positive_int(request.query_params[self.page_size_query_param], strict=True, cutoff=self.max_page_size)
+        except (KeyError, ValueError):
+            size = self.page_size
+        self.request = request
+        offset = (self.page - 1) * size
+        rows = list(queryset[offset:offset + size + 1])
+        self.has_next = len(rows) > size
+        return rows[:size]
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.page_query_param, self.page + 1)
+
+    def get_previous_link(self):
+        if self.page == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page - 1)
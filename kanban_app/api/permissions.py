@@ -8,33 +8,32 @@ These permissions provide object-level access control for boards, tasks, and com
 """
 
 from rest_framework.permissions import BasePermission
+from kanban_app.membership import is_board_member
 
 
 class IsBoardOwnerOrMember(BasePermission):
     """
     Allows access only to users who are the owner or a member of the related board.
 
-    This permission handles different object types by resolving ownership through:
-    - obj.owner (Board)
-    - obj.members (Board)
-    - obj.board.owner (Task)
-    - obj.board.members (Task)
-    - obj.task.board.owner (Comment)
-    - obj.task.board.members (Comment)
+    This permission handles different object types by resolving the board ID through:
+    - obj.pk (Board)
+    - obj.board_id (Task)
+    - obj.task.board_id (Comment)
+
+    Membership is checked against the user's accessible board IDs, which are
+    loaded once per request by kanban_app.membership.
     """
 
     def has_object_permission(self, request, view, obj):
-        if hasattr(obj, 'owner'):
-            return obj.owner == request.user
-        elif hasattr(obj, 'members'):
-            return obj.members.filter(id=request.user.id).exists()
-        elif hasattr(obj, 'board'):
-            if obj.board.owner == request.user or obj.board.members.filter(id=request.user.id).exists():
-                return True
-        elif hasattr(obj, 'task'):
-            if obj.task.board.owner == request.user or obj.task.board.members.filter(id=request.user.id).exists():
-                return True
-        return False
+        if hasattr(obj, 'owner_id'):
+            board_id = obj.pk
+        elif hasattr(obj, 'board_id'):
+            board_id = obj.board_id
+        elif hasattr(obj, 'task_id'):
+            board_id = obj.task.board_id
+        else:
+            return False
+        return is_board_member(request, board_id)
     
     
 class IsBoardOwner(BasePermission):
@@ -7,8 +7,61 @@ extended variants exposing aggregated board/task statistics.
 """
 
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
-from kanban_app.models import Board, Task, Comment
+from kanban_app.events import publish_on_commit
+from kanban_app.models import Board, BoardStats, Task, Comment
+
+
+def get_comments_count(task):
+    """
+    Return the number of comments of a task.
+
+    Uses the `comments_count` annotation from Task.objects.with_comments_count()
+    when present and only falls back to a COUNT query otherwise.
+    """
+    
+    count = getattr(task, 'comments_count', None)
+    if count is None:
+        count = task.comments.count()
+    return count
+
+
+class PrimaryKeyListField(serializers.ManyRelatedField):
+    """
+    List of primary keys that is resolved with a single query.
+
+    DRF's PrimaryKeyRelatedField(many=True) runs one query per submitted ID.
+    This field validates the IDs with the child relation's primary key field
+    and loads all objects with one `pk__in` query, reporting missing IDs with
+    DRF's usual "does not exist" message.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        child = self.child_relation
+        queryset = child.get_queryset()
+        pk_field = queryset.model._meta.pk
+        pks = []
+        for item in data:
+            try:
+                if isinstance(item, bool):
+                    raise TypeError
+                pks.append(pk_field.to_python(item))
+            except (TypeError, ValueError, DjangoValidationError):
+                child.fail('incorrect_type', data_type=type(item).__name__)
+
+        objects = queryset.in_bulk(pks)
+        for pk in pks:
+            if pk not in objects:
+                child.fail('does_not_exist', pk_value=pk)
+        return [objects[pk] for pk in dict.fromkeys(pks)]
 
 
 class UserMiniSerializer(serializers.ModelSerializer):
@@ -62,7 +115,7 @@ class TaskSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
     
     def get_comments_count(self, obj):
-        return obj.comments.count()
+        return get_comments_count(obj)
 
 
 class TaskDetailSerializer(TaskSerializer):
@@ -92,22 +145,20 @@ class BoardSerializer(serializers.ModelSerializer):
     Serializer for board creation and list views.
 
     Accepts member IDs on write; exposes aggregated statistics on read.
+    The statistics are read from the denormalized BoardStats record, which
+    should be joined with select_related('stats').
     """
         
-    members = serializers.PrimaryKeyRelatedField(
-        queryset=User.objects.all(),
-        many=True,
+    members = PrimaryKeyListField(
+        child_relation=serializers.PrimaryKeyRelatedField(queryset=User.objects.all()),
         required=False,
         write_only=True
     )
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
-    owner_id = serializers.IntegerField(
-        source='owner.id',
-        read_only=True
-    )
+    member_count = serializers.IntegerField(source='stats.member_count', read_only=True)
+    ticket_count = serializers.IntegerField(source='stats.task_count', read_only=True)
+    tasks_to_do_count = serializers.IntegerField(source='stats.to_do_count', read_only=True)
+    tasks_high_prio_count = serializers.IntegerField(source='stats.high_prio_count', read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Board
@@ -123,24 +174,12 @@ class BoardSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id']
 
-    def get_member_count(self, obj):
-        return obj.members.count()
-
-    def get_ticket_count(self, obj):
-        return obj.tasks.count()
-    
-    def get_tasks_to_do_count(self, obj):
-        return obj.tasks.filter(status='to_do').count()
-    
-    def get_tasks_high_prio_count(self, obj):
-        return obj.tasks.filter(priority='high').count()
-    
     def create(self, validated_data):
         members = validated_data.pop('members', [])
         owner = self.context['request'].user
         board = Board.objects.create(owner=owner, **validated_data)
         board.members.set(members)
-        return board
+        return Board.objects.select_related('stats').get(pk=board.pk)
 
 
 class BoardDetailSerializer(serializers.ModelSerializer):
@@ -150,10 +189,7 @@ class BoardDetailSerializer(serializers.ModelSerializer):
     Includes owner ID, member list, and embedded tasks.
     """
         
-    owner_id = serializers.IntegerField(
-        source='owner.id',
-        read_only=True
-    )
+    owner_id = serializers.IntegerField(read_only=True)
     members = serializers.SerializerMethodField()
     tasks = TaskSerializer(
         many=True,
@@ -188,9 +224,8 @@ class BoardUpdateSerializer(serializers.ModelSerializer):
     Accepts member IDs on write and exposes read-only nested user details.
     """
         
-    members = serializers.PrimaryKeyRelatedField(
-        queryset=Board.members.field.related_model.objects.all(),
-        many=True,
+    members = PrimaryKeyListField(
+        child_relation=serializers.PrimaryKeyRelatedField(queryset=Board.members.field.related_model.objects.all()),
         write_only=True
     )
     owner_data = UserMiniSerializer(
@@ -263,7 +298,13 @@ class TaskCreateUpdateSerializer(serializers.ModelSerializer):
         ]
 
     def get_comments_count(self, obj):
-        return obj.comments.count()
+        return get_comments_count(obj)
+
+    def validate_board(self, value):
+        """Reject moving an existing task to another board."""
+        if self.instance is not None and value != self.instance.board_id:
+            raise serializers.ValidationError('Tasks cannot be moved to another board.')
+        return value
     
     def create(self, validated_data):
         assignee = validated_data.pop('assignee_id', None)
@@ -278,6 +319,9 @@ class TaskCreateUpdateSerializer(serializers.ModelSerializer):
         return task
     
     def update(self, instance, validated_data):
+        # validate_board() only lets the task's own board through; it is already set.
+        validated_data.pop('board', None)
+
         if 'assignee_id' in validated_data:
             instance.assignee = validated_data.pop('assignee_id')
 
@@ -312,7 +356,7 @@ class TaskAssignedOrReviewingSerializer(serializers.ModelSerializer):
         ]
     
     def get_comments_count(self, obj):
-        return obj.comments.count()
+        return get_comments_count(obj)
     
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -338,6 +382,17 @@ class CommentSerializer(serializers.ModelSerializer):
         return obj.author.get_full_name() if obj.author else None
 
 
+class CommentSyncSerializer(CommentSerializer):
+    """
+    Read-only serializer for comments in delta sync responses.
+
+    Adds the task ID, since the comments of a whole board are returned together.
+    """
+
+    class Meta(CommentSerializer.Meta):
+        fields = CommentSerializer.Meta.fields + ['task']
+
+
 class CommentCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating or updating comments.
@@ -361,6 +416,164 @@ class CommentCreateUpdateSerializer(serializers.ModelSerializer):
         return obj.author.get_full_name()
 
 
+class TaskBatchItemSerializer(serializers.ModelSerializer):
+    """
+    Validates a single task of a batch request.
+
+    User references are plain IDs here; their existence is checked for the
+    whole batch at once by TaskBatchSerializer.
+    """
+
+    id = serializers.IntegerField(required=False)
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = Task
+        fields = [
+            'id',
+            'title',
+            'description',
+            'status',
+            'priority',
+            'assignee_id',
+            'reviewer_id',
+            'due_date'
+        ]
+        extra_kwargs = {
+            'status': {'required': True},
+            'priority': {'required': True},
+            'due_date': {'required': True}
+        }
+
+
+class TaskBatchSerializer(serializers.Serializer):
+    """
+    Validates and applies a batch of task creates, partial updates and deletes for one board.
+
+    Expects `board_id` in the serializer context. All items are validated
+    together with a fixed number of queries; errors are reported per item in
+    lists aligned with the input. The changes are applied with bulk_create,
+    bulk_update and a single DELETE inside one transaction; since these bypass
+    Task.save(), the board statistics and version are refreshed explicitly.
+
+    Fields:
+        create (list[dict]): Tasks to create.
+        update (list[dict]): Partial updates; each item requires the task `id`.
+        delete (list[int]): IDs of tasks to delete.
+    """
+
+    MAX_ITEMS = 500
+
+    def get_fields(self):
+        # Declared here because class attributes named create/update would shadow the serializer methods.
+        return {
+            'create': serializers.ListField(child=serializers.DictField(), required=False, default=list, max_length=self.MAX_ITEMS),
+            'update': serializers.ListField(child=serializers.DictField(), required=False, default=list, max_length=self.MAX_ITEMS),
+            'delete': serializers.ListField(child=serializers.IntegerField(), required=False, default=list, max_length=self.MAX_ITEMS)
+        }
+
+    def validate(self, data):
+        board_id = self.context['board_id']
+        creates = TaskBatchItemSerializer(data=data['create'], many=True)
+        updates = TaskBatchItemSerializer(data=data['update'], many=True, partial=True)
+        errors = {
+            'create': self.validate_items(creates, data['create']),
+            'update': self.validate_items(updates, data['update']),
+            'delete': [{} for _ in data['delete']]
+        }
+        created = creates.validated_data if creates.is_valid() else []
+        updated = updates.validated_data if updates.is_valid() else []
+
+        for index, item in enumerate(updated):
+            if 'id' not in item:
+                errors['update'][index]['id'] = ['This field is required for updates.']
+        update_ids = [item['id'] for item in updated if 'id' in item]
+        referenced_ids = [*update_ids, *data['delete']]
+        tasks = Task.objects.filter(board_id=board_id, pk__in=referenced_ids).in_bulk()
+        user_ids = {
+            item[field] for item in [*created, *updated]
+            for field in ('assignee_id', 'reviewer_id') if item.get(field) is not None
+        }
+        existing_users = set(User.objects.filter(pk__in=user_ids).values_list('pk', flat=True))
+
+        for kind, items in (('create', created), ('update', updated)):
+            for index, item in enumerate(items):
+                for field in ('assignee_id', 'reviewer_id'):
+                    if item.get(field) is not None and item[field] not in existing_users:
+                        errors[kind][index][field] = [f'User with ID {item[field]} does not exist.']
+        for kind, ids in (('update', [item.get('id') for item in updated]), ('delete', data['delete'])):
+            for index, task_id in enumerate(ids):
+                if task_id is None:
+                    continue
+                if task_id not in tasks:
+                    errors[kind][index]['id'] = [f'Task with ID {task_id} not found on this board.']
+                elif referenced_ids.count(task_id) > 1:
+                    errors[kind][index]['id'] = ['Each task may only appear once per batch.']
+
+        if any(error for kind_errors in errors.values() for error in kind_errors):
+            raise serializers.ValidationError(errors)
+
+        return {
+            'create': created,
+            'update': [(tasks[item['id']], item) for item in updated],
+            'delete': data['delete']
+        }
+
+    def validate_items(self, serializer, items):
+        """
+        Validate a list serializer and return one (possibly empty) error dict per input item.
+
+        Depending on the DRF version, ListSerializer.errors is a list aligned
+        with the input or a dict keyed by the index of the invalid items.
+        """
+        if serializer.is_valid():
+            return [{} for _ in items]
+        errors = serializer.errors
+        if isinstance(errors, dict):
+            return [dict(errors.get(index, {})) for index in range(len(items))]
+        return [dict(error) for error in errors]
+
+    def create(self, validated_data):
+        board_id = self.context['board_id']
+        with transaction.atomic():
+            for item in validated_data['create']:
+                item.pop('id', None)
+            created = Task.objects.bulk_create(
+                [Task(board_id=board_id, **item) for item in validated_data['create']]
+            )
+
+            changed_fields = set()
+            for task, item in validated_data['update']:
+                item = {field: value for field, value in item.items() if field != 'id'}
+                for field, value in item.items():
+                    setattr(task, field, value)
+                changed_fields.update(item)
+            updated = [task for task, _ in validated_data['update']]
+            if updated and changed_fields:
+                now = timezone.now()
+                for task in updated:
+                    task.updated_at = now
+                Task.objects.bulk_update(updated, sorted(changed_fields | {'updated_at'}))
+
+            Task.objects.filter(board_id=board_id, pk__in=validated_data['delete']).delete()
+            BoardStats.rebuild([board_id])
+            Board.objects.filter(pk=board_id).bump_version()
+            publish_on_commit({
+                'type': 'tasks.batch',
+                'board': board_id,
+                'created': [task.pk for task in created],
+                'updated': [task.pk for task in updated],
+                'deleted': list(validated_data['delete'])
+            })
+
+        return {
+            'create': [{'id': task.pk, 'result': 'created'} for task in created],
+            'update': [{'id': task.pk, 'result': 'updated'} for task in updated],
+            'delete': [{'id': task_id, 'result': 'deleted'} for task_id in validated_data['delete']]
+        }
+
+
 class EmailCheckSerializer(serializers.Serializer):
     """
     Serializer for validating a single email address in public endpoints.
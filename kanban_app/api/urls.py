@@ -2,15 +2,19 @@
 URL routes for the Kanmind API.
 
 This module maps HTTP endpoints to their corresponding view classes.  
-It organizes routes for boards, tasks, user-specific task filters, and task comments.
+It organizes routes for boards, tasks, user-specific task filters, task comments, search and the dashboard.
 """
 
 from django.urls import path
-from .views import BoardsView, BoardDetail, EmailCheckView, TasksView, TaskDetail, TasksAssignedToMeView, TasksReviewingView, CommentsView, CommentDetail
+from .views import BoardsView, BoardDetail, EmailCheckView, TasksView, TaskDetail, TaskBatchView, BoardChangesView, BoardExportView, EventTicketView, TasksAssignedToMeView, TasksReviewingView, TasksInboxView, CommentsView, CommentDetail, SearchView, DashboardView
 
 urlpatterns = [
     path('boards/', BoardsView.as_view(), name='boards-list'),
     path('boards/<int:pk>/', BoardDetail.as_view(), name='board-detail'),
+    path('boards/<int:pk>/tasks/batch/', TaskBatchView.as_view(), name='board-tasks-batch'),
+    path('boards/<int:pk>/changes/', BoardChangesView.as_view(), name='board-changes'),
+    path('boards/<int:pk>/export/', BoardExportView.as_view(), name='board-export'),
+    path('boards/<int:pk>/events/ticket/', EventTicketView.as_view(), name='board-events-ticket'),
 
     path('email-check/', EmailCheckView.as_view(), name='email-check'),
 
@@ -19,8 +23,12 @@ urlpatterns = [
 
     path('tasks/assigned-to-me/', TasksAssignedToMeView.as_view(), name='tasks-assigned-to-me'),
     path('tasks/reviewing/', TasksReviewingView.as_view(), name='tasks-reviewing'),
+    path('tasks/inbox/', TasksInboxView.as_view(), name='tasks-inbox'),
 
     path('tasks/<int:pk>/comments/', CommentsView.as_view(), name='comments-list'),
-    path('tasks/<int:task_pk>/comments/<int:pk>/', CommentDetail.as_view(), name='comment-detail')
+    path('tasks/<int:task_pk>/comments/<int:pk>/', CommentDetail.as_view(), name='comment-detail'),
+
+    path('search/', SearchView.as_view(), name='search'),
+    path('dashboard/', DashboardView.as_view(), name='dashboard')
 ]
 
@@ -0,0 +1,151 @@
+"""
+Lean read serializers for the hot list endpoints of the Kanmind API.
+
+The serializers in this module produce exactly the output of TaskSerializer,
+TaskAssignedOrReviewingSerializer, CommentSerializer and UserMiniSerializer,
+but from `.values()` rows: no model instances and no DRF serializer or field
+objects are created per row, and every user's dict (including the full name)
+is built once per response and shared by all rows referencing the user.
+
+Usage:
+    rows = queryset.values(*TaskValuesSerializer.values)
+    data = TaskValuesSerializer(rows).data
+
+The queryset must provide the columns listed in `values`, e.g. the
+`comments_count` annotation of Task.objects.with_comments_count(). The
+rendered JSON is byte-identical to the one of the ModelSerializer (see
+ValuesSerializerTests and the bench_serializers command).
+"""
+
+from rest_framework import serializers
+
+
+DATE_FIELD = serializers.DateField()
+DATETIME_FIELD = serializers.DateTimeField()
+
+
+def user_columns(prefix=''):
+    """Return the columns UserMiniSerializer needs, for the user model or the relation `prefix`."""
+    path = f'{prefix}__' if prefix else ''
+    return (f'{path}id', f'{path}email', f'{path}first_name', f'{path}last_name')
+
+
+class ValuesSerializer:
+    """
+    Base class of the `.values()` based read serializers.
+
+    The base class only iterates the rows and shares the user dicts between
+    them (get_user()); it does not render a row itself. Every subclass
+    provides:
+
+    - `values`: the columns to pass to QuerySet.values(),
+    - `to_representation(row)`: the output dict of one row, with the keys
+      and value formats of the ModelSerializer it replaces.
+
+    Args:
+        rows: Iterable of dicts as returned by QuerySet.values(*values).
+    """
+
+    values = ()
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.users = {}
+
+    @property
+    def data(self):
+        return [self.to_representation(row) for row in self.rows]
+
+    def get_user(self, row, columns):
+        """Return the UserMiniSerializer dict of the user in `columns` of `row`, or None."""
+        id_column, email_column, first_name_column, last_name_column = columns
+        user_id = row[id_column]
+        if user_id is None:
+            return None
+        user = self.users.get(user_id)
+        if user is None:
+            user = self.users[user_id] = {
+                'id': user_id,
+                'email': row[email_column],
+                'fullname': f'{row[first_name_column]} {row[last_name_column]}'.strip()
+            }
+        return user
+
+
+class UserMiniValuesSerializer(ValuesSerializer):
+    """Output of UserMiniSerializer from User rows."""
+
+    values = user_columns()
+
+    def to_representation(self, row):
+        return self.get_user(row, self.values)
+
+
+class TaskValuesSerializer(ValuesSerializer):
+    """Output of TaskSerializer from Task rows annotated with `comments_count`."""
+
+    ASSIGNEE = user_columns('assignee')
+    REVIEWER = user_columns('reviewer')
+
+    values = ('id', 'title', 'description', 'status', 'priority', *ASSIGNEE, *REVIEWER, 'due_date', 'comments_count')
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'title': row['title'],
+            'description': row['description'],
+            'status': row['status'],
+            'priority': row['priority'],
+            'assignee': self.get_user(row, self.ASSIGNEE),
+            'reviewer': self.get_user(row, self.REVIEWER),
+            'due_date': DATE_FIELD.to_representation(row['due_date']),
+            'comments_count': row['comments_count']
+        }
+
+
+class TaskAssignedOrReviewingValuesSerializer(TaskValuesSerializer):
+    """Output of TaskAssignedOrReviewingSerializer from Task rows annotated with `comments_count`."""
+
+    values = ('board', *TaskValuesSerializer.values)
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'board': row['board'],
+            'title': row['title'],
+            'description': row['description'],
+            'status': row['status'],
+            'priority': row['priority'],
+            'assignee': self.get_user(row, self.ASSIGNEE),
+            'reviewer': self.get_user(row, self.REVIEWER),
+            'due_date': DATE_FIELD.to_representation(row['due_date']),
+            'comments_count': row['comments_count']
+        }
+
+
+class TaskInboxValuesSerializer(TaskAssignedOrReviewingValuesSerializer):
+    """Output of the inbox from Task rows annotated with `comments_count` and `role`."""
+
+    values = (*TaskAssignedOrReviewingValuesSerializer.values, 'role')
+
+    def to_representation(self, row):
+        data = super().to_representation(row)
+        data['role'] = row['role']
+        return data
+
+
+class CommentValuesSerializer(ValuesSerializer):
+    """Output of CommentSerializer from Comment rows."""
+
+    AUTHOR = user_columns('author')
+
+    values = ('id', 'created_at', 'content', *AUTHOR)
+
+    def to_representation(self, row):
+        author = self.get_user(row, self.AUTHOR)
+        return {
+            'id': row['id'],
+            'created_at': DATETIME_FIELD.to_representation(row['created_at']),
+            'author': author['fullname'] if author else None,
+            'content': row['content']
+        }
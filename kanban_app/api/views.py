@@ -10,57 +10,159 @@ Views included:
 - EmailCheckView: Check if a user exists by email.
 - TasksView: List all tasks or create a new task.
 - TaskDetail: Retrieve, update, or delete a specific task.
+- TaskBatchView: Create, update and delete many tasks of one board in a single request.
+- BoardChangesView: Return the changes of a board since a sync cursor.
+- BoardExportView: Stream a board with its members, tasks and comments as NDJSON.
+- EventTicketView: Issue a short-lived ticket for the event stream of a board.
 - TasksAssignedToMeView: List tasks assigned to the current user.
 - TasksReviewingView: List tasks where the current user is the reviewer.
+- TasksInboxView: List tasks where the current user is the assignee or the reviewer, with the role.
 - CommentsView: List or create comments for a task.
 - CommentDetail: Retrieve or delete a specific comment.
+- SearchView: Full-text search over the tasks and comments of the user's boards.
+- DashboardView: Task totals of the current user for the home screen.
+
+GET requests of BoardsView, BoardDetail, TasksView, the assigned/reviewing
+lists, the inbox, CommentsView, SearchView and DashboardView may be served from a read replica (ReplicaReadMixin).
+BoardsView, BoardDetail, the assigned/reviewing lists and DashboardView cache
+their responses per user, keyed by board versions (ResponseCacheMixin). Renaming
+a user does not change a board version, so the user's previous name or email
+may be served from these caches for up to KANMIND_RESPONSE_CACHE['TIMEOUT'].
+The task lists accept the filter and ordering query parameters of
+filters.py. The task and comment lists are built from `.values()` rows by the lean
+serializers of values_serializers.py (ValuesListMixin).
+
+Every view declares `query_budget`, the number of SQL queries each HTTP method
+runs for an authenticated request with cold caches. The budgets do not depend
+on the amount of data and are enforced by QueryBudgetTests; a change of a
+budget has to be deliberate.
 """
 
-from django.db.models import Q
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.db.models import Prefetch, prefetch_related_objects
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from django.contrib.auth.models import User
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError, PermissionDenied, NotFound
-from kanban_app.models import Board, Task, Comment
-from .serializers import TaskSerializer, TaskDetailSerializer, BoardSerializer, BoardDetailSerializer, BoardUpdateSerializer, UserMiniSerializer, TaskAssignedOrReviewingSerializer, TaskCreateUpdateSerializer, CommentSerializer, CommentCreateUpdateSerializer, EmailCheckSerializer
+from kanban_app.models import Board, BoardChange, Task, Comment
+from kanban_app.events import make_ticket
+from kanban_app.membership import is_board_member
+from kanban_app import dashboard, search, transfer
+from .serializers import TaskSerializer, TaskDetailSerializer, BoardSerializer, BoardDetailSerializer, BoardUpdateSerializer, UserMiniSerializer, TaskAssignedOrReviewingSerializer, TaskCreateUpdateSerializer, CommentSerializer, CommentSyncSerializer, CommentCreateUpdateSerializer, EmailCheckSerializer, TaskBatchSerializer
 from .permissions import IsBoardOwnerOrMember, IsBoardOwner, IsAuthor
+from .filters import TaskFilter, TaskOrdering
+from .pagination import CommentCursorPagination, SearchPagination, TaskCursorPagination, TaskInboxCursorPagination
+from .mixins import BoardVersionETagMixin, ReplicaReadMixin, ResponseCacheMixin, ValuesListMixin
+from .values_serializers import CommentValuesSerializer, TaskAssignedOrReviewingValuesSerializer, TaskInboxValuesSerializer, TaskValuesSerializer
 
 
-class BoardsView(generics.ListCreateAPIView):
+def get_task_board_version(task_id):
+    """
+    Return (board_id, board version) of a task with a single query.
+
+    Raises:
+        NotFound: If no task with `task_id` exists.
+    """
+
+    row = Task.objects.filter(pk=task_id).values_list('board_id', 'board__version').first()
+    if row is None:
+        raise NotFound(f"Task mit ID {task_id} existiert nicht.")
+    return row
+
+
+class BoardsView(ReplicaReadMixin, ResponseCacheMixin, generics.ListCreateAPIView):
     """
     List all boards that the current user owns or is a member of, 
     and allow creating new boards.
+
+    GET responses are cached per user and keyed by the versions of the listed boards.
     """
 
     serializer_class = BoardSerializer
     permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+    query_budget = {'GET': 2, 'POST': 12}
 
     def get_queryset(self):
-        """Return boards where the user is owner or member."""
+        """Return boards where the user is owner or member, joined with their denormalized statistics."""
         user = self.request.user
-        return Board.objects.filter(
-            Q(owner=user) | Q(members=user)
-        ).distinct()
+        return Board.objects.for_user(user).select_related('stats')
+
+    def get_cache_versions(self):
+        return Board.objects.for_user(self.request.user).values_list('pk', 'version')
 
 
-class BoardDetail(generics.RetrieveUpdateDestroyAPIView):
+class BoardDetail(ReplicaReadMixin, BoardVersionETagMixin, ResponseCacheMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update, or delete a specific board by ID.
 
+    GET responses carry an ETag based on the board version; a matching
+    If-None-Match is answered with 304 without loading the tasks. Otherwise
+    the response is served from the per-user response cache if possible.
+
     Permissions:
     - GET: Owner or Member
     - PATCH/PUT: Owner or Member
     - DELETE: Only Owner
     """
 
-    queryset = Board.objects.all()
+    etag_prefix = 'board'
+    query_budget = {'GET': 4, 'PUT': 10, 'PATCH': 19, 'DELETE': 11}
+
+    def get_queryset(self):
+        """
+        Return boards with the data their serializer needs.
+
+        For GET the members and the tasks (with assignee/reviewer joined and the
+        comment counts annotated) are prefetched, so the detail view costs a fixed
+        number of queries regardless of the board size. For PUT/PATCH the owner
+        is joined and the members are prefetched for the nested user data.
+        """
+
+        if self.request.method == 'GET':
+            return Board.objects.prefetch_related(*self.get_detail_prefetches())
+        return Board.objects.select_related('owner').prefetch_related('members')
+
+    def get_detail_prefetches(self):
+        """Return the prefetches needed by BoardDetailSerializer."""
+        tasks = Task.objects.select_related('assignee', 'reviewer').with_comments_count()
+        return ['members', Prefetch('tasks', queryset=tasks)]
+
+    def get_object(self):
+        """
+        Return the board, reusing the row loaded for the ETag check on GET.
+
+        The members and tasks are only prefetched once it is clear that the
+        request is not answered with 304.
+        """
+
+        board = getattr(self, 'etag_board', None)
+        if board is None:
+            return super().get_object()
+        prefetch_related_objects([board], *self.get_detail_prefetches())
+        self.check_object_permissions(self.request, board)
+        return board
 
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
             return BoardUpdateSerializer
         return BoardDetailSerializer
+
+    def get_board_version(self):
+        """Load the requested board and return its (board_id, version)."""
+        pk = self.kwargs['pk']
+        self.etag_board = Board.objects.filter(pk=pk).first()
+        if self.etag_board is None:
+            raise NotFound(f'Board with ID {pk} not found.')
+        return pk, self.etag_board.version
+
+    def get_cache_versions(self):
+        """Reuse the board loaded for the ETag check."""
+        return [(self.etag_board.pk, self.etag_board.version)]
     
     def get_permissions(self):
         """
@@ -80,6 +182,7 @@ class EmailCheckView(APIView):
     """
 
     permission_classes = [IsAuthenticated] 
+    query_budget = {'GET': 1}
                           
     def get(self, request):
         """
@@ -115,17 +218,28 @@ class EmailCheckView(APIView):
         )
 
 
-class TasksView(generics.ListCreateAPIView):
+class TasksView(ReplicaReadMixin, ValuesListMixin, generics.ListCreateAPIView):
     """
     List all tasks and allow creation of new tasks.
 
     Permissions:
-    - GET: Authenticated users. Access to each task is enforced by IsBoardOwnerOrMember so users only see tasks for boards they own or are members of.
+    - GET: Authenticated users. The queryset is restricted in SQL to tasks on boards the user owns or is a member of, filtered and ordered by the query parameters of filters.py, and paginated by cursor (on the task ID unless `ordering` is given).
     - POST: Authenticated users who are the owner or a member of the target board. The create() method validates the board exists and checks membership; non-members receive PermissionDenied.
     """
        
-    queryset = Task.objects.all()
     permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+    query_budget = {'GET': 1, 'POST': 10}
+    pagination_class = TaskCursorPagination
+    filter_backends = [TaskFilter, TaskOrdering]
+    values_serializer_class = TaskValuesSerializer
+
+    def get_queryset(self):
+        """Return tasks on the user's boards with assignee/reviewer joined and comment counts annotated."""
+        return (
+            Task.objects.for_user(self.request.user)
+            .select_related('assignee', 'reviewer')
+            .with_comments_count()
+        )
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -152,9 +266,7 @@ class TasksView(generics.ListCreateAPIView):
         except Board.DoesNotExist:
             raise NotFound(f'Board with ID {board_id} not found.')
         
-        user = request.user
-
-        if board.owner != user and not board.members.filter(id=user.id).exists():
+        if not is_board_member(request, board.pk):
             raise PermissionDenied("You are not a member of this board.")   
 
         task = serializer.save(board=board)
@@ -163,76 +275,374 @@ class TasksView(generics.ListCreateAPIView):
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
             
 
-class TaskDetail(generics.RetrieveUpdateDestroyAPIView):
+class TaskDetail(BoardVersionETagMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update, or delete a specific task.
+
+    GET responses carry an ETag based on the version of the task's board.
     """
         
-    queryset = Task.objects.all()
+    queryset = Task.objects.select_related('assignee', 'reviewer').with_comments_count()
     permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+    query_budget = {'GET': 3, 'PUT': 9, 'PATCH': 8, 'DELETE': 10}
+    etag_prefix = 'task'
 
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
             return TaskCreateUpdateSerializer
         return TaskDetailSerializer
+
+    def get_board_version(self):
+        """Return (board_id, version) of the board of the requested task."""
+        return get_task_board_version(self.kwargs['pk'])
         
 
-class TasksAssignedToMeView(generics.ListAPIView):
+class TaskBatchView(APIView):
+    """
+    Apply a batch of task creates, partial updates and deletes to one board.
+
+    POST /api/boards/<pk>/tasks/batch/
+        {"create": [{...}], "update": [{"id": 1, ...}], "delete": [2, 3]}
+
+    Board membership is checked once, all items are validated together and
+    the changes are applied in a single transaction. The response lists the
+    result of every item; validation errors are returned per item with 400.
+    """
+
+    permission_classes = [IsAuthenticated]
+    query_budget = {'POST': 15}
+
+    def post(self, request, pk):
+        """
+        Handle POST request with a batch of task changes.
+
+        Args:
+            request: DRF request object with the create/update/delete lists.
+            pk: ID of the board the tasks belong to.
+
+        Returns:
+            Response with per-item results for each of the three lists.
+        """
+
+        if not is_board_member(request, pk):
+            if not Board.objects.filter(pk=pk).exists():
+                raise NotFound(f'Board with ID {pk} not found.')
+            raise PermissionDenied("You are not a member of this board.")
+
+        serializer = TaskBatchSerializer(data=request.data, context={'request': request, 'board_id': pk})
+        serializer.is_valid(raise_exception=True)
+        results = serializer.save()
+        return Response(results, status=status.HTTP_200_OK)
+
+
+class BoardChangesView(APIView):
+    """
+    Return what changed on a board since a sync cursor.
+
+    GET /api/boards/<pk>/changes/?since=<cursor>
+
+    The response contains the created or updated tasks and comments, the IDs
+    of removed tasks and comments, and the members added and removed since
+    the cursor, plus the cursor to pass in the next request. Without `since`
+    every task and comment of the board is returned.
+
+    Tasks are found through the (board, updated_at) index and removals and
+    membership changes through the (board, changed_at) index of the
+    BoardChange log, so these reads cost in proportion to the changes on
+    this board. Comments are found through the board's tasks and the
+    (task, updated_at) index: one index seek per task of the board plus the
+    changed comments, independent of the comment activity on other boards.
+
+    The cursor is the server time of the response in microseconds, moved
+    back by `cursor_overlap` so that writes committed while the response was
+    built are not missed. Changes near the cursor may therefore be returned
+    twice; clients apply them idempotently.
+    """
+
+    permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 5}
+    cursor_overlap = timedelta(seconds=1)
+
+    def get(self, request, pk):
+        """
+        Handle GET request for the changes of a board.
+
+        Args:
+            request: DRF request object with the optional query parameter 'since'.
+            pk: ID of the board.
+
+        Returns:
+            Response with the changed tasks, comments and members and the next cursor.
+        """
+
+        since = self.parse_cursor(request.query_params.get('since'))
+        if not is_board_member(request, pk):
+            if not Board.objects.filter(pk=pk).exists():
+                raise NotFound(f'Board with ID {pk} not found.')
+            raise PermissionDenied("You are not a member of this board.")
+
+        cursor = timezone.now() - self.cursor_overlap
+        tasks = (
+            Task.objects.filter(board_id=pk, updated_at__gte=since)
+            .with_comments_count()
+            .order_by('updated_at', 'id')
+        )
+        comments = (
+            Comment.objects.filter(task__board_id=pk, updated_at__gte=since)
+            .select_related('author')
+            .order_by('updated_at', 'id')
+        )
+        changes = BoardChange.objects.filter(board_id=pk, changed_at__gte=since).order_by('changed_at', 'id')
+
+        removed = {BoardChange.TASK_REMOVED: [], BoardChange.COMMENT_REMOVED: []}
+        members = {}
+        for kind, object_id in changes.values_list('kind', 'object_id'):
+            if kind in removed:
+                removed[kind].append(object_id)
+            else:
+                members[object_id] = kind
+        added_ids = [user_id for user_id, kind in members.items() if kind == BoardChange.MEMBER_ADDED]
+        added = User.objects.filter(pk__in=added_ids, member_of_boards=pk).order_by('pk') if added_ids else []
+
+        return Response({
+            'cursor': self.format_cursor(cursor),
+            'tasks': TaskValuesSerializer(tasks.values(*TaskValuesSerializer.values)).data,
+            'comments': CommentSyncSerializer(comments, many=True).data,
+            'removed_tasks': removed[BoardChange.TASK_REMOVED],
+            'removed_comments': removed[BoardChange.COMMENT_REMOVED],
+            'members_added': UserMiniSerializer(added, many=True).data,
+            'members_removed': [user_id for user_id, kind in members.items() if kind == BoardChange.MEMBER_REMOVED]
+        }, status=status.HTTP_200_OK)
+
+    def parse_cursor(self, value):
+        """
+        Convert a `since` cursor into an aware datetime (the epoch if missing).
+
+        Raises:
+            ValidationError: If the cursor is not a number of microseconds.
+        """
+
+        if not value:
+            return datetime.fromtimestamp(0, dt_timezone.utc)
+        try:
+            return datetime.fromtimestamp(0, dt_timezone.utc) + timedelta(microseconds=int(value))
+        except (ValueError, OverflowError):
+            raise ValidationError({'since': 'Invalid cursor.'})
+
+    def format_cursor(self, moment):
+        """Convert an aware datetime into a `since` cursor."""
+        return str((moment - datetime.fromtimestamp(0, dt_timezone.utc)) // timedelta(microseconds=1))
+
+
+class BoardExportView(APIView):
+    """
+    Stream a board with its members, tasks and comments as NDJSON.
+
+    GET /api/boards/<pk>/export/
+
+    The records are produced by kanban_app.transfer.export_board() while the
+    response is sent, with chunked reads, so memory stays flat for any
+    board size. The import_board command reads the file back.
+    """
+
+    permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 5}
+
+    def get(self, request, pk):
+        """
+        Handle GET request for a board export.
+
+        Args:
+            request: DRF request object.
+            pk: ID of the board.
+
+        Returns:
+            StreamingHttpResponse with one JSON record per line.
+        """
+
+        board = Board.objects.select_related('owner').filter(pk=pk).first()
+        if board is None:
+            raise NotFound(f'Board with ID {pk} not found.')
+        if not is_board_member(request, pk):
+            raise PermissionDenied("You are not a member of this board.")
+
+        response = StreamingHttpResponse(
+            transfer.to_ndjson(transfer.export_board(board)),
+            content_type='application/x-ndjson'
+        )
+        response['Content-Disposition'] = f'attachment; filename="board-{pk}.ndjson"'
+        return response
+
+
+class EventTicketView(APIView):
+    """
+    Issue a short-lived ticket for the event stream of a board.
+
+    POST /api/boards/<pk>/events/ticket/
+
+    Browsers open the stream (/api/async/boards/<pk>/events/) with
+    EventSource, which cannot send the Authorization header, so they pass
+    the ticket as `?ticket=` instead. A ticket is signed, bound to the user
+    and the board, and expires after KANMIND_EVENTS_TICKET_MAX_AGE seconds;
+    fetch a new one before reconnecting after an error.
+    """
+
+    permission_classes = [IsAuthenticated]
+    query_budget = {'POST': 1}
+
+    def post(self, request, pk):
+        """
+        Handle POST request for an event stream ticket.
+
+        Args:
+            request: DRF request object.
+            pk: ID of the board.
+
+        Returns:
+            Response with the ticket and its lifetime in seconds.
+        """
+
+        if not is_board_member(request, pk):
+            raise PermissionDenied("You are not a member of this board.")
+        return Response({
+            'ticket': make_ticket(request.user.pk, pk),
+            'expires_in': getattr(settings, 'KANMIND_EVENTS_TICKET_MAX_AGE', 60)
+        }, status=status.HTTP_201_CREATED)
+
+
+class TasksAssignedToMeView(ReplicaReadMixin, ResponseCacheMixin, ValuesListMixin, generics.ListAPIView):
     """
-    List tasks assigned to the current user.
+    List tasks assigned to the current user, filtered and ordered by the query parameters of filters.py.
+
+    Responses are cached per user and keyed by the versions of the boards of the tasks.
     """
         
     serializer_class = TaskAssignedOrReviewingSerializer
+    values_serializer_class = TaskAssignedOrReviewingValuesSerializer
     permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+    query_budget = {'GET': 2}
+    filter_backends = [TaskFilter, TaskOrdering]
 
     def get_queryset(self):
-        """Return tasks where the current user is the assignee."""
+        """Return tasks where the current user is the assignee, with assignee/reviewer joined and comment counts annotated."""
         user = self.request.user
-        return Task.objects.filter(assignee=user).distinct()
+        return (
+            Task.objects.filter(assignee=user)
+            .select_related('assignee', 'reviewer')
+            .with_comments_count()
+        )
+
+    def get_cache_versions(self):
+        """
+        Return the versions of the boards holding the user's tasks.
+
+        Assigning or unassigning a task changes the version of its board, so
+        the key changes whether the board stays in the set or leaves it.
+        """
+        return Board.objects.filter(tasks__assignee=self.request.user).values_list('pk', 'version').distinct()
     
 
-class TasksReviewingView(generics.ListAPIView):
+class TasksReviewingView(ReplicaReadMixin, ResponseCacheMixin, ValuesListMixin, generics.ListAPIView):
     """
-    List tasks where the current user is assigned as the reviewer.
+    List tasks where the current user is assigned as the reviewer, filtered and ordered by the query parameters of filters.py.
+
+    Responses are cached per user and keyed by the versions of the boards of the tasks.
     """
         
     serializer_class = TaskAssignedOrReviewingSerializer
+    values_serializer_class = TaskAssignedOrReviewingValuesSerializer
     permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+    query_budget = {'GET': 2}
+    filter_backends = [TaskFilter, TaskOrdering]
 
     def get_queryset(self):
-        """Return tasks where the current user is the reviewer."""
+        """Return tasks where the current user is the reviewer, with assignee/reviewer joined and comment counts annotated."""
         user = self.request.user
-        return Task.objects.filter(reviewer=user).distinct()
+        return (
+            Task.objects.filter(reviewer=user)
+            .select_related('assignee', 'reviewer')
+            .with_comments_count()
+        )
+
+    def get_cache_versions(self):
+        """Return the versions of the boards holding the tasks the user reviews."""
+        return Board.objects.filter(tasks__reviewer=self.request.user).values_list('pk', 'version').distinct()
+
+
+class TasksInboxView(ReplicaReadMixin, ValuesListMixin, generics.ListAPIView):
+    """
+    List the tasks the current user works on, as assignee, reviewer or both.
+
+    GET /api/tasks/inbox/
+
+    One query returns both roles: each task carries `role` ('assignee',
+    'reviewer' or 'both'), computed in SQL, next to the fields of the
+    assigned/reviewing lists. Sorted by due date (`ordering=-due_date` for the
+    latest first), filtered by the query parameters of filters.py, and
+    paginated by cursor.
+    """
+
+    serializer_class = TaskAssignedOrReviewingSerializer
+    values_serializer_class = TaskInboxValuesSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = TaskInboxCursorPagination
+    filter_backends = [TaskFilter, TaskOrdering]
+    query_budget = {'GET': 1}
+
+    def get_queryset(self):
+        """Return the user's tasks in either role, with the role and comment counts annotated."""
+        return Task.objects.inbox_for(self.request.user).with_comments_count()
 
 
-class CommentsView(generics.ListCreateAPIView):
+class CommentsView(ReplicaReadMixin, BoardVersionETagMixin, ValuesListMixin, generics.ListCreateAPIView):
     """
     List comments for a specific task or create a new comment.
+
+    GET loads the task's board version and the user's access to the board in
+    one query, answers with 304 if the ETag matches and otherwise returns one
+    page of comments (oldest first, keyset-paginated by creation time) with
+    the authors joined in a second query.
     """
         
     permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
-    
-    def get_queryset(self):
-        """Return comments related to the task identified by 'pk' URL parameter:
-        - Resolve task by pk (kwargs['pk']).
-        - Ensure requesting user is owner or member of the task's board.
-        - Return Comment queryset filtered by the resolved task_id.        
+    query_budget = {'GET': 2, 'POST': 7}
+    pagination_class = CommentCursorPagination
+    etag_prefix = 'comments'
+    values_serializer_class = CommentValuesSerializer
+
+    def get_board_version(self):
         """
+        Return (board_id, version) of the board of the task and remember whether the user may access it.
 
-        task_id = self.kwargs['pk']
+        Raises:
+            NotFound: If no task with the requested ID exists.
+        """
 
-        try:
-            task = Task.objects.get(pk=task_id)
-        except Task.DoesNotExist:
+        task_id = self.kwargs['pk']
+        row = (
+            Task.objects.filter(pk=task_id)
+            .with_is_member(self.request.user)
+            .values_list('board_id', 'board__version', 'is_member')
+            .first()
+        )
+        if row is None:
             raise NotFound(f"Task mit ID {task_id} existiert nicht.")
+        board_id, version, self.is_member = row
+        return board_id, version
 
-        user = self.request.user        
-        board = task.board
+    def check_board_access(self, board_id):
+        """Use the membership flag loaded with the board version."""
+        if not self.is_member:
+            raise PermissionDenied("You are not a member of this board.")
 
-        if board.owner != user and not board.members.filter(id=user.id).exists():
-            raise PermissionDenied("Du bist kein Mitglied dieses Boards.")
+    def get_queryset(self):
+        """
+        Return the comments of the task identified by the 'pk' URL parameter, with their authors joined.
 
-        return Comment.objects.filter(task_id=task_id)
+        Access to the task's board has been checked by get() before.
+        """
+
+        return Comment.objects.filter(task_id=self.kwargs['pk']).select_related('author')
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -243,23 +653,27 @@ class CommentsView(generics.ListCreateAPIView):
         """Set author to the current user and associate with the task."""
 
         task_id = self.kwargs['pk']
-
-        try:
-            task = Task.objects.get(pk=task_id)
-        except Task.DoesNotExist:
-            raise NotFound(f"Task mit ID {task_id} existiert nicht.")
-        
-        user = self.request.user
-        board = task.board
-
-        if board.owner != user and not board.members.filter(id=user.id).exists():
-            raise PermissionDenied("Du bist kein Mitglied dieses Boards.")
-        
+        self.check_task_membership(task_id)
         serializer.save(
-            author=user,
+            author=self.request.user,
             task_id=task_id
         )
 
+    def check_task_membership(self, task_id):
+        """
+        Ensure the task exists and the requesting user is owner or member of its board.
+
+        Raises:
+            NotFound: If no task with `task_id` exists.
+            PermissionDenied: If the user has no access to the task's board.
+        """
+
+        board_id = Task.objects.filter(pk=task_id).values_list('board_id', flat=True).first()
+        if board_id is None:
+            raise NotFound(f"Task mit ID {task_id} existiert nicht.")
+        if not is_board_member(self.request, board_id):
+            raise PermissionDenied("Du bist kein Mitglied dieses Boards.")
+
 
 class CommentDetail(generics.RetrieveDestroyAPIView):
     """
@@ -268,11 +682,12 @@ class CommentDetail(generics.RetrieveDestroyAPIView):
     """
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+    query_budget = {'GET': 2, 'DELETE': 7}
     
     def get_queryset(self):
         """Return comments for the task identified by 'task_pk' URL parameter."""
         task_id = self.kwargs['task_pk']
-        return Comment.objects.filter(task_id=task_id)
+        return Comment.objects.filter(task_id=task_id).select_related('author', 'task')
     
     def get_permissions(self):
         """
@@ -283,3 +698,100 @@ class CommentDetail(generics.RetrieveDestroyAPIView):
             permissions.append(IsAuthor())
         return permissions
     
+
+
+class SearchView(ReplicaReadMixin, APIView):
+    """
+    Full-text search over the tasks and comments of the current user's boards.
+
+    GET /api/search/?q=<text>&page=<n>&page_size=<n>
+
+    Matches task titles, task descriptions and comment contents through the
+    FTS5 index of kanban_app.search, best matches first (task titles weigh
+    most). Board membership is checked in the same query as the match.
+    """
+
+    permission_classes = [IsAuthenticated]
+    pagination_class = SearchPagination
+    query_budget = {'GET': 1}
+
+    def get(self, request):
+        """
+        Handle GET request for a search.
+
+        Args:
+            request: DRF request object with the query parameter 'q' and the
+                optional pagination parameters 'page' and 'page_size'.
+
+        Returns:
+            Paginated response with the matching tasks and comments.
+
+        Raises:
+            ValidationError: If 'q' contains no searchable words.
+        """
+
+        text = request.query_params.get('q', '')
+        if search.build_match_query(text) is None:
+            raise ValidationError({'q': 'Search text is required.'})
+        paginator = self.pagination_class()
+        results = paginator.paginate_queryset(search.search(request.user, text), request, view=self)
+        return paginator.get_paginated_response(results)
+
+
+class DashboardView(ReplicaReadMixin, ResponseCacheMixin, APIView):
+    """
+    Task totals of the current user for the home screen.
+
+    GET /api/dashboard/?days=<n>
+
+    Returns the tasks assigned to the user per status, the tasks the user
+    reviews, the user's overdue tasks and tasks due within `days` days, and
+    the number of tasks per board, all from one grouped query (see
+    kanban_app.dashboard). Responses are cached per user and keyed by the
+    versions of the user's boards, for at most CACHE_TIMEOUT seconds.
+    """
+
+    permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 2}
+
+    def get(self, request):
+        """
+        Handle GET request for the dashboard.
+
+        Args:
+            request: DRF request object with the optional query parameter 'days'.
+
+        Returns:
+            Response with the dashboard figures.
+        """
+
+        return self.get_cached_response(self.summarize, request)
+
+    def summarize(self, request):
+        days = self.parse_days(request.query_params.get('days'))
+        return Response(dashboard.summarize(request.user, days), status=status.HTTP_200_OK)
+
+    def parse_days(self, value):
+        """
+        Convert the `days` parameter into the due-soon window (the configured default if missing).
+
+        Raises:
+            ValidationError: If `days` is not a number between 0 and MAX_DUE_SOON_DAYS.
+        """
+
+        config = dashboard.get_config()
+        if value in (None, ''):
+            return config['DUE_SOON_DAYS']
+        try:
+            days = int(value)
+        except ValueError:
+            raise ValidationError({'days': 'A whole number is required.'})
+        if not 0 <= days <= config['MAX_DUE_SOON_DAYS']:
+            raise ValidationError({'days': f'Must be between 0 and {config["MAX_DUE_SOON_DAYS"]}.'})
+        return days
+
+    def get_cache_versions(self):
+        return Board.objects.for_user(self.request.user).values_list('pk', 'version')
+
+    def get_cache_timeout(self):
+        return dashboard.get_config()['CACHE_TIMEOUT']
@@ -0,0 +1,95 @@
+"""
+Per-user dashboard summary for Kanmind.
+
+summarize() computes everything the home screen shows in one
+`GROUP BY board` pass over the tasks of the user's boards, with one
+conditional COUNT per figure:
+
+- tasks assigned to the user, per status,
+- tasks the user reviews,
+- open (not done) tasks assigned to the user that are overdue or due
+  within the next DUE_SOON_DAYS days,
+- the number of tasks per board.
+
+DashboardView caches the result per user, keyed by the versions of the
+user's boards, so every task write invalidates it. The short CACHE_TIMEOUT
+bounds how long the date-dependent figures lag behind at midnight.
+
+Configuration (settings.KANMIND_DASHBOARD):
+    DUE_SOON_DAYS (int): Default window for `due_soon`; clients may pass `days`.
+    MAX_DUE_SOON_DAYS (int): Largest accepted `days`.
+    CACHE_TIMEOUT (int): Seconds a summary is cached; 0 disables the cache.
+"""
+
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Count, Q
+from django.utils import timezone
+from kanban_app.models import Task
+
+
+DEFAULTS = {
+    'DUE_SOON_DAYS': 7,
+    'MAX_DUE_SOON_DAYS': 90,
+    'CACHE_TIMEOUT': 60,
+}
+
+STATUSES = [choice for choice, _ in Task.STATUS_CHOICES]
+
+
+def get_config():
+    """Return KANMIND_DASHBOARD merged with the defaults."""
+    return {**DEFAULTS, **getattr(settings, 'KANMIND_DASHBOARD', {})}
+
+
+def summarize(user, days, today=None):
+    """
+    Return the dashboard figures of `user` from a single grouped query.
+
+    Args:
+        user: The user the dashboard belongs to.
+        days (int): Window of `due_soon` in days, starting today.
+        today (date): Reference date; defaults to the current local date.
+
+    Returns:
+        dict: `assigned` (counts per status and total), `reviewing`,
+        `overdue`, `due_soon`, `due_soon_days` and `boards` (ID, title and
+        task count of every board with tasks).
+    """
+
+    today = today or timezone.localdate()
+    assigned = Q(assignee=user)
+    open_assigned = assigned & ~Q(status=Task.DONE)
+    counts = {
+        **{status: Count('id', filter=assigned & Q(status=status)) for status in STATUSES},
+        'reviewing': Count('id', filter=Q(reviewer=user)),
+        'overdue': Count('id', filter=open_assigned & Q(due_date__lt=today)),
+        'due_soon': Count('id', filter=open_assigned & Q(due_date__gte=today, due_date__lte=today + timedelta(days=days))),
+        'tasks': Count('id'),
+    }
+    rows = (
+        Task.objects.for_user(user)
+        .order_by()
+        .values('board_id', 'board__title')
+        .annotate(**counts)
+        .order_by('board_id')
+    )
+
+    totals = dict.fromkeys(['reviewing', 'overdue', 'due_soon', *STATUSES], 0)
+    boards = []
+    for row in rows:
+        for name in totals:
+            totals[name] += row[name]
+        boards.append({'id': row['board_id'], 'title': row['board__title'], 'tasks': row['tasks']})
+
+    return {
+        'assigned': {
+            **{status: totals[status] for status in STATUSES},
+            'total': sum(totals[status] for status in STATUSES)
+        },
+        'reviewing': totals['reviewing'],
+        'overdue': totals['overdue'],
+        'due_soon': totals['due_soon'],
+        'due_soon_days': days,
+        'boards': boards
+    }
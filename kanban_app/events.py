@@ -0,0 +1,309 @@
+"""
+In-process publish/subscribe hub for board change events.
+
+Model hooks in kanban_app.signals publish an event after every committed
+change of a task, a comment or the members of a board. The Server-Sent Events
+endpoint (kanban_app.api.async_views.board_events) subscribes to the events of
+one board and streams them to the browser, so open tabs no longer need to poll
+BoardDetail.
+
+Events are plain dicts:
+    {"type": "task.updated", "board": 3, "id": 17}
+    {"type": "comment.created", "board": 3, "id": 40, "task": 17}
+    {"type": "members.removed", "board": 3, "users": [5, 8]}
+    {"type": "tasks.batch", "board": 3, "created": [41], "updated": [17], "deleted": []}
+    {"type": "board.deleted", "board": 3}
+
+Delivery to subscribers goes through a pluggable backend, configured with
+settings.KANMIND_EVENTS_BACKEND and KANMIND_EVENTS_OPTIONS:
+- LocalBackend (default): events reach subscribers of the same process only.
+- FileBackend: a local stand-in for a shared broker. Every process appends
+  its events to one spool file and tails it, so all worker processes on a
+  host see each other's events.
+
+Browsers subscribe with EventSource, which cannot send an Authorization
+header. make_ticket() issues a short-lived signed ticket for one user and
+board (see EventTicketView); the stream accepts it as `?ticket=`.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from django.conf import settings
+from django.core import signing
+from django.db import transaction
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+try:
+    import fcntl
+except ImportError:  # Windows: rotations of concurrent publishers are not serialized.
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW = object()
+
+TICKET_SALT = 'kanmind.events.ticket'
+
+
+class Subscription:
+    """
+    A subscriber's queue of events for one board, bound to the subscriber's event loop.
+
+    Events are handed over from publishing threads with call_soon_threadsafe.
+    If the subscriber falls more than `max_size` events behind, the queue is
+    closed with OVERFLOW so the client can resynchronize.
+    """
+
+    def __init__(self, board_id, loop, max_size=1000):
+        self.board_id = board_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_size)
+        self.overflowed = False
+
+    def deliver(self, event):
+        """Hand `event` over to the subscriber; safe to call from any thread."""
+        try:
+            self.loop.call_soon_threadsafe(self.put, event)
+        except RuntimeError:
+            pass  # The subscriber's event loop is closed.
+
+    def put(self, event):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+
+    async def get(self):
+        """Wait for the next event; returns OVERFLOW if events were dropped."""
+        return await self.queue.get()
+
+
+class LocalBackend:
+    """Delivers published events directly to the subscribers of this process."""
+
+    def __init__(self, hub, **options):
+        self.hub = hub
+
+    def publish(self, event):
+        self.hub.dispatch(event)
+
+    def start(self):
+        pass
+
+
+class FileBackend:
+    """
+    Shares events between processes through an append-only spool file.
+
+    Once the spool reaches MAX_BYTES, the next publisher renames it to
+    `<PATH>.1` (replacing the previous generation) and starts a new file.
+    Publishers hold a shared lock on `<PATH>.lock` while they write and the
+    rename takes it exclusively, so the renamed file never grows afterwards.
+    Readers keep their handle on the renamed file, read it to the end and
+    only then switch to the new one, so no event is skipped; the disk space
+    of a generation is released when the last reader has closed it. A reader
+    that falls more than one whole generation behind misses that generation.
+    The lock needs flock(); without it (Windows) an event written during a
+    rotation can be missed.
+
+    Options:
+        PATH (str): Spool file shared by all processes.
+        POLL_INTERVAL (float): Seconds between checks for new lines.
+        MAX_BYTES (int): Size at which the spool is rotated; 0 never rotates.
+    """
+
+    def __init__(self, hub, PATH, POLL_INTERVAL=0.2, MAX_BYTES=10 * 1024 * 1024, **options):
+        self.hub = hub
+        self.path = PATH
+        self.poll_interval = POLL_INTERVAL
+        self.max_bytes = MAX_BYTES
+        self.thread = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def publish(self, event):
+        line = (json.dumps(event) + '\n').encode()
+        while True:
+            with self.spool_lock(shared=True):
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+                try:
+                    if not self.max_bytes or os.fstat(fd).st_size < self.max_bytes:
+                        os.write(fd, line)
+                        return
+                finally:
+                    os.close(fd)
+            self.rotate()
+
+    @contextmanager
+    def spool_lock(self, shared):
+        """Hold the lock on `<PATH>.lock`: shared for writing, exclusive for rotating."""
+        with open(f'{self.path}.lock', 'ab') as lock:
+            if fcntl is None:
+                yield
+                return
+            fcntl.flock(lock, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def rotate(self):
+        """Move a full spool to `<PATH>.1` once no publisher is writing to it."""
+        with self.spool_lock(shared=False):
+            try:
+                if os.path.getsize(self.path) >= self.max_bytes:
+                    os.replace(self.path, f'{self.path}.1')
+            except FileNotFoundError:
+                pass  # Another process rotated it and nobody has published since.
+
+    def start(self):
+        """Start tailing the spool file in a daemon thread (once per process)."""
+        with self.lock:
+            if self.thread is None:
+                open(self.path, 'ab').close()
+                self.thread = threading.Thread(target=self.tail, name='kanmind-events', daemon=True)
+                self.thread.start()
+
+    def stop(self):
+        """Stop the tailing thread."""
+        self.stopped.set()
+
+    def tail(self):
+        spool = self.open_for_reading()
+        spool.seek(0, os.SEEK_END)
+        pending = b''
+        try:
+            while not self.stopped.is_set():
+                chunk = spool.read()
+                if chunk:
+                    pending = self.dispatch_lines(pending + chunk)
+                    continue
+                if self.is_rotated(spool):
+                    # The renamed file is complete (see spool_lock); read its rest, then switch.
+                    if self.dispatch_lines(pending + spool.read()):
+                        logger.warning('Skipping incomplete event line in %s', self.path)
+                    spool.close()
+                    spool = self.open_for_reading()
+                    pending = b''
+                    continue
+                time.sleep(self.poll_interval)
+        finally:
+            spool.close()
+
+    def open_for_reading(self):
+        """Open the current spool from its start, creating it if a rotation just removed it."""
+        return open(os.open(self.path, os.O_RDONLY | os.O_CREAT, 0o600), 'rb')
+
+    def is_rotated(self, spool):
+        """Return True if PATH now names another file than the one `spool` reads."""
+        try:
+            return os.stat(self.path).st_ino != os.fstat(spool.fileno()).st_ino
+        except FileNotFoundError:
+            return False
+
+    def dispatch_lines(self, data):
+        """Dispatch the complete lines in `data` and return the incomplete rest."""
+        *lines, rest = data.split(b'\n')
+        for line in lines:
+            try:
+                self.hub.dispatch(json.loads(line))
+            except ValueError:
+                logger.warning('Skipping malformed event line in %s', self.path)
+        return rest
+
+
+class EventHub:
+    """
+    Routes published board events to the subscriptions of their board.
+    """
+
+    def __init__(self, backend_path, options):
+        self.subscriptions = {}
+        self.lock = threading.Lock()
+        self.backend = import_string(backend_path)(self, **options)
+
+    def publish(self, event):
+        """Publish `event` through the backend. Call after the change has been committed."""
+        self.backend.publish(event)
+
+    def dispatch(self, event):
+        """Deliver `event` to every local subscriber of its board."""
+        with self.lock:
+            subscribers = list(self.subscriptions.get(event['board'], ()))
+        for subscription in subscribers:
+            subscription.deliver(event)
+
+    def subscribe(self, board_id):
+        """Create a subscription for `board_id` bound to the running event loop."""
+        self.backend.start()
+        subscription = Subscription(board_id, asyncio.get_running_loop())
+        with self.lock:
+            self.subscriptions.setdefault(board_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscribers = self.subscriptions.get(subscription.board_id, set())
+            subscribers.discard(subscription)
+            if not subscribers:
+                self.subscriptions.pop(subscription.board_id, None)
+
+
+_hub = None
+
+
+def get_hub():
+    """Return the process-wide EventHub configured from settings."""
+    global _hub
+    if _hub is None:
+        _hub = EventHub(
+            getattr(settings, 'KANMIND_EVENTS_BACKEND', 'kanban_app.events.LocalBackend'),
+            getattr(settings, 'KANMIND_EVENTS_OPTIONS', {})
+        )
+    return _hub
+
+
+@receiver(setting_changed)
+def reset_hub(setting, **kwargs):
+    """Rebuild the EventHub when its settings are overridden (e.g. in tests)."""
+    global _hub
+    if setting in ('KANMIND_EVENTS_BACKEND', 'KANMIND_EVENTS_OPTIONS'):
+        _hub = None
+
+
+def make_ticket(user_id, board_id):
+    """Return a signed ticket that lets `user_id` subscribe to the events of `board_id`."""
+    return signing.dumps([user_id, board_id], salt=TICKET_SALT)
+
+
+def read_ticket(ticket, board_id):
+    """
+    Return the user ID of a valid ticket for `board_id`, or None.
+
+    Tickets expire after KANMIND_EVENTS_TICKET_MAX_AGE seconds.
+    """
+
+    max_age = getattr(settings, 'KANMIND_EVENTS_TICKET_MAX_AGE', 60)
+    try:
+        user_id, ticket_board_id = signing.loads(ticket, salt=TICKET_SALT, max_age=max_age)
+    except (signing.BadSignature, TypeError, ValueError):
+        return None
+    return user_id if ticket_board_id == board_id else None
+
+
+def publish_on_commit(event):
+    """Publish `event` once the current transaction commits (immediately in autocommit mode)."""
+    transaction.on_commit(lambda: get_hub().publish(event), robust=True)
+
@@ -0,0 +1,134 @@
+"""
+Management command that compares the throughput of the WSGI and the ASGI request path.
+
+Usage:
+    python manage.py bench_async --email user@example.com
+    python manage.py bench_async --requests 400 --concurrency 100 --threads 8 --client-delay 0.05
+
+Both paths run in-process against the configured database:
+- WSGI: the synchronous DRF view (e.g. /api/boards/) through Django's test
+  Client, executed by a thread pool of `--threads` workers, like a threaded
+  WSGI server.
+- ASGI: the async view (e.g. /api/async/boards/) through Django's AsyncClient
+  on a single event loop with up to `--concurrency` requests in flight.
+
+Every request is wrapped in a simulated slow client that spends
+`--client-delay` seconds before and after the request. On the WSGI path this
+time blocks a worker thread; on the ASGI path it is a non-blocking await.
+
+Seed data first (e.g. with the seed_data command) and pass the email of a user
+who has boards; by default the user owning the most boards is used.
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count
+from django.test import AsyncClient, Client, override_settings
+from rest_framework.authtoken.models import Token
+
+
+ENDPOINTS = [
+    ('/api/boards/', '/api/async/boards/'),
+    ('/api/tasks/assigned-to-me/', '/api/async/tasks/assigned-to-me/'),
+    ('/api/tasks/reviewing/', '/api/async/tasks/reviewing/'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the synchronous (WSGI) against the async (ASGI) read endpoints.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--email', help='Email of the user to authenticate as.')
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint and path.')
+        parser.add_argument('--threads', type=int, default=8, help='Worker threads of the WSGI path.')
+        parser.add_argument('--concurrency', type=int, default=100, help='Requests in flight on the ASGI path.')
+        parser.add_argument('--client-delay', type=float, default=0.05, help='Simulated client latency in seconds.')
+
+    def handle(self, *args, **options):
+        user = self.get_user(options['email'])
+        token, _ = Token.objects.get_or_create(user=user)
+        auth = f'Token {token.key}'
+
+        # The per-request log lines of the instrumentation middleware are only shown with -v 2.
+        request_logger = logging.getLogger('kanmind.requests')
+        request_logger_disabled = request_logger.disabled
+        request_logger.disabled = options['verbosity'] < 2
+
+        try:
+            with override_settings(ALLOWED_HOSTS=['testserver']):
+                for sync_path, async_path in ENDPOINTS:
+                    wsgi = self.run_wsgi(sync_path, auth, options)
+                    asgi = asyncio.run(self.run_asgi(async_path, auth, options))
+                    self.report(sync_path, 'WSGI', wsgi)
+                    self.report(async_path, 'ASGI', asgi)
+                    if wsgi['throughput']:
+                        self.stdout.write(f'  speedup: {asgi["throughput"] / wsgi["throughput"]:.2f}x')
+        finally:
+            request_logger.disabled = request_logger_disabled
+
+    def get_user(self, email):
+        if email:
+            try:
+                return User.objects.get(email=email)
+            except User.DoesNotExist:
+                raise CommandError(f'No user with email {email}.')
+        user = User.objects.annotate(boards=Count('owned_boards')).order_by('-boards').first()
+        if user is None:
+            raise CommandError('The database contains no users; seed some data first.')
+        return user
+
+    def run_wsgi(self, path, auth, options):
+        delay = options['client_delay']
+
+        def request(_):
+            client = Client()
+            time.sleep(delay)
+            started = time.perf_counter()
+            response = client.get(path, HTTP_AUTHORIZATION=auth)
+            latency = time.perf_counter() - started
+            time.sleep(delay)
+            connections.close_all()
+            return response.status_code, latency
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['threads']) as pool:
+            results = list(pool.map(request, range(options['requests'])))
+        return self.summarize(results, time.perf_counter() - started)
+
+    async def run_asgi(self, path, auth, options):
+        delay = options['client_delay']
+        semaphore = asyncio.Semaphore(options['concurrency'])
+        client = AsyncClient()
+
+        async def request():
+            async with semaphore:
+                await asyncio.sleep(delay)
+                started = time.perf_counter()
+                response = await client.get(path, headers={'Authorization': auth})
+                latency = time.perf_counter() - started
+                await asyncio.sleep(delay)
+                return response.status_code, latency
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(request() for _ in range(options['requests'])))
+        return self.summarize(results, time.perf_counter() - started)
+
+    def summarize(self, results, elapsed):
+        latencies = [latency for _, latency in results]
+        return {
+            'errors': sum(1 for code, _ in results if code != 200),
+            'throughput': len(results) / elapsed if elapsed else 0,
+            'median_ms': statistics.median(latencies) * 1000 if latencies else 0,
+        }
+
+    def report(self, path, label, result):
+        self.stdout.write(
+            f'{label} {path}: {result["throughput"]:.1f} req/s, '
+            f'median latency {result["median_ms"]:.1f} ms, {result["errors"]} errors'
+        )
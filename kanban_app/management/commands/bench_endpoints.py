@@ -0,0 +1,262 @@
+"""
+Management command that benchmarks every route of the Kanmind API.
+
+Usage:
+    python manage.py bench_endpoints --output bench.json
+    python manage.py bench_endpoints --requests 200 --no-cache --compare bench.json
+
+Every route of kanban_app/api/urls.py and auth_app/api/urls.py is requested
+`--requests` times through Django's test Client, authenticated as one user
+(by default the user owning the most boards). Read routes are requested with
+GET, write-only routes with a small valid payload. Every request runs in a
+transaction that is rolled back, so the benchmark leaves the data unchanged.
+
+Reported per route: p50/p95/p99 and mean latency, SQL queries per request
+(on all database aliases, including replicas), the response status codes and
+the peak memory allocated by one request (measured with tracemalloc in a
+separate request, so that tracing does not distort the latencies). With `--output` the results are saved as JSON;
+`--compare` prints the change against a previously saved file.
+
+Seed data first, e.g. with the seed_data command, and pass the password of
+the seeded users so the login route can be measured.
+"""
+
+import json
+import logging
+import statistics
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from auth_app.api import urls as auth_urls
+from kanban_app.api import urls as kanban_urls
+from kanban_app.models import Board, Task, Comment
+
+
+class Command(BaseCommand):
+    help = 'Benchmark every API route and report latency percentiles, queries and peak memory.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--email', help='Email of the user to authenticate as.')
+        parser.add_argument('--password', default='kanmind-seed', help='Password of that user (for the login route).')
+        parser.add_argument('--requests', type=int, default=50, help='Requests per route.')
+        parser.add_argument('--warmup', type=int, default=3, help='Unmeasured requests per route.')
+        parser.add_argument('--route', action='append', dest='routes', help='Only benchmark this route name (repeatable).')
+        parser.add_argument('--no-cache', action='store_true', help='Disable the per-user response cache.')
+        parser.add_argument('--output', help='Save the results to this JSON file.')
+        parser.add_argument('--compare', help='Compare the results with a previously saved JSON file.')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 2:
+            raise CommandError('--requests must be at least 2.')
+        user = self.get_user(options['email'])
+        fixtures = self.get_fixtures(user, options['password'])
+        client = Client(HTTP_AUTHORIZATION=f'Token {fixtures["token"]}')
+
+        overrides = {'ALLOWED_HOSTS': ['testserver']}
+        if options['no_cache']:
+            overrides['KANMIND_RESPONSE_CACHE'] = {'TIMEOUT': 0}
+
+        # The per-request log lines of the instrumentation middleware are only shown with -v 2.
+        request_logger = logging.getLogger('kanmind.requests')
+        request_logger_disabled = request_logger.disabled
+        request_logger.disabled = options['verbosity'] < 2
+
+        results = []
+        try:
+            with override_settings(**overrides):
+                for name, method, path, data in self.get_requests(fixtures, options['routes']):
+                    result = self.run_route(client, name, method, path, data, options)
+                    results.append(result)
+                    self.report(result)
+        finally:
+            request_logger.disabled = request_logger_disabled
+
+        report = {
+            'started': datetime.now(timezone.utc).isoformat(),
+            'database': connections['default'].vendor,
+            'user': user.email,
+            'requests': options['requests'],
+            'response_cache': not options['no_cache'],
+            'routes': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(report, file, indent=2)
+            self.stdout.write(f'Saved results to {options["output"]}.')
+        if options['compare']:
+            self.compare(options['compare'], results)
+
+    def get_user(self, email):
+        if email:
+            try:
+                return User.objects.get(email=email)
+            except User.DoesNotExist:
+                raise CommandError(f'No user with email {email}.')
+        user = User.objects.annotate(boards=Count('owned_boards')).order_by('-boards').first()
+        if user is None:
+            raise CommandError('The database contains no users; seed some data first.')
+        return user
+
+    def get_fixtures(self, user, password):
+        """Pick the objects the parameterized routes are requested for."""
+        board = Board.objects.for_user(user).annotate(tasks_total=Count('tasks')).order_by('-tasks_total').first()
+        task = Task.objects.filter(board=board).order_by('pk').first() if board else None
+        if task is None:
+            raise CommandError(f'{user.email} has no board with tasks; seed some data first.')
+        comment = Comment.objects.filter(task__board=board).order_by('pk').first()
+        token, _ = Token.objects.get_or_create(user=user)
+        return {
+            'user': user,
+            'password': password,
+            'token': token.key,
+            'board': board,
+            'task': task,
+            'comment': comment,
+        }
+
+    def get_requests(self, fixtures, only=None):
+        """
+        Yield (route name, method, path, data) for every route of both URL modules.
+
+        Routes without an entry below are requested with GET if they take no
+        URL arguments and skipped otherwise, so that new routes show up.
+        """
+
+        user, board, task, comment = fixtures['user'], fixtures['board'], fixtures['task'], fixtures['comment']
+        new_task = {
+            'title': 'Benchmark',
+            'description': 'Created by bench_endpoints.',
+            'status': Task.TO_DO,
+            'priority': Task.MEDIUM,
+            'due_date': '2030-01-01',
+        }
+        specs = {
+            'registration': ('post', [], {
+                'fullname': 'Bench Mark',
+                'email': 'bench-registration@example.com',
+                'password': 'bench-pass-123',
+                'repeated_password': 'bench-pass-123',
+            }),
+            'login': ('post', [], {'email': user.email, 'password': fixtures['password']}),
+            'logout': ('post', [], None),
+            'boards-list': ('get', [], None),
+            'board-detail': ('get', [board.pk], None),
+            'board-tasks-batch': ('post', [board.pk], {'create': [new_task]}),
+            'board-changes': ('get', [board.pk], None),
+            'board-export': ('get', [board.pk], None),
+            'board-events-ticket': ('post', [board.pk], None),
+            'email-check': ('get', [], {'email': user.email}),
+            'tasks-list': ('get', [], None),
+            'task-detail': ('get', [task.pk], None),
+            'tasks-assigned-to-me': ('get', [], None),
+            'tasks-reviewing': ('get', [], None),
+            'tasks-inbox': ('get', [], None),
+            'comments-list': ('get', [task.pk], None),
+            'comment-detail': ('get', [comment.task_id, comment.pk], None) if comment else None,
+            'search': ('get', [], {'q': task.title}),
+            'dashboard': ('get', [], None),
+        }
+
+        for pattern in auth_urls.urlpatterns + kanban_urls.urlpatterns:
+            name = pattern.name
+            if only and name not in only:
+                continue
+            spec = specs.get(name)
+            if spec is None:
+                if pattern.pattern.converters:
+                    self.stderr.write(f'Skipping {name}: no benchmark request defined.')
+                    continue
+                spec = ('get', [], None)
+            method, args, data = spec
+            yield name, method, reverse(name, args=args), data
+
+    def request(self, client, method, path, data):
+        """Send one request inside a transaction that is rolled back; return the status code."""
+        with transaction.atomic():
+            if method == 'get':
+                response = client.get(path, data)
+            else:
+                response = getattr(client, method)(path, data, content_type='application/json')
+            if response.streaming:
+                b''.join(response.streaming_content)
+            transaction.set_rollback(True)
+        return response.status_code
+
+    def run_route(self, client, name, method, path, data, options):
+        for _ in range(options['warmup']):
+            self.request(client, method, path, data)
+
+        latencies = []
+        statuses = Counter()
+        queries = []
+
+        def count(execute, sql, params, many, context):
+            queries[-1] += 1
+            return execute(sql, params, many, context)
+
+        # Count the queries of every alias, including the replicas reads are routed to.
+        with ExitStack() as wrappers:
+            for connection in connections.all():
+                wrappers.enter_context(connection.execute_wrapper(count))
+            for _ in range(options['requests']):
+                queries.append(0)
+                started = time.perf_counter()
+                statuses[self.request(client, method, path, data)] += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        tracemalloc.start()
+        try:
+            self.request(client, method, path, data)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+        return {
+            'route': name,
+            'method': method.upper(),
+            'path': path,
+            'status': {str(code): total for code, total in sorted(statuses.items())},
+            'p50_ms': round(percentiles[49], 3),
+            'p95_ms': round(percentiles[94], 3),
+            'p99_ms': round(percentiles[98], 3),
+            'mean_ms': round(statistics.fmean(latencies), 3),
+            'queries': round(statistics.fmean(queries), 2),
+            'peak_memory_kb': round(peak / 1024, 1),
+        }
+
+    def report(self, result):
+        self.stdout.write(
+            f'{result["method"]:6} {result["route"]:22} '
+            f'p50 {result["p50_ms"]:8.2f} ms  p95 {result["p95_ms"]:8.2f} ms  p99 {result["p99_ms"]:8.2f} ms  '
+            f'{result["queries"]:6.1f} queries  {result["peak_memory_kb"]:9.1f} KiB  {result["status"]}'
+        )
+
+    def compare(self, path, results):
+        try:
+            with open(path) as file:
+                previous = {route['route']: route for route in json.load(file)['routes']}
+        except (OSError, ValueError, KeyError) as exc:
+            raise CommandError(f'Cannot read {path}: {exc}')
+
+        self.stdout.write(f'\nChange against {path}:')
+        for result in results:
+            before = previous.get(result['route'])
+            if before is None:
+                self.stdout.write(f'{result["route"]:22} new')
+                continue
+            changes = []
+            for key in ('p50_ms', 'p95_ms', 'p99_ms'):
+                if before[key]:
+                    changes.append(f'{key[:3]} {(result[key] / before[key] - 1) * 100:+6.1f}%')
+            changes.append(f'queries {result["queries"] - before["queries"]:+.1f}')
+            self.stdout.write(f'{result["route"]:22} ' + '  '.join(changes))
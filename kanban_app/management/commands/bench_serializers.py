@@ -0,0 +1,71 @@
+"""
+Management command that compares the ModelSerializers with the `.values()` based serializers.
+
+Usage:
+    python manage.py bench_serializers
+    python manage.py bench_serializers --rows 10000 --repeat 7
+
+For tasks (TaskSerializer and TaskAssignedOrReviewingSerializer), comments
+and users the first `--rows` rows are loaded, serialized and rendered to JSON
+`--repeat` times with the ModelSerializer (on select_related querysets) and
+with its counterpart from kanban_app.api.values_serializers. The command
+reports the median time of both and fails if the rendered JSON differs.
+
+Seed data first, e.g. with the seed_data command.
+"""
+
+import statistics
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from kanban_app.api.serializers import CommentSerializer, TaskAssignedOrReviewingSerializer, TaskSerializer, UserMiniSerializer
+from kanban_app.api.values_serializers import CommentValuesSerializer, TaskAssignedOrReviewingValuesSerializer, TaskValuesSerializer, UserMiniValuesSerializer
+from kanban_app.models import Task, Comment
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the ModelSerializers against the .values() based read serializers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Rows per list.')
+        parser.add_argument('--repeat', type=int, default=5, help='Measured runs per serializer.')
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        tasks = Task.objects.order_by('pk').select_related('assignee', 'reviewer').with_comments_count()[:rows]
+        cases = [
+            ('TaskSerializer', TaskSerializer, TaskValuesSerializer, tasks),
+            ('TaskAssignedOrReviewingSerializer', TaskAssignedOrReviewingSerializer, TaskAssignedOrReviewingValuesSerializer, tasks),
+            ('CommentSerializer', CommentSerializer, CommentValuesSerializer, Comment.objects.order_by('pk').select_related('author')[:rows]),
+            ('UserMiniSerializer', UserMiniSerializer, UserMiniValuesSerializer, User.objects.order_by('pk')[:rows]),
+        ]
+
+        for name, serializer, values_serializer, queryset in cases:
+            count = queryset.count()
+            if count < rows:
+                self.stderr.write(f'{name}: only {count} rows available; seed more data for a {rows} row benchmark.')
+
+            def model_path():
+                return JSONRenderer().render(serializer(queryset.all(), many=True).data)
+
+            def values_path():
+                return JSONRenderer().render(values_serializer(queryset.values(*values_serializer.values)).data)
+
+            if model_path() != values_path():
+                raise CommandError(f'{name}: the .values() serializer renders different JSON.')
+            before = self.measure(model_path, options['repeat'])
+            after = self.measure(values_path, options['repeat'])
+            self.stdout.write(
+                f'{name:34} {count:6} rows  model {before:8.1f} ms  values {after:8.1f} ms  '
+                f'speedup {before / after if after else 0:5.2f}x'
+            )
+
+    def measure(self, run, repeat):
+        """Return the median duration of `run` in milliseconds."""
+        durations = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            durations.append((time.perf_counter() - started) * 1000)
+        return statistics.median(durations)
@@ -0,0 +1,181 @@
+"""
+Management command that measures SQLite throughput with several processes.
+
+Usage:
+    python manage.py bench_sqlite
+    python manage.py bench_sqlite --processes 8 --duration 10 --write-ratio 0.3
+
+The configured SQLite database is copied to a temporary directory twice, and
+`--processes` worker processes run a mix of reads and writes against each
+copy for `--duration` seconds, like several gunicorn workers would:
+- baseline: Django's defaults (rollback journal, synchronous=FULL, deferred
+  transactions, no PRAGMAs),
+- tuned: the PRAGMAs of settings.KANMIND_SQLITE_PRAGMAS (see core.sqlite)
+  and the transaction mode of settings.DATABASES.
+
+A read loads the tasks of a random board with their users and comment
+counts; a write renames a random task through Task.save(), which also updates
+the board statistics and version in the same transaction. Failed operations
+("database is locked") are counted as errors. The original database is never
+modified.
+
+Seed data first, e.g. with the seed_data command.
+"""
+
+import multiprocessing
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections, transaction
+from django.test import override_settings
+from core.sqlite import get_pragmas
+from kanban_app.models import Board, Task
+
+
+BASELINE_PRAGMAS = {
+    'busy_timeout': None,
+    'journal_mode': 'DELETE',
+    'synchronous': None,
+    'mmap_size': None,
+    'cache_size': None,
+    'temp_store': None,
+}
+
+
+class Command(BaseCommand):
+    help = 'Compare SQLite read/write throughput of several processes with default and tuned PRAGMAs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=4, help='Concurrent worker processes.')
+        parser.add_argument('--duration', type=float, default=5.0, help='Seconds every configuration runs.')
+        parser.add_argument('--write-ratio', type=float, default=0.2, help='Share of operations that write.')
+        parser.add_argument('--seed', type=int, default=None, help='Random seed of the workers.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite' or connection.is_in_memory_db():
+            raise CommandError('This benchmark needs a file-based SQLite database.')
+        if not 0 <= options['write_ratio'] <= 1:
+            raise CommandError('--write-ratio must be between 0 and 1.')
+        board_ids = list(Board.objects.filter(tasks__isnull=False).values_list('pk', flat=True).distinct())
+        task_ids = list(Task.objects.values_list('pk', flat=True))
+        if not task_ids:
+            raise CommandError('The database contains no tasks; seed some data first.')
+
+        configurations = [
+            ('baseline', BASELINE_PRAGMAS, None),
+            ('tuned', {**BASELINE_PRAGMAS, **get_pragmas()}, connection.settings_dict['OPTIONS'].get('transaction_mode')),
+        ]
+
+        results = {}
+        with tempfile.TemporaryDirectory() as directory:
+            for label, pragmas, transaction_mode in configurations:
+                path = os.path.join(directory, f'{label}.sqlite3')
+                self.copy_database(path, pragmas['journal_mode'])
+                results[label] = self.run(path, pragmas, transaction_mode, board_ids, task_ids, options)
+                self.report(label, results[label])
+
+        if results['baseline']['throughput']:
+            self.stdout.write(
+                f'speedup: {results["tuned"]["throughput"] / results["baseline"]["throughput"]:.2f}x'
+            )
+
+    def copy_database(self, path, journal_mode):
+        """Copy the configured database to `path` and set its journal mode."""
+        connections.close_all()
+        source = sqlite3.connect(connection.settings_dict['NAME'])
+        target = sqlite3.connect(path)
+        try:
+            source.backup(target)
+            target.execute(f'PRAGMA journal_mode = {journal_mode}')
+        finally:
+            source.close()
+            target.close()
+
+    def run(self, path, pragmas, transaction_mode, board_ids, task_ids, options):
+        """Run the workers against the database at `path`; return the combined results."""
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+        start_at = time.time() + 0.5
+        workers = [
+            context.Process(
+                target=work,
+                args=(index, path, pragmas, transaction_mode, board_ids, task_ids, start_at, options, queue)
+            )
+            for index in range(options['processes'])
+        ]
+        for worker in workers:
+            worker.start()
+        outcomes = [queue.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+
+        reads = [latency for outcome in outcomes for latency in outcome['reads']]
+        writes = [latency for outcome in outcomes for latency in outcome['writes']]
+        return {
+            'reads': len(reads),
+            'writes': len(writes),
+            'errors': sum(outcome['errors'] for outcome in outcomes),
+            'throughput': (len(reads) + len(writes)) / options['duration'],
+            'read_p95_ms': percentile(reads, 95),
+            'write_p95_ms': percentile(writes, 95),
+        }
+
+    def report(self, label, result):
+        self.stdout.write(
+            f'{label:8} {result["throughput"]:9.1f} ops/s  '
+            f'{result["reads"]:7} reads (p95 {result["read_p95_ms"]:7.2f} ms)  '
+            f'{result["writes"]:6} writes (p95 {result["write_p95_ms"]:7.2f} ms)  '
+            f'{result["errors"]} errors'
+        )
+
+
+def percentile(latencies, percent):
+    """Return the `percent` percentile of `latencies` in milliseconds (0 for fewer than two values)."""
+    if len(latencies) < 2:
+        return 0.0
+    return statistics.quantiles(latencies, n=100, method='inclusive')[percent - 1] * 1000
+
+
+def work(index, path, pragmas, transaction_mode, board_ids, task_ids, start_at, options, queue):
+    """
+    Worker process: read and write until the duration is over, then report to `queue`.
+
+    The connection inherited from the parent is closed and the worker
+    connects to the copy at `path` with the given PRAGMAs and transaction mode.
+    """
+
+    settings_dict = connections['default'].settings_dict
+    settings_dict['NAME'] = path
+    settings_dict['OPTIONS'] = {**settings_dict['OPTIONS'], 'transaction_mode': transaction_mode}
+    rng = random.Random(None if options['seed'] is None else options['seed'] + index)
+    outcome = {'reads': [], 'writes': [], 'errors': 0}
+
+    with override_settings(KANMIND_SQLITE_PRAGMAS=pragmas):
+        time.sleep(max(0.0, start_at - time.time()))
+        deadline = start_at + options['duration']
+        while time.time() < deadline:
+            write = rng.random() < options['write_ratio']
+            started = time.perf_counter()
+            try:
+                if write:
+                    with transaction.atomic():
+                        task = Task.objects.get(pk=rng.choice(task_ids))
+                        task.title = f'Benchmark {rng.randrange(1000000)}'
+                        task.save()
+                else:
+                    list(
+                        Task.objects.filter(board_id=rng.choice(board_ids))
+                        .select_related('assignee', 'reviewer')
+                        .with_comments_count()
+                    )
+            except OperationalError:
+                outcome['errors'] += 1
+                continue
+            outcome['writes' if write else 'reads'].append(time.perf_counter() - started)
+        connections.close_all()
+    queue.put(outcome)
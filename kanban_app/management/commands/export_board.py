@@ -0,0 +1,38 @@
+"""
+Management command that exports a board as NDJSON.
+
+Usage:
+    python manage.py export_board 3 > board-3.ndjson
+    python manage.py export_board 3 --output board-3.ndjson --chunk-size 5000
+
+Writes the board, its members, tasks and comments in the format of
+kanban_app.transfer, one record per line, while reading them from the
+database in chunks, so memory stays flat for any board size. The file can be
+read back with the import_board command.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from kanban_app import transfer
+from kanban_app.models import Board
+
+
+class Command(BaseCommand):
+    help = 'Stream a board with its members, tasks and comments as NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('board_id', type=int, help='ID of the board to export.')
+        parser.add_argument('--output', help='File to write; defaults to standard output.')
+        parser.add_argument('--chunk-size', type=int, default=transfer.CHUNK_SIZE, help='Rows fetched per database round trip.')
+
+    def handle(self, *args, **options):
+        board = Board.objects.select_related('owner').filter(pk=options['board_id']).first()
+        if board is None:
+            raise CommandError(f'Board with ID {options["board_id"]} not found.')
+
+        lines = transfer.to_ndjson(transfer.export_board(board, chunk_size=options['chunk_size']))
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line.decode(), ending='')
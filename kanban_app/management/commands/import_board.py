@@ -0,0 +1,47 @@
+"""
+Management command that imports a board exported as NDJSON.
+
+Usage:
+    python manage.py import_board board-3.ndjson --owner anna@example.com
+    python manage.py import_board board-3.ndjson --owner anna@example.com --batch-size 2000
+
+Creates a new board owned by `--owner` from a file written by the
+export_board command or the export endpoint. Members, tasks and comments are
+written with batched bulk_create in one transaction, so a failed import
+leaves nothing behind. Users are matched by email; see kanban_app.transfer
+for what happens to users that do not exist in this database.
+"""
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from kanban_app import transfer
+
+
+class Command(BaseCommand):
+    help = 'Create a board from an NDJSON export.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='NDJSON file to import.')
+        parser.add_argument('--owner', required=True, help='Email of the owner of the new board.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per INSERT statement.')
+
+    def handle(self, *args, **options):
+        owner = User.objects.filter(email=options['owner']).first()
+        if owner is None:
+            raise CommandError(f'No user with email {options["owner"]}.')
+
+        importer = transfer.BoardImporter(owner, batch_size=options['batch_size'])
+        try:
+            with open(options['path'], encoding='utf-8') as lines:
+                board = importer.run(lines)
+        except OSError as error:
+            raise CommandError(str(error))
+        except transfer.BoardImportError as error:
+            raise CommandError(f'Import failed: {error}')
+
+        counts = importer.counts
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported board {board.pk} with {counts["members"]} member(s), {counts["tasks"]} task(s) '
+            f'and {counts["comments"]} comment(s); skipped {counts["skipped_members"]} unknown member(s) '
+            f'and {counts["skipped_comments"]} comment(s).'
+        ))
@@ -0,0 +1,39 @@
+"""
+Management command that rebuilds the denormalized board statistics.
+
+Usage:
+    python manage.py rebuild_board_stats
+    python manage.py rebuild_board_stats --board 3 --board 7 --batch-size 500
+
+The counters in BoardStats are normally maintained on every write. This
+command recomputes them from the Task and membership tables to fix any drift,
+e.g. after bulk operations or manual SQL.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from kanban_app.models import BoardStats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the BoardStats counters from scratch.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--board',
+            type=int,
+            action='append',
+            dest='board_ids',
+            help='ID of a board to rebuild (repeatable). Defaults to all boards.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of boards written per statement.'
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuilt = BoardStats.rebuild(options['board_ids'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt statistics for {rebuilt} board(s).'))
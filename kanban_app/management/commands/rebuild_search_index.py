@@ -0,0 +1,33 @@
+"""
+Management command that rebuilds the full-text search index.
+
+Usage:
+    python manage.py rebuild_search_index
+    python manage.py rebuild_search_index --batch-size 2000
+
+The index is normally maintained by database triggers on every write. This
+command reindexes all tasks and comments, e.g. right after the search index
+migration on an existing database or after restoring a backup.
+"""
+
+from django.core.management.base import BaseCommand
+from kanban_app import search
+
+
+class Command(BaseCommand):
+    help = 'Reindex all tasks and comments for full-text search.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of tasks or comments indexed per statement.'
+        )
+
+    def handle(self, *args, **options):
+        indexed = search.rebuild(
+            batch_size=options['batch_size'],
+            progress=lambda total: self.stdout.write(f'Indexed {total} row(s)...')
+        )
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt the search index with {indexed} task(s) and comment(s).'))
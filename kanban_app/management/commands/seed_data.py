@@ -0,0 +1,188 @@
+"""
+Management command that fills the database with synthetic Kanmind data.
+
+Usage:
+    python manage.py seed_data
+    python manage.py seed_data --users 2000 --boards 5000 --members 8 --tasks 40 --comments 4
+
+Every board gets an owner and `--members` members drawn from the seeded
+users, `--tasks` tasks with random status, priority, due date, assignee and
+reviewer (both board members or empty), and every task gets `--comments`
+comments by board members. All seeded users share the password given with
+`--password`, so they can log in (e.g. in the bench_endpoints command).
+
+Users and boards are written with bulk_create; memberships, tasks and
+comments, which make up nearly all rows, with plain executemany INSERTs in
+batches of `--batch-size`. Everything runs in one transaction, and model
+save() methods and signal handlers do not run. The board statistics are
+rebuilt at the end; board events, the change log and cached memberships are
+not touched.
+"""
+
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from kanban_app.models import Board, BoardStats, Task, Comment
+
+
+STATUSES = [value for value, _ in Task.STATUS_CHOICES]
+PRIORITIES = [value for value, _ in Task.PRIORITY_CHOICES]
+FIRST_NAMES = ['Anna', 'Ben', 'Clara', 'David', 'Emma', 'Felix', 'Greta', 'Hannah', 'Jonas', 'Lena', 'Max', 'Sophie']
+LAST_NAMES = ['Bauer', 'Fischer', 'Hofer', 'Huber', 'Koch', 'Maier', 'Schmid', 'Wagner', 'Weber', 'Wolf']
+TASK_FIELDS = ['id', 'board', 'title', 'description', 'status', 'priority', 'due_date', 'assignee', 'reviewer', 'updated_at']
+COMMENT_FIELDS = ['id', 'task', 'author', 'content', 'created_at', 'updated_at']
+
+
+class Command(BaseCommand):
+    help = 'Seed users, boards, members, tasks and comments with bulk inserts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200, help='Number of users.')
+        parser.add_argument('--boards', type=int, default=100, help='Number of boards.')
+        parser.add_argument('--members', type=int, default=5, help='Members per board (besides the owner).')
+        parser.add_argument('--tasks', type=int, default=50, help='Tasks per board.')
+        parser.add_argument('--comments', type=int, default=3, help='Comments per task.')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per INSERT statement.')
+        parser.add_argument('--password', default='kanmind-seed', help='Password of all seeded users.')
+        parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible data.')
+
+    def handle(self, *args, **options):
+        if options['users'] < 1:
+            raise CommandError('At least one user is required.')
+        if options['members'] >= options['users']:
+            raise CommandError('--members must be smaller than --users.')
+
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.rows = 0
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            users = self.seed_users(options['users'], options['password'])
+            boards = self.seed_boards(users, options['boards'], options['members'])
+            self.seed_tasks(boards, options['tasks'], options['comments'])
+            BoardStats.rebuild([board.pk for board, _ in boards], batch_size=self.batch_size)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {self.rows} rows in {time.perf_counter() - started:.1f} s.'
+        ))
+
+    def bulk_create(self, model, objects):
+        created = model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.rows += len(created)
+        return created
+
+    def seed_users(self, count, password):
+        run = uuid.uuid4().hex[:8]
+        password = make_password(password)
+        users = []
+        for index in range(count):
+            email = f'seed-{run}-{index}@example.com'
+            users.append(User(
+                username=email,
+                email=email,
+                password=password,
+                first_name=self.random.choice(FIRST_NAMES),
+                last_name=self.random.choice(LAST_NAMES)
+            ))
+        return self.bulk_create(User, users)
+
+    def seed_boards(self, users, count, member_count):
+        """Create the boards and their memberships; return (board, member IDs) pairs."""
+        boards = self.bulk_create(Board, [
+            Board(title=f'Board {index + 1}', owner=self.random.choice(users))
+            for index in range(count)
+        ])
+
+        user_ids = [user.pk for user in users]
+        result = []
+        memberships = []
+        for board in boards:
+            candidates = self.random.sample(user_ids, member_count + 1)
+            member_ids = [user_id for user_id in candidates if user_id != board.owner_id][:member_count]
+            memberships.extend((board.pk, user_id) for user_id in member_ids)
+            result.append((board, member_ids))
+        self.insert_rows(Board.members.through, ['board', 'user'], memberships)
+        return result
+
+    def seed_tasks(self, boards, task_count, comment_count):
+        """
+        Create the tasks of all boards and the comments of every task.
+
+        The primary keys are assigned here, so that comments can reference
+        their tasks without reading the IDs back from the database.
+        """
+
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+        today = date.today()
+        due_dates = [connection.ops.adapt_datefield_value(today + timedelta(days=offset)) for offset in range(-60, 61)]
+        task_id = (Task.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+        comment_id = (Comment.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+
+        tasks = []
+        comments = []
+        for board, member_ids in boards:
+            people = member_ids + [board.owner_id]
+            for index in range(task_count):
+                tasks.append((
+                    task_id,
+                    board.pk,
+                    f'Task {index + 1}',
+                    'Generated task.',
+                    self.random.choice(STATUSES),
+                    self.random.choice(PRIORITIES),
+                    self.random.choice(due_dates),
+                    self.pick_member(member_ids),
+                    self.pick_member(member_ids),
+                    now
+                ))
+                for number in range(comment_count):
+                    comments.append((comment_id, task_id, self.random.choice(people), f'Comment {number + 1}', now, now))
+                    comment_id += 1
+                task_id += 1
+
+                if len(tasks) >= self.batch_size:
+                    self.flush_tasks(tasks, comments)
+                    tasks, comments = [], []
+        self.flush_tasks(tasks, comments)
+
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Task, Comment]):
+                cursor.execute(sql)
+
+    def flush_tasks(self, tasks, comments):
+        self.insert_rows(Task, TASK_FIELDS, tasks)
+        self.insert_rows(Comment, COMMENT_FIELDS, comments)
+
+    def pick_member(self, member_ids):
+        """Return a random member ID, or None for one task in five."""
+        if member_ids and self.random.random() < 0.8:
+            return self.random.choice(member_ids)
+        return None
+
+    def insert_rows(self, model, fields, rows):
+        """
+        Insert `rows` (tuples of database-ready values for `fields`) with executemany.
+
+        This skips the per-object work of bulk_create, which dominates the
+        run time for hundreds of thousands of rows.
+        """
+
+        if not rows:
+            return
+        quote = connection.ops.quote_name
+        columns = ', '.join(quote(model._meta.get_field(field).column) for field in fields)
+        placeholders = ', '.join(['%s'] * len(fields))
+        sql = f'INSERT INTO {quote(model._meta.db_table)} ({columns}) VALUES ({placeholders})'
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), self.batch_size):
+                cursor.executemany(sql, rows[start:start + self.batch_size])
+        self.rows += len(rows)
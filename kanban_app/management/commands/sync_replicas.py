@@ -0,0 +1,53 @@
+"""
+Management command that copies the primary SQLite database to the stand-in replicas.
+
+Usage:
+    python manage.py sync_replicas
+    python manage.py sync_replicas --alias replica
+
+SQLite has no replication, so for local testing of the read-replica routing
+(see core.routers) a replica is a second SQLite file that is refreshed with
+this command. Everything written to the primary after a run is missing on
+the replicas until the next run, which makes replication lag easy to observe.
+
+By default the aliases of settings.KANMIND_READ_REPLICAS are refreshed.
+"""
+
+import sqlite3
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from core.routers import get_config
+
+
+class Command(BaseCommand):
+    help = 'Copy the primary SQLite database to the stand-in replica databases.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--alias', action='append', dest='aliases', help='Replica alias to refresh (repeatable).')
+
+    def handle(self, *args, **options):
+        aliases = options['aliases'] or get_config()['ALIASES']
+        if not aliases:
+            raise CommandError('No replica aliases configured; pass --alias or set KANMIND_READ_REPLICAS.')
+
+        primary = connections[DEFAULT_DB_ALIAS]
+        self.check_sqlite_file(primary)
+        for alias in aliases:
+            if alias == DEFAULT_DB_ALIAS or alias not in connections:
+                raise CommandError(f'{alias} is not a replica database alias.')
+            replica = connections[alias]
+            self.check_sqlite_file(replica)
+            replica.close()
+
+            source = sqlite3.connect(primary.settings_dict['NAME'])
+            target = sqlite3.connect(replica.settings_dict['NAME'])
+            try:
+                source.backup(target)
+            finally:
+                source.close()
+                target.close()
+            self.stdout.write(self.style.SUCCESS(f'Copied {DEFAULT_DB_ALIAS} to {alias}.'))
+
+    def check_sqlite_file(self, connection):
+        if connection.vendor != 'sqlite' or connection.is_in_memory_db():
+            raise CommandError(f'{connection.alias} is not a file-based SQLite database.')
@@ -0,0 +1,118 @@
+"""
+Board membership resolution for Kanmind.
+
+A user may access a board if they own it or are one of its members. Instead
+of checking `board.owner` and `board.members.filter(...).exists()` at every
+call site, the set of accessible board IDs is loaded once per request and
+memoized on the request object.
+
+The set can additionally be cached across requests through Django's cache
+framework by setting KANMIND_MEMBERSHIP_CACHE_TIMEOUT (seconds, 0 disables).
+Cached entries are invalidated by the signal handlers in kanban_app.signals
+whenever Board.members or a board owner changes.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from kanban_app.models import Board
+
+
+CACHE_KEY = 'kanmind:board-ids:{user_id}'
+
+
+def get_cache_timeout():
+    """Return the cross-request cache timeout in seconds (0 if caching is disabled)."""
+    return getattr(settings, 'KANMIND_MEMBERSHIP_CACHE_TIMEOUT', 0)
+
+
+def load_board_ids(user):
+    """
+    Load the IDs of all boards `user` owns or is a member of.
+
+    Args:
+        user: The user to resolve.
+
+    Returns:
+        frozenset: IDs of the accessible boards.
+    """
+
+    timeout = get_cache_timeout()
+    key = CACHE_KEY.format(user_id=user.pk)
+    if timeout:
+        board_ids = cache.get(key)
+        if board_ids is not None:
+            return board_ids
+
+    board_ids = frozenset(Board.objects.for_user(user).values_list('pk', flat=True))
+    if timeout:
+        cache.set(key, board_ids, timeout)
+    return board_ids
+
+
+async def aload_board_ids(user):
+    """Asynchronous version of load_board_ids() for async views, using the async ORM and cache APIs."""
+
+    timeout = get_cache_timeout()
+    key = CACHE_KEY.format(user_id=user.pk)
+    if timeout:
+        board_ids = await cache.aget(key)
+        if board_ids is not None:
+            return board_ids
+
+    board_ids = frozenset([
+        board_id async for board_id in Board.objects.for_user(user).values_list('pk', flat=True)
+    ])
+    if timeout:
+        await cache.aset(key, board_ids, timeout)
+    return board_ids
+
+
+def get_board_ids(request):
+    """
+    Return the accessible board IDs of the requesting user, loading them at most once per request.
+
+    Args:
+        request: Django or DRF request with an authenticated user.
+
+    Returns:
+        frozenset: IDs of the boards the user owns or is a member of.
+    """
+
+    user = request.user
+    memo = getattr(request, '_kanmind_board_ids', None)
+    if memo is None or memo[0] != user.pk:
+        memo = (user.pk, load_board_ids(user))
+        request._kanmind_board_ids = memo
+    return memo[1]
+
+
+async def aget_board_ids(request):
+    """Asynchronous version of get_board_ids() for async views."""
+
+    user = request.user
+    memo = getattr(request, '_kanmind_board_ids', None)
+    if memo is None or memo[0] != user.pk:
+        memo = (user.pk, await aload_board_ids(user))
+        request._kanmind_board_ids = memo
+    return memo[1]
+
+
+def is_board_member(request, board_id):
+    """Return True if the requesting user owns or is a member of the board with `board_id`."""
+    return board_id in get_board_ids(request)
+
+
+def invalidate(user_ids):
+    """
+    Drop the cached board IDs of the given users.
+
+    The entries are removed immediately and again once the current transaction
+    commits, so a concurrent request cannot re-cache the pre-commit state.
+    """
+
+    keys = [CACHE_KEY.format(user_id=user_id) for user_id in set(user_ids) if user_id is not None]
+    if not keys or not get_cache_timeout():
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,55 @@
+# Generated by Django 6.0.2 on 2026-10-18 06:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_board_stats(apps, schema_editor):
+    Board = apps.get_model('kanban_app', 'Board')
+    BoardStats = apps.get_model('kanban_app', 'BoardStats')
+    Task = apps.get_model('kanban_app', 'Task')
+
+    task_counts = {
+        row['board_id']: row
+        for row in Task.objects.values('board_id').annotate(
+            total=Count('id'),
+            to_do=Count('id', filter=Q(status='to_do')),
+            high=Count('id', filter=Q(priority='high'))
+        )
+    }
+    stats = []
+    for board in Board.objects.annotate(num_members=Count('members')):
+        counts = task_counts.get(board.pk, {})
+        stats.append(BoardStats(
+            board_id=board.pk,
+            member_count=board.num_members,
+            task_count=counts.get('total', 0),
+            to_do_count=counts.get('to_do', 0),
+            high_prio_count=counts.get('high', 0)
+        ))
+    BoardStats.objects.bulk_create(stats, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0009_alter_task_due_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardStats',
+            fields=[
+                ('board', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='kanban_app.board')),
+                ('member_count', models.PositiveIntegerField(default=0)),
+                ('task_count', models.PositiveIntegerField(default=0)),
+                ('to_do_count', models.PositiveIntegerField(default=0)),
+                ('high_prio_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'board stats',
+            },
+        ),
+        migrations.RunPython(populate_board_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,93 @@
+"""
+Create the FTS5 search index over task titles, descriptions and comments.
+
+The index is the virtual table `kanban_search`, filled and kept in sync by
+triggers on the task and comment tables (see kanban_app.search). Tasks use
+rowid 2 * task ID, comments 2 * comment ID + 1. Existing rows are indexed by
+the rebuild_search_index command. SQLite only; other databases are skipped.
+"""
+
+from django.db import migrations
+
+
+CREATE = [
+    """
+    CREATE VIRTUAL TABLE kanban_search USING fts5(
+        title, body, kind UNINDEXED, object_id UNINDEXED, task_id UNINDEXED, board_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER kanban_search_task_insert AFTER INSERT ON kanban_app_task BEGIN
+        INSERT INTO kanban_search (rowid, title, body, kind, object_id, task_id, board_id)
+        VALUES (new.id * 2, new.title, new.description, 'task', new.id, new.id, new.board_id);
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_task_update AFTER UPDATE OF title, description, board_id ON kanban_app_task BEGIN
+        UPDATE kanban_search SET title = new.title, body = new.description, board_id = new.board_id
+        WHERE rowid = old.id * 2;
+        UPDATE kanban_search SET board_id = new.board_id
+        WHERE new.board_id != old.board_id
+        AND rowid IN (SELECT id * 2 + 1 FROM kanban_app_comment WHERE task_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_task_delete AFTER DELETE ON kanban_app_task BEGIN
+        DELETE FROM kanban_search WHERE rowid = old.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_comment_insert AFTER INSERT ON kanban_app_comment BEGIN
+        INSERT INTO kanban_search (rowid, title, body, kind, object_id, task_id, board_id)
+        VALUES (
+            new.id * 2 + 1, NULL, new.content, 'comment', new.id, new.task_id,
+            (SELECT board_id FROM kanban_app_task WHERE id = new.task_id)
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_comment_update AFTER UPDATE OF content, task_id ON kanban_app_comment BEGIN
+        UPDATE kanban_search SET
+            body = new.content,
+            task_id = new.task_id,
+            board_id = (SELECT board_id FROM kanban_app_task WHERE id = new.task_id)
+        WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_comment_delete AFTER DELETE ON kanban_app_comment BEGIN
+        DELETE FROM kanban_search WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+]
+
+DROP = [
+    'DROP TRIGGER IF EXISTS kanban_search_comment_delete',
+    'DROP TRIGGER IF EXISTS kanban_search_comment_update',
+    'DROP TRIGGER IF EXISTS kanban_search_comment_insert',
+    'DROP TRIGGER IF EXISTS kanban_search_task_delete',
+    'DROP TRIGGER IF EXISTS kanban_search_task_update',
+    'DROP TRIGGER IF EXISTS kanban_search_task_insert',
+    'DROP TABLE IF EXISTS kanban_search',
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0013_task_comment_updated_at_boardchange'),
+    ]
+
+    operations = [
+        migrations.RunPython(run(CREATE), run(DROP)),
+    ]
@@ -5,14 +5,109 @@ This module defines:
 - Board: A Kanban board with an owner and member users.
 - Task: Work items tracked on a board, including status, priority, and assignment.
 - Comment: User-authored comments attached to tasks.
+- BoardStats: Denormalized per-board counters maintained on every write.
+- BoardChange: Tombstones and membership changes for incremental sync.
 """
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, Count, Exists, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.contrib.auth.models import User
 from datetime import date
 
 
+def count_subquery(queryset, field):
+    """
+    Build a correlated COUNT(*) subquery over `queryset` grouped by `field`.
+
+    The subquery is matched against the outer row's primary key and returns 0
+    instead of NULL when there are no related rows.
+    """
+    counted = (
+        queryset
+        .filter(**{field: OuterRef('pk')})
+        .order_by()
+        .values(field)
+        .annotate(count=Count('*'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counted), 0)
+
+
+class BoardQuerySet(models.QuerySet):
+    """
+    Custom queryset for boards.
+
+    Methods:
+        for_user: Boards the user owns or is a member of.
+        with_statistics: Annotates member and task counts in the same SQL statement.
+        bump_version: Increments the version of the selected boards.
+    """
+
+    def for_user(self, user):
+        """Return boards owned by `user` or having `user` as a member, without duplicates."""
+        memberships = Board.members.through.objects.filter(user=user).values('board_id')
+        return self.filter(Q(owner=user) | Q(id__in=memberships))
+
+    def with_statistics(self):
+        """Annotate member_count, ticket_count, tasks_to_do_count and tasks_high_prio_count."""
+        return self.annotate(
+            member_count=count_subquery(Board.members.through.objects.all(), 'board_id'),
+            ticket_count=count_subquery(Task.objects.all(), 'board_id'),
+            tasks_to_do_count=count_subquery(Task.objects.filter(status=Task.TO_DO), 'board_id'),
+            tasks_high_prio_count=count_subquery(Task.objects.filter(priority=Task.HIGH), 'board_id'),
+        )
+
+    def bump_version(self):
+        """Increment the version of the selected boards with a single UPDATE statement."""
+        return self.update(version=F('version') + 1)
+
+
+class TaskQuerySet(models.QuerySet):
+    """
+    Custom queryset for tasks.
+
+    Methods:
+        for_user: Tasks on boards the user owns or is a member of.
+        with_comments_count: Annotates the number of comments per task.
+        with_is_member: Annotates whether a user may access the task's board.
+        inbox_for: Tasks a user is assignee or reviewer of, annotated with the role.
+    """
+
+    def for_user(self, user):
+        """Return tasks whose board is owned by `user` or has `user` as a member."""
+        return self.filter(board__in=Board.objects.for_user(user).values('pk'))
+
+    def with_comments_count(self):
+        """Annotate comments_count as a correlated subquery instead of a per-task query."""
+        return self.annotate(
+            comments_count=count_subquery(Comment.objects.all(), 'task_id')
+        )
+
+    def inbox_for(self, user):
+        """
+        Return tasks where `user` is the assignee or the reviewer, with `role` annotated in SQL.
+
+        `role` is 'assignee', 'reviewer' or 'both'. The condition is served by
+        the (assignee, due_date) and (reviewer, due_date) indexes.
+        """
+        return self.filter(Q(assignee=user) | Q(reviewer=user)).annotate(
+            role=Case(
+                When(assignee=user, reviewer=user, then=Value(self.model.ROLE_BOTH)),
+                When(assignee=user, then=Value(self.model.ROLE_ASSIGNEE)),
+                default=Value(self.model.ROLE_REVIEWER),
+                output_field=models.CharField()
+            )
+        )
+
+    def with_is_member(self, user):
+        """Annotate is_member: True if `user` owns or is a member of the task's board."""
+        return self.annotate(
+            is_member=Exists(Board.objects.for_user(user).filter(pk=OuterRef('board_id')))
+        )
+
+
 class Board(models.Model):
     """
     Represents a Kanban board.
@@ -21,6 +116,8 @@ class Board(models.Model):
         title (str): Board title.
         owner (User): The user who created and owns the board.
         members (QuerySet[User]): Users who have access to the board.
+        version (int): Incremented whenever the board, its members, its tasks
+            or their comments change. Used as ETag for conditional requests.
     """
     title = models.CharField(max_length=50)
     owner = models.ForeignKey(
@@ -32,10 +129,40 @@ class Board(models.Model):
         User,
         related_name='member_of_boards'
     )
+    version = models.PositiveBigIntegerField(default=1, editable=False)
+
+    objects = BoardQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded owner so that owner changes can be detected on save."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_owner_id = instance.__dict__.get('owner_id')
+        return instance
     
     def __str__(self):
         """Return the board title as its string representation."""
         return self.title
+
+    def save(self, *args, **kwargs):
+        """
+        Save the board and create its statistics record in the same transaction.
+
+        Updates never write the in-memory version; it is incremented in the
+        database instead, so concurrent writers cannot reuse a version number.
+        """
+        adding = self._state.adding
+        if not adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname != 'version'
+            ]
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                BoardStats.objects.create(board=self)
+            else:
+                Board.objects.filter(pk=self.pk).bump_version()
     
 
 class Task(models.Model):
@@ -51,6 +178,7 @@ class Task(models.Model):
         priority (str): Task urgency level.
         due_date (date): Deadline for the task.
         board (Board): Board to which the task belongs.
+        updated_at (datetime): Timestamp of the last modification.
 
     Status values:
         to_do, in_progress, review, done
@@ -79,6 +207,10 @@ class Task(models.Model):
         (HIGH, "High")
     ]
 
+    ROLE_ASSIGNEE = "assignee"
+    ROLE_REVIEWER = "reviewer"
+    ROLE_BOTH = "both"
+
     title = models.CharField(max_length=50)
     description = models.TextField(max_length=500)
     assignee = models.ForeignKey(
@@ -109,11 +241,74 @@ class Task(models.Model):
         on_delete=models.CASCADE,
         related_name='tasks'
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'status'], name='task_board_status_idx'),
+            models.Index(fields=['board', 'priority'], name='task_board_priority_idx'),
+            models.Index(fields=['board', 'due_date'], name='task_board_due_idx'),
+            models.Index(fields=['assignee', 'due_date'], name='task_assignee_due_idx'),
+            models.Index(fields=['reviewer', 'due_date'], name='task_reviewer_due_idx'),
+            models.Index(fields=['board', 'updated_at'], name='task_board_updated_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded board, status and priority so that saves can update BoardStats by delta."""
+        instance = super().from_db(db, field_names, values)
+        instance._stats_snapshot = instance.get_stats_snapshot()
+        return instance
 
     def __str__(self):
         """Return the task title as its string representation."""
         return self.title
 
+    def get_stats_snapshot(self):
+        """
+        Return the part of the task that BoardStats counts.
+
+        Returns:
+            tuple: (board_id, is_to_do, is_high_priority), or None if one of the
+            fields was not loaded from the database.
+        """
+        values = self.__dict__
+        if not {'board_id', 'status', 'priority'} <= values.keys():
+            return None
+        return (
+            values['board_id'],
+            values['status'] == self.TO_DO,
+            values['priority'] == self.HIGH
+        )
+
+    def save(self, *args, **kwargs):
+        """Save the task and update the board statistics and version in the same transaction."""
+        adding = self._state.adding
+        previous = getattr(self, '_stats_snapshot', None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            current = self.get_stats_snapshot()
+            if adding:
+                BoardStats.apply_task_change(None, current)
+            elif previous is None:
+                BoardStats.rebuild([self.board_id])
+            else:
+                BoardStats.apply_task_change(previous, current)
+            board_ids = {self.board_id, previous[0] if previous else self.board_id}
+            Board.objects.filter(pk__in=board_ids).bump_version()
+        self._stats_snapshot = current
+
+    def delete(self, *args, **kwargs):
+        """Delete the task and update the board statistics and version in the same transaction."""
+        previous = getattr(self, '_stats_snapshot', None) or self.get_stats_snapshot()
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            BoardStats.apply_task_change(previous, None)
+            Board.objects.filter(pk=previous[0] if previous else self.board_id).bump_version()
+        return result
+
 
 class Comment(models.Model):
     """
@@ -124,6 +319,7 @@ class Comment(models.Model):
         author (User): User who authored the comment.
         content (str): Text content of the comment.
         task (Task): Associated task.
+        updated_at (datetime): Timestamp of the last modification.
     """
     created_at = models.DateTimeField(default=timezone.now)
     author = models.ForeignKey(
@@ -137,8 +333,196 @@ class Comment(models.Model):
         on_delete=models.CASCADE,
         related_name='comments'
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', 'created_at'], name='comment_task_created_idx'),
+            models.Index(fields=['task', 'updated_at'], name='comment_task_updated_idx'),
+        ]
 
     def __str__(self):
         """Return the comment content as its string representation."""
         return self.content
-    
+
+    def save(self, *args, **kwargs):
+        """Save the comment and increment the version of its board in the same transaction."""
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            Board.objects.filter(tasks=self.task_id).bump_version()
+
+    def delete(self, *args, **kwargs):
+        """Delete the comment and increment the version of its board in the same transaction."""
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            Board.objects.filter(tasks=self.task_id).bump_version()
+        return result
+
+
+class BoardStats(models.Model):
+    """
+    Denormalized statistics of a board.
+
+    The counters are kept up to date by Task.save(), Task.delete() and the
+    m2m_changed handler for Board.members, always in the same transaction as
+    the write itself. Bulk operations that bypass these hooks must call
+    BoardStats.rebuild(); the `rebuild_board_stats` management command
+    recomputes all counters from scratch.
+
+    Fields:
+        board (Board): The board the counters belong to (primary key).
+        member_count (int): Number of board members.
+        task_count (int): Number of tasks on the board.
+        to_do_count (int): Number of tasks with status "to_do".
+        high_prio_count (int): Number of tasks with priority "high".
+    """
+    board = models.OneToOneField(
+        Board,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+    member_count = models.PositiveIntegerField(default=0)
+    task_count = models.PositiveIntegerField(default=0)
+    to_do_count = models.PositiveIntegerField(default=0)
+    high_prio_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = 'board stats'
+
+    def __str__(self):
+        """Return a short description of the counters."""
+        return f'{self.board_id}: {self.task_count} tasks, {self.member_count} members'
+
+    @classmethod
+    def apply_task_change(cls, previous, current):
+        """
+        Apply the difference between two task snapshots to the counters.
+
+        Args:
+            previous: Snapshot before the write, or None for a created task.
+            current: Snapshot after the write, or None for a deleted task.
+        """
+        deltas = {}
+        for snapshot, sign in ((previous, -1), (current, 1)):
+            if snapshot is None:
+                continue
+            board_id, is_to_do, is_high = snapshot
+            counters = deltas.setdefault(board_id, {'task_count': 0, 'to_do_count': 0, 'high_prio_count': 0})
+            counters['task_count'] += sign
+            counters['to_do_count'] += sign * is_to_do
+            counters['high_prio_count'] += sign * is_high
+
+        for board_id, counters in deltas.items():
+            changes = {field: F(field) + delta for field, delta in counters.items() if delta}
+            if changes and not cls.objects.filter(board_id=board_id).update(**changes):
+                cls.rebuild([board_id])
+
+    @classmethod
+    def refresh_member_count(cls, board_ids):
+        """Recount the members of the given boards with a single UPDATE statement."""
+        cls.objects.filter(board_id__in=board_ids).update(
+            member_count=count_subquery(Board.members.through.objects.all(), 'board_id')
+        )
+
+    @classmethod
+    def rebuild(cls, board_ids=None, batch_size=1000):
+        """
+        Recompute the counters from the Task and membership tables.
+
+        Args:
+            board_ids: Boards to rebuild; all boards if None.
+            batch_size: Number of records written per INSERT ... ON CONFLICT statement.
+
+        Returns:
+            int: Number of boards rebuilt.
+        """
+        boards = Board.objects.with_statistics().order_by('pk')
+        if board_ids is not None:
+            boards = boards.filter(pk__in=board_ids)
+        rows = boards.values_list(
+            'pk',
+            'member_count',
+            'ticket_count',
+            'tasks_to_do_count',
+            'tasks_high_prio_count'
+        )
+
+        rebuilt = 0
+        batch = []
+        for board_id, members, tasks, to_do, high in rows.iterator(chunk_size=batch_size):
+            batch.append(cls(
+                board_id=board_id,
+                member_count=members,
+                task_count=tasks,
+                to_do_count=to_do,
+                high_prio_count=high
+            ))
+            if len(batch) >= batch_size:
+                rebuilt += cls._upsert(batch)
+                batch = []
+        if batch:
+            rebuilt += cls._upsert(batch)
+        return rebuilt
+
+    @classmethod
+    def _upsert(cls, batch):
+        cls.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=['board'],
+            update_fields=['member_count', 'task_count', 'to_do_count', 'high_prio_count']
+        )
+        return len(batch)
+
+
+class BoardChange(models.Model):
+    """
+    A change of a board that leaves no row with an `updated_at` behind.
+
+    Tasks and comments carry their own modification timestamp, so the delta
+    sync endpoint finds created and updated rows directly. This log records
+    the rest: tombstones of tasks and comments that were deleted (or, for
+    tasks, moved to another board) and members added to or removed from the
+    board. Entries are written by the handlers in kanban_app.signals.
+
+    The board reference has no database constraint, so that tombstones
+    written while a board is deleted do not block the deletion; the entries
+    of a deleted board are removed by a post_delete handler instead.
+
+    Fields:
+        board (Board): The board that changed.
+        kind (str): One of the KIND_CHOICES.
+        object_id (int): ID of the removed task or comment, or of the user.
+        changed_at (datetime): Timestamp of the change.
+    """
+
+    TASK_REMOVED = 'task_removed'
+    COMMENT_REMOVED = 'comment_removed'
+    MEMBER_ADDED = 'member_added'
+    MEMBER_REMOVED = 'member_removed'
+    KIND_CHOICES = [
+        (TASK_REMOVED, 'Task removed'),
+        (COMMENT_REMOVED, 'Comment removed'),
+        (MEMBER_ADDED, 'Member added'),
+        (MEMBER_REMOVED, 'Member removed')
+    ]
+
+    board = models.ForeignKey(
+        Board,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='changes'
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'changed_at'], name='boardchange_board_changed_idx'),
+        ]
+
+    def __str__(self):
+        """Return a short description of the change."""
+        return f'{self.board_id}: {self.kind} {self.object_id}'
@@ -0,0 +1,110 @@
+"""
+Per-user cache of read responses for Kanmind.
+
+The cached read views (BoardsView, BoardDetail, TasksAssignedToMeView,
+TasksReviewingView and DashboardView, see kanban_app.api.mixins.ResponseCacheMixin) store the
+serialized response data under a key made of the view, the user, the request
+path and the versions of all boards the response is derived from.
+
+Board.version is incremented by every write to a board, its members, its
+tasks and their comments (including writes through TaskCreateUpdateSerializer,
+BoardUpdateSerializer and the comment views), so a write changes the key of
+exactly the entries that contain the affected board and nothing has to be
+deleted explicitly. Stale entries simply expire.
+
+Data that is not versioned by a board (e.g. a user's name embedded in a task)
+may be served stale for up to TIMEOUT seconds.
+
+Configuration (settings.KANMIND_RESPONSE_CACHE):
+    CACHE_ALIAS (str): Django cache alias holding the entries. The default
+        alias is a local-memory cache; point it at a file-based or shared
+        backend (see settings.CACHES) to share entries between processes.
+    TIMEOUT (int): Seconds an entry is kept; 0 disables the cache.
+
+Hits and misses are counted in the same cache backend, see get_stats().
+"""
+
+import hashlib
+from django.conf import settings
+from django.core.cache import caches
+
+
+DEFAULTS = {
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 300,
+}
+
+CACHE_KEY = 'kanmind:response:{view}:{user_id}:{digest}'
+HITS_KEY = 'kanmind:response-stats:hits'
+MISSES_KEY = 'kanmind:response-stats:misses'
+
+
+def get_config():
+    """Return KANMIND_RESPONSE_CACHE merged with the defaults."""
+    return {**DEFAULTS, **getattr(settings, 'KANMIND_RESPONSE_CACHE', {})}
+
+
+def get_cache():
+    """Return the Django cache backend holding the responses."""
+    return caches[get_config()['CACHE_ALIAS']]
+
+
+def is_enabled():
+    """Return True if responses are cached at all."""
+    return bool(get_config()['TIMEOUT'])
+
+
+def make_key(view, user, path, versions):
+    """
+    Build the cache key of a response.
+
+    The user's join date is part of the digest, so that a user who gets the
+    ID of a deleted user never sees the deleted user's entries.
+
+    Args:
+        view (str): Name of the view.
+        user (User): The requesting user.
+        path (str): Full request path including the query string.
+        versions: Iterable of (board_id, version) pairs the response depends on.
+    """
+
+    parts = [
+        path,
+        user.date_joined.isoformat(),
+        *(f'{board_id}:{version}' for board_id, version in sorted(versions))
+    ]
+    digest = hashlib.sha1('|'.join(parts).encode()).hexdigest()
+    return CACHE_KEY.format(view=view, user_id=user.pk, digest=digest)
+
+
+def load(key):
+    """Return the cached response data for `key`, or None, and count the hit or miss."""
+    data = get_cache().get(key)
+    increment(HITS_KEY if data is not None else MISSES_KEY)
+    return data
+
+
+def store(key, data, timeout=None):
+    """Cache the response data for `key` for `timeout` seconds (default: TIMEOUT)."""
+    get_cache().set(key, data, get_config()['TIMEOUT'] if timeout is None else timeout)
+
+
+def increment(counter):
+    """Increment a counter that never expires, creating it if needed."""
+    backend = get_cache()
+    if not backend.add(counter, 1, None):
+        try:
+            backend.incr(counter)
+        except ValueError:
+            backend.set(counter, 1, None)
+
+
+def get_stats():
+    """Return the hit and miss counters as {'hits': int, 'misses': int}."""
+    counters = get_cache().get_many([HITS_KEY, MISSES_KEY])
+    return {'hits': counters.get(HITS_KEY, 0), 'misses': counters.get(MISSES_KEY, 0)}
+
+
+def reset_stats():
+    """Reset the hit and miss counters."""
+    get_cache().delete_many([HITS_KEY, MISSES_KEY])
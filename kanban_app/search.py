@@ -0,0 +1,146 @@
+"""
+Full-text search over tasks and comments for Kanmind.
+
+Task titles and descriptions and comment contents are indexed in the SQLite
+FTS5 table `kanban_search` (migration 0014_search_index). Triggers on the
+task and comment tables keep the index in sync with every INSERT, UPDATE and
+DELETE, including bulk_create, bulk_update and raw SQL writes. Each row also
+stores the board ID, so that results are restricted to the user's boards in
+the same statement as the match.
+
+search() ranks the matches with BM25, weighting task titles higher than
+descriptions and comments. rebuild() reindexes existing data, e.g. after
+the migration or after restoring a backup.
+
+Requires SQLite with the FTS5 extension (included in Python's sqlite3).
+"""
+
+import re
+from django.db import connection, connections, router, transaction
+from kanban_app.models import Board, Task
+
+
+TABLE = 'kanban_search'
+TITLE_WEIGHT = 5.0
+BODY_WEIGHT = 1.0
+SNIPPET_TOKENS = 12
+MAX_TERMS = 10
+
+TERM = re.compile(r'\w+')
+
+SEARCH_SQL = f"""
+    SELECT s.kind, s.object_id, s.task_id, s.board_id, t.title,
+           snippet({TABLE}, -1, '', '', '…', {SNIPPET_TOKENS})
+    FROM {TABLE} s
+    INNER JOIN kanban_app_task t ON t.id = s.task_id
+    WHERE {TABLE} MATCH %s AND s.board_id IN ({{boards}})
+    ORDER BY bm25({TABLE}, {TITLE_WEIGHT}, {BODY_WEIGHT}), s.rowid
+    LIMIT %s OFFSET %s
+"""
+
+BATCH_END_SQL = 'SELECT MAX(id) FROM (SELECT id FROM {table} WHERE id > %s ORDER BY id LIMIT %s)'
+
+INDEX_SQL = {
+    'kanban_app_task': f"""
+        INSERT INTO {TABLE} (rowid, title, body, kind, object_id, task_id, board_id)
+        SELECT id * 2, title, description, 'task', id, id, board_id
+        FROM kanban_app_task WHERE id > %s AND id <= %s
+    """,
+    'kanban_app_comment': f"""
+        INSERT INTO {TABLE} (rowid, title, body, kind, object_id, task_id, board_id)
+        SELECT c.id * 2 + 1, NULL, c.content, 'comment', c.id, c.task_id, t.board_id
+        FROM kanban_app_comment c INNER JOIN kanban_app_task t ON t.id = c.task_id
+        WHERE c.id > %s AND c.id <= %s
+    """,
+}
+
+
+def build_match_query(text):
+    """
+    Turn user input into an FTS5 query, or return None if it has no searchable terms.
+
+    Every word becomes a quoted term, so FTS5 operators in the input have no
+    effect and cannot cause syntax errors. All terms must match; the last one
+    also matches as a prefix, so results appear while the user is typing.
+    """
+
+    terms = TERM.findall(text or '')[:MAX_TERMS]
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def search(user, text):
+    """
+    Return the ranked matches on the boards `user` owns or is a member of.
+
+    Args:
+        user: The searching user.
+        text (str): The user's search input.
+
+    Returns:
+        SearchResults: Lazy results; slice them to run the query.
+    """
+
+    return SearchResults(user, build_match_query(text))
+
+
+class SearchResults:
+    """
+    Lazy, sliceable result list of search().
+
+    Slicing runs one query with LIMIT/OFFSET and returns dicts with type
+    ('task' or 'comment'), id, task, board, the task's title and a text
+    snippet around the match.
+    """
+
+    def __init__(self, user, query):
+        self.user = user
+        self.query = query
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice) or key.step is not None or key.start is None or key.stop is None:
+            raise TypeError('SearchResults only support slices with start and stop.')
+        if self.query is None or key.stop <= key.start:
+            return []
+        boards_sql, boards_params = Board.objects.for_user(self.user).values('pk').query.sql_with_params()
+        with connections[router.db_for_read(Task)].cursor() as cursor:
+            cursor.execute(
+                SEARCH_SQL.format(boards=boards_sql),
+                [self.query, *boards_params, key.stop - key.start, key.start]
+            )
+            rows = cursor.fetchall()
+        return [
+            {'type': kind, 'id': object_id, 'task': task_id, 'board': board_id, 'title': title, 'snippet': snippet}
+            for kind, object_id, task_id, board_id, title, snippet in rows
+        ]
+
+
+def rebuild(batch_size=5000, progress=None):
+    """
+    Reindex all tasks and comments in batches; return the number of indexed rows.
+
+    The index is emptied and refilled in one transaction, so searches never
+    see a partial index. `progress` is called with the running total after
+    every batch.
+    """
+
+    total = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE}')
+        for table, sql in INDEX_SQL.items():
+            last_id = 0
+            while True:
+                cursor.execute(BATCH_END_SQL.format(table=table), [last_id, batch_size])
+                end_id = cursor.fetchone()[0]
+                if end_id is None:
+                    break
+                cursor.execute(sql, [last_id, end_id])
+                total += cursor.rowcount
+                last_id = end_id
+                if progress:
+                    progress(total)
+        cursor.execute(f"INSERT INTO {TABLE} ({TABLE}) VALUES ('optimize')")
+    return total
@@ -0,0 +1,295 @@
+"""
+Signal handlers for the Kanban application of Kanmind.
+
+These handlers keep denormalized data in sync with writes that do not go
+through a model's save() or delete() method:
+- Board.members changes update BoardStats.member_count and Board.version,
+  including the memberships a deleted user loses without m2m_changed.
+- Deleting a user increments the version of every board whose tasks or
+  comments the deletion changes (assignee/reviewer set to NULL, comments
+  cascaded), since none of these writes goes through save() or delete().
+- Board.members and board owner changes invalidate cached board memberships.
+- Task, Comment, Board.members changes and board deletion publish board
+  events (kanban_app.events).
+- Deleted tasks and comments and Board.members changes, including those of
+  a deleted user, are recorded as BoardChange entries for the delta sync
+  endpoint.
+"""
+
+from django.contrib.auth.models import User
+from django.db.models import Q, QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from kanban_app import membership
+from kanban_app.events import publish_on_commit
+from kanban_app.models import Board, BoardChange, BoardStats, Task, Comment
+
+
+MEMBER_EVENT_TYPES = {
+    'post_add': 'members.added',
+    'post_remove': 'members.removed',
+    'post_clear': 'members.cleared',
+}
+
+
+def get_comment_board_id(comment):
+    """Return the board ID of a comment's task without loading the task if it is cached."""
+
+    if 'task' in comment._state.fields_cache:
+        return comment.task.board_id
+    return Task.objects.filter(pk=comment.task_id).values_list('board_id', flat=True).first()
+
+
+def is_cascade(origin):
+    """
+    Return True if a comment is deleted because its task, board or author is deleted.
+
+    The task.deleted or board.deleted event and the task tombstone already
+    cover the comments of deleted tasks and boards, and
+    update_boards_of_deleted_user() handles those of a deleted author in
+    bulk, so no per-comment event, tombstone or board lookup is needed.
+    """
+
+    if isinstance(origin, QuerySet):
+        return origin.model in (Task, Board, User)
+    return isinstance(origin, (Task, Board, User))
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def update_boards_on_member_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Recount the members, increment the version and publish a members event
+    for every board affected by a Board.members change.
+
+    Django runs m2m_changed inside the transaction of the add/remove/clear
+    call, so the boards are updated atomically with the membership itself.
+    For user.member_of_boards.clear() the affected boards are only known
+    before the rows are deleted, so they are collected on pre_clear.
+    """
+
+    if action == 'pre_clear' and reverse:
+        instance._cleared_board_ids = list(
+            instance.member_of_boards.values_list('pk', flat=True)
+        )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        board_ids = [instance.pk]
+    elif action == 'post_clear':
+        board_ids = instance.__dict__.pop('_cleared_board_ids', [])
+    else:
+        board_ids = pk_set
+    BoardStats.refresh_member_count(board_ids)
+    Board.objects.filter(pk__in=board_ids).bump_version()
+
+    event_type = MEMBER_EVENT_TYPES[action]
+    for board_id in board_ids:
+        user_ids = [instance.pk] if reverse else sorted(pk_set or ())
+        publish_on_commit({'type': event_type, 'board': board_id, 'users': user_ids})
+
+
+@receiver(pre_delete, sender=User)
+def collect_boards_of_deleted_user(sender, instance, **kwargs):
+    """
+    Remember what a user's deletion changes on other users' boards.
+
+    The deletion removes the Board.members rows without sending
+    m2m_changed, sets the assignee and reviewer of tasks to NULL with an
+    UPDATE and deletes the user's comments without Comment.delete(), so
+    update_boards_of_deleted_user() updates the boards afterwards. Boards the
+    user owns are deleted with the user and skipped.
+    """
+
+    instance._member_board_ids = list(
+        instance.member_of_boards.exclude(owner=instance).values_list('pk', flat=True)
+    )
+    instance._deleted_comments = list(
+        Comment.objects.filter(author=instance)
+        .exclude(task__board__owner=instance)
+        .values_list('pk', 'task_id', 'task__board_id')
+    )
+    tasks = (
+        Task.objects.filter(Q(assignee=instance) | Q(reviewer=instance))
+        .exclude(board__owner=instance)
+        .values_list('board_id', flat=True)
+    )
+    instance._changed_board_ids = set(tasks)
+
+
+@receiver(post_delete, sender=User)
+def update_boards_of_deleted_user(sender, instance, **kwargs):
+    """
+    Update the boards a deleted user left or commented on.
+
+    Recounts their members, increments their versions, records the
+    member_removed and comment_removed tombstones for the delta sync and
+    publishes members.removed and comment.deleted.
+    """
+
+    member_board_ids = instance.__dict__.pop('_member_board_ids', [])
+    comments = instance.__dict__.pop('_deleted_comments', [])
+    board_ids = instance.__dict__.pop('_changed_board_ids', set())
+    board_ids.update(member_board_ids, (board_id for _, _, board_id in comments))
+    if not board_ids:
+        return
+    BoardStats.refresh_member_count(member_board_ids)
+    Board.objects.filter(pk__in=board_ids).bump_version()
+    BoardChange.objects.bulk_create([
+        *(BoardChange(board_id=board_id, kind=BoardChange.MEMBER_REMOVED, object_id=instance.pk)
+          for board_id in member_board_ids),
+        *(BoardChange(board_id=board_id, kind=BoardChange.COMMENT_REMOVED, object_id=comment_id)
+          for comment_id, _, board_id in comments),
+    ])
+    for board_id in member_board_ids:
+        publish_on_commit({'type': 'members.removed', 'board': board_id, 'users': [instance.pk]})
+    for comment_id, task_id, board_id in comments:
+        publish_on_commit({'type': 'comment.deleted', 'board': board_id, 'id': comment_id, 'task': task_id})
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def invalidate_memberships_on_member_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalidate the cached board IDs of every user whose membership changed."""
+
+    if reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            membership.invalidate([instance.pk])
+        return
+
+    if action == 'pre_clear':
+        instance._cleared_member_ids = list(
+            instance.members.values_list('pk', flat=True)
+        )
+    elif action in ('post_add', 'post_remove'):
+        membership.invalidate(pk_set)
+    elif action == 'post_clear':
+        membership.invalidate(instance.__dict__.pop('_cleared_member_ids', []))
+
+
+@receiver(post_save, sender=Board)
+def invalidate_memberships_on_owner_change(sender, instance, created, **kwargs):
+    """Invalidate the cached board IDs of the new and the previous owner of a board."""
+
+    previous_owner_id = instance.__dict__.get('_loaded_owner_id')
+    if created or previous_owner_id != instance.owner_id:
+        membership.invalidate([previous_owner_id, instance.owner_id])
+    instance._loaded_owner_id = instance.owner_id
+
+
+@receiver(pre_delete, sender=Board)
+def invalidate_memberships_on_board_delete(sender, instance, **kwargs):
+    """Invalidate the cached board IDs of the owner and all members of a deleted board."""
+
+    member_ids = list(instance.members.values_list('pk', flat=True))
+    membership.invalidate([instance.owner_id, *member_ids])
+
+
+@receiver(post_delete, sender=Board)
+def publish_board_deleted(sender, instance, **kwargs):
+    """Publish board.deleted so open event streams of the board are closed."""
+    publish_on_commit({'type': 'board.deleted', 'board': instance.pk})
+
+
+@receiver(post_save, sender=Task)
+def publish_task_saved(sender, instance, created, **kwargs):
+    """Publish task.created or task.updated, and task.deleted on the old board when a task moved."""
+
+    previous = getattr(instance, '_stats_snapshot', None)
+    if previous and previous[0] != instance.board_id:
+        publish_on_commit({'type': 'task.deleted', 'board': previous[0], 'id': instance.pk})
+    publish_on_commit({
+        'type': 'task.created' if created else 'task.updated',
+        'board': instance.board_id,
+        'id': instance.pk
+    })
+
+
+@receiver(post_delete, sender=Task)
+def publish_task_deleted(sender, instance, **kwargs):
+    """Publish task.deleted."""
+    publish_on_commit({'type': 'task.deleted', 'board': instance.board_id, 'id': instance.pk})
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def publish_comment_changed(sender, instance, created=None, origin=None, **kwargs):
+    """Publish comment.created, comment.updated or comment.deleted."""
+
+    if is_cascade(origin):
+        return
+    board_id = get_comment_board_id(instance)
+    if board_id is None:
+        return
+    action = 'deleted' if created is None else 'created' if created else 'updated'
+    publish_on_commit({
+        'type': f'comment.{action}',
+        'board': board_id,
+        'id': instance.pk,
+        'task': instance.task_id
+    })
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def record_member_changes(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Record a BoardChange for every membership added or removed.
+
+    The memberships removed by clear() are only known before the rows are
+    deleted, so they are recorded on pre_clear, in the same transaction.
+    """
+
+    if action == 'pre_clear':
+        kind = BoardChange.MEMBER_REMOVED
+        if reverse:
+            pk_set = instance.member_of_boards.values_list('pk', flat=True)
+        else:
+            pk_set = instance.members.values_list('pk', flat=True)
+    elif action in ('post_add', 'post_remove'):
+        kind = BoardChange.MEMBER_ADDED if action == 'post_add' else BoardChange.MEMBER_REMOVED
+    else:
+        return
+
+    BoardChange.objects.bulk_create([
+        BoardChange(board_id=pk, kind=kind, object_id=instance.pk) if reverse
+        else BoardChange(board_id=instance.pk, kind=kind, object_id=pk)
+        for pk in pk_set
+    ])
+
+
+@receiver(post_save, sender=Task)
+def record_task_moved(sender, instance, created, **kwargs):
+    """Record a tombstone on the previous board of a task that moved to another board."""
+
+    previous = getattr(instance, '_stats_snapshot', None)
+    if not created and previous and previous[0] != instance.board_id:
+        BoardChange.objects.create(board_id=previous[0], kind=BoardChange.TASK_REMOVED, object_id=instance.pk)
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Comment)
+def record_tombstone(sender, instance, origin=None, **kwargs):
+    """
+    Record a tombstone for a deleted task or comment.
+
+    Nothing is recorded when the deletion cascades from a deleted board, nor
+    for comments deleted together with their task or their author (see
+    update_boards_of_deleted_user()).
+    """
+
+    if isinstance(origin, Board):
+        return
+    if sender is Task:
+        board_id, kind = instance.board_id, BoardChange.TASK_REMOVED
+    elif is_cascade(origin):
+        return
+    else:
+        board_id, kind = get_comment_board_id(instance), BoardChange.COMMENT_REMOVED
+    if board_id is not None:
+        BoardChange.objects.create(board_id=board_id, kind=kind, object_id=instance.pk)
+
+
+@receiver(post_delete, sender=Board)
+def delete_board_changes(sender, instance, **kwargs):
+    """Remove the change log of a deleted board (BoardChange.board has no database constraint)."""
+    BoardChange.objects.filter(board_id=instance.pk).delete()
@@ -1,3 +1,1596 @@
-#from django.test import TestCase
+"""
+Tests for the Kanmind Kanban API.
 
-# Create your tests here.
+These tests focus on the number of SQL queries the endpoints run, so that
+performance fixes in the views and serializers are not silently undone.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+from asgiref.sync import sync_to_async
+from unittest import skipUnless
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+from rest_framework.views import APIView
+from auth_app.api import views as auth_views
+from core.middleware import RequestRecorder
+from core.sqlite import apply_pragmas, get_pragmas, get_statements
+from kanban_app import membership, response_cache
+from kanban_app.events import FileBackend, get_hub, make_ticket, read_ticket
+from kanban_app.api import views as kanban_views
+from kanban_app.api.mixins import ResponseCacheMixin
+from kanban_app.api.serializers import CommentSerializer, TaskAssignedOrReviewingSerializer, TaskSerializer, UserMiniSerializer
+from kanban_app.api.values_serializers import CommentValuesSerializer, TaskAssignedOrReviewingValuesSerializer, TaskValuesSerializer, UserMiniValuesSerializer
+from kanban_app.models import Board, BoardChange, BoardStats, Task, Comment
+
+
+def create_user(name):
+    """Create a user whose username and email are derived from `name`."""
+    return User.objects.create_user(
+        username=f'{name}@example.com',
+        email=f'{name}@example.com',
+        password='secret-pass',
+        first_name=name.capitalize(),
+        last_name='Tester'
+    )
+
+
+def create_board(owner, members=(), tasks=0, title='Board'):
+    """Create a board with the given members and a number of tasks of mixed status and priority."""
+    board = Board.objects.create(owner=owner, title=title)
+    board.members.set(members)
+    statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+    priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+    for index in range(tasks):
+        Task.objects.create(
+            board=board,
+            title=f'Task {index}',
+            description='Description',
+            status=statuses[index % len(statuses)],
+            priority=priorities[index % len(priorities)]
+        )
+    return board
+
+
+class BoardsViewQueryTests(APITestCase):
+    """
+    Query-count tests for GET /api/boards/.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.client.force_authenticate(self.user)
+
+    def test_statistics_are_annotated(self):
+        board = create_board(self.user, members=[self.user, self.other], tasks=8)
+
+        response = self.client.get(reverse('boards-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{
+            'id': board.id,
+            'title': 'Board',
+            'member_count': 2,
+            'ticket_count': 8,
+            'tasks_to_do_count': 2,
+            'tasks_high_prio_count': 2,
+            'owner_id': self.user.id
+        }])
+
+    def test_boards_as_member_are_listed_once(self):
+        create_board(self.other, members=[self.user, self.other])
+
+        response = self.client.get(reverse('boards-list'))
+
+        self.assertEqual(len(response.data), 1)
+
+    def test_query_count_does_not_grow_with_boards(self):
+        # Response cache misses: the board versions for the key, then the boards.
+        create_board(self.user, members=[self.other], tasks=3)
+        with self.assertNumQueries(2):
+            self.client.get(reverse('boards-list'))
+
+        for index in range(10):
+            create_board(self.other, members=[self.user], tasks=3, title=f'Board {index}')
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('boards-list'))
+
+        self.assertEqual(len(response.data), 11)
+
+
+class BoardDetailQueryTests(APITestCase):
+    """
+    Query-count tests for GET /api/boards/<pk>/.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.client.force_authenticate(self.user)
+
+    def test_tasks_embed_users_and_comment_counts(self):
+        board = create_board(self.user, members=[self.other], tasks=1)
+        task = board.tasks.get()
+        task.assignee = self.other
+        task.save()
+        Comment.objects.create(task=task, author=self.user, content='First')
+        Comment.objects.create(task=task, author=self.other, content='Second')
+
+        response = self.client.get(reverse('board-detail', args=[board.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['members'], [
+            {'id': self.other.id, 'email': self.other.email, 'fullname': 'Member Tester'}
+        ])
+        embedded = response.data['tasks'][0]
+        self.assertEqual(embedded['assignee']['fullname'], 'Member Tester')
+        self.assertIsNone(embedded['reviewer'])
+        self.assertEqual(embedded['comments_count'], 2)
+
+    def test_query_count_does_not_grow_with_tasks(self):
+        small = create_board(self.user, members=[self.other], tasks=2)
+        large = create_board(self.user, members=[self.other, create_user('third')], tasks=40)
+        for task in large.tasks.all():
+            task.assignee = self.other
+            task.reviewer = self.user
+            task.save()
+            Comment.objects.create(task=task, author=self.other, content='Note')
+
+        with self.assertNumQueries(4):
+            self.client.get(reverse('board-detail', args=[small.id]))
+        with self.assertNumQueries(4):
+            self.client.get(reverse('board-detail', args=[large.id]))
+
+    def test_members_can_read_the_board(self):
+        board = create_board(self.other, members=[self.user])
+
+        response = self.client.get(reverse('board-detail', args=[board.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_unknown_or_invalid_members_are_rejected(self):
+        board = create_board(self.user, members=[self.other])
+        url = reverse('board-detail', args=[board.id])
+
+        unknown = self.client.patch(url, {'members': [self.other.id, 999999]}, format='json')
+        invalid = self.client.patch(url, {'members': ['abc']}, format='json')
+
+        self.assertEqual(unknown.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('999999', str(unknown.data['members']))
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(board.members.all()), [self.other])
+
+
+class BoardStatsTests(APITestCase):
+    """
+    Tests for the denormalized BoardStats counters.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+
+    def assertStats(self, board, **expected):
+        stats = BoardStats.objects.get(board=board)
+        actual = {field: getattr(stats, field) for field in expected}
+        self.assertEqual(actual, expected)
+
+    def test_counters_follow_task_writes(self):
+        board = create_board(self.user)
+        task = Task.objects.create(board=board, title='T', description='D', status=Task.TO_DO, priority=Task.HIGH)
+        self.assertStats(board, task_count=1, to_do_count=1, high_prio_count=1)
+
+        task = Task.objects.get(pk=task.pk)
+        task.status = Task.DONE
+        task.save()
+        self.assertStats(board, task_count=1, to_do_count=0, high_prio_count=1)
+
+        task.delete()
+        self.assertStats(board, task_count=0, to_do_count=0, high_prio_count=0)
+
+    def test_moving_a_task_updates_both_boards(self):
+        source = create_board(self.user, tasks=4)
+        target = create_board(self.user)
+        task = source.tasks.filter(status=Task.TO_DO).get()
+
+        task.board = target
+        task.save()
+
+        self.assertStats(source, task_count=3, to_do_count=0)
+        self.assertStats(target, task_count=1, to_do_count=1)
+
+    def test_member_count_follows_membership_changes(self):
+        board = create_board(self.user, members=[self.user, self.other])
+        self.assertStats(board, member_count=2)
+
+        board.members.remove(self.user)
+        self.assertStats(board, member_count=1)
+
+        self.user.member_of_boards.add(board)
+        self.assertStats(board, member_count=2)
+
+        self.other.member_of_boards.clear()
+        self.assertStats(board, member_count=1)
+
+    def test_deleting_a_member_updates_count_and_version(self):
+        board = create_board(self.user, members=[self.user, self.other])
+        version = Board.objects.get(pk=board.pk).version
+
+        self.other.delete()
+
+        self.assertStats(board, member_count=1)
+        self.assertGreater(Board.objects.get(pk=board.pk).version, version)
+
+    def test_rebuild_command_fixes_drift(self):
+        board = create_board(self.user, members=[self.other], tasks=5)
+        BoardStats.objects.filter(board=board).update(member_count=9, task_count=0, to_do_count=7)
+
+        call_command('rebuild_board_stats', stdout=StringIO())
+
+        self.assertStats(board, member_count=1, task_count=5, to_do_count=2, high_prio_count=1)
+
+
+class TasksViewListTests(APITestCase):
+    """
+    Tests for the scoped, cursor-paginated GET /api/tasks/.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('stranger')
+        self.client.force_authenticate(self.user)
+
+    def test_only_tasks_of_own_boards_are_listed(self):
+        own = create_board(self.user, tasks=2)
+        shared = create_board(self.other, members=[self.user], tasks=1)
+        create_board(self.other, tasks=5)
+
+        response = self.client.get(reverse('tasks-list'))
+
+        expected = set(own.tasks.values_list('id', flat=True)) | set(shared.tasks.values_list('id', flat=True))
+        self.assertEqual({task['id'] for task in response.data['results']}, expected)
+
+    def test_pages_follow_the_cursor(self):
+        board = create_board(self.user, tasks=5)
+
+        first = self.client.get(reverse('tasks-list'), {'page_size': 2})
+        with self.assertNumQueries(1):
+            second = self.client.get(first.data['next'])
+
+        ids = list(board.tasks.order_by('id').values_list('id', flat=True))
+        self.assertEqual([task['id'] for task in first.data['results']], ids[:2])
+        self.assertEqual([task['id'] for task in second.data['results']], ids[2:4])
+
+
+class TaskFilterTests(APITestCase):
+    """
+    Tests for the filter and ordering query parameters of the task lists.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.board = create_board(self.user, tasks=6)
+        self.other_board = create_board(self.user, tasks=2)
+        today = timezone.localdate()
+        for index, task in enumerate(Task.objects.order_by('pk')):
+            task.due_date = today + timedelta(days=index)
+            task.assignee = self.user
+            task.save()
+        self.today = today
+        self.client.force_authenticate(self.user)
+
+    def get_ids(self, name, **params):
+        response = self.client.get(reverse(name), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data
+        return [task['id'] for task in (data['results'] if isinstance(data, dict) else data)]
+
+    def test_filters_are_combined(self):
+        due_to = self.today + timedelta(days=6)
+        expected = list(
+            self.board.tasks.filter(status__in=[Task.TO_DO, Task.REVIEW], due_date__lte=due_to)
+            .order_by('pk').values_list('pk', flat=True)
+        )
+
+        with self.assertNumQueries(1):
+            ids = self.get_ids('tasks-list', board=self.board.id, status='to_do,review', due_to=due_to)
+
+        self.assertEqual(ids, expected)
+        self.assertEqual(
+            self.get_ids('tasks-assigned-to-me', priority='high', board=self.other_board.id),
+            list(self.other_board.tasks.filter(priority=Task.HIGH).values_list('pk', flat=True))
+        )
+
+    def test_ordering_is_whitelisted_and_paginated(self):
+        expected = list(Task.objects.order_by('-due_date').values_list('pk', flat=True))
+
+        first = self.client.get(reverse('tasks-list'), {'ordering': '-due_date', 'page_size': 5})
+        second = self.client.get(first.data['next'])
+
+        self.assertEqual([task['id'] for task in first.data['results'] + second.data['results']], expected)
+        self.assertEqual(self.get_ids('tasks-list', ordering='description'), sorted(expected))
+
+    def test_invalid_values_are_rejected(self):
+        for params in ({'status': 'later'}, {'board': 'x'}, {'due_from': '2030-01-02', 'due_to': '2030-01-01'}):
+            response = self.client.get(reverse('tasks-reviewing'), params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+
+class TasksInboxViewTests(APITestCase):
+    """
+    Tests for the combined assigned/reviewing list of GET /api/tasks/inbox/.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        board = create_board(self.user, members=[self.other], tasks=5)
+        today = timezone.localdate()
+        roles = [(self.user, None), (None, self.user), (self.user, self.user), (self.other, self.other), (None, None)]
+        self.tasks = list(board.tasks.order_by('pk'))
+        for index, (task, (assignee, reviewer)) in enumerate(zip(self.tasks, roles)):
+            task.assignee, task.reviewer = assignee, reviewer
+            task.due_date = today + timedelta(days=5 - index)
+            task.save()
+        self.client.force_authenticate(self.user)
+
+    def test_both_roles_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('tasks-inbox'))
+
+        rows = [(task['id'], task['role']) for task in response.data['results']]
+        self.assertEqual(rows, [(self.tasks[2].id, 'both'), (self.tasks[1].id, 'reviewer'), (self.tasks[0].id, 'assignee')])
+        self.assertEqual(response.data['results'][0]['comments_count'], 0)
+
+    def test_pages_sorted_by_due_date_descending(self):
+        first = self.client.get(reverse('tasks-inbox'), {'ordering': '-due_date', 'page_size': 2})
+        second = self.client.get(first.data['next'])
+
+        ids = [task['id'] for task in first.data['results'] + second.data['results']]
+        self.assertEqual(ids, [task.id for task in self.tasks[:3]])
+
+
+class DashboardViewTests(APITestCase):
+    """
+    Tests for the per-user summary of GET /api/dashboard/.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.board = create_board(self.user, members=[self.other], tasks=4, title='Main')
+        self.shared = create_board(self.other, members=[self.user], tasks=1, title='Shared')
+        create_board(self.other, tasks=3, title='Foreign')
+        today = timezone.localdate()
+        tasks = list(self.board.tasks.order_by('pk'))
+        # Statuses cycle through to_do, in_progress, review, done.
+        for task, due_date in zip(tasks, (today - timedelta(days=1), today + timedelta(days=3), today + timedelta(days=30), today - timedelta(days=5))):
+            task.assignee = self.user
+            task.due_date = due_date
+            task.save()
+        self.shared.tasks.update(reviewer=self.user)
+        self.client.force_authenticate(self.user)
+
+    def test_summary_comes_from_one_grouped_query(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('dashboard'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            'assigned': {'to_do': 1, 'in_progress': 1, 'review': 1, 'done': 1, 'total': 4},
+            'reviewing': 1,
+            'overdue': 1,
+            'due_soon': 1,
+            'due_soon_days': 7,
+            'boards': [
+                {'id': self.board.id, 'title': 'Main', 'tasks': 4},
+                {'id': self.shared.id, 'title': 'Shared', 'tasks': 1}
+            ]
+        })
+        self.assertEqual(self.client.get(reverse('dashboard'), {'days': 30}).data['due_soon'], 2)
+        self.assertEqual(self.client.get(reverse('dashboard'), {'days': 'soon'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_task_writes_invalidate_the_cache(self):
+        self.client.get(reverse('dashboard'))
+        with self.assertNumQueries(1):
+            cached = self.client.get(reverse('dashboard'))
+        self.assertEqual(cached['X-Cache'], 'HIT')
+
+        task = self.board.tasks.filter(status=Task.TO_DO).get()
+        task.status = Task.DONE
+        task.save()
+
+        response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['assigned']['done'], 2)
+
+
+class TaskDetailUpdateTests(APITestCase):
+    """
+    Tests for PUT and PATCH /api/tasks/<pk>/.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.board = create_board(self.user, tasks=1)
+        self.task = self.board.tasks.get()
+        self.client.force_authenticate(self.user)
+
+    def test_put_with_the_own_board_updates_the_task(self):
+        response = self.client.put(reverse('task-detail', args=[self.task.id]), {
+            'board': self.board.id,
+            'title': 'Renamed',
+            'description': 'Updated',
+            'status': Task.DONE,
+            'priority': Task.LOW,
+            'due_date': '2030-01-01'
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.status), ('Renamed', Task.DONE))
+
+    def test_moving_to_another_board_is_rejected(self):
+        other = create_board(self.user)
+
+        response = self.client.patch(reverse('task-detail', args=[self.task.id]), {'board': other.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('board', response.data)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.board_id, self.board.id)
+
+
+@override_settings(KANMIND_MEMBERSHIP_CACHE_TIMEOUT=60)
+class MembershipCacheTests(APITestCase):
+    """
+    Tests for the cross-request cache of accessible board IDs.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user('owner')
+        self.other = create_user('member')
+
+    def test_cached_ids_are_reused(self):
+        board = create_board(self.user)
+        self.assertEqual(membership.load_board_ids(self.user), {board.id})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(membership.load_board_ids(self.user), {board.id})
+
+    def test_member_changes_invalidate(self):
+        board = create_board(self.user)
+        self.assertEqual(membership.load_board_ids(self.other), set())
+
+        board.members.add(self.other)
+        self.assertEqual(membership.load_board_ids(self.other), {board.id})
+
+        self.other.member_of_boards.clear()
+        self.assertEqual(membership.load_board_ids(self.other), set())
+
+    def test_owner_change_and_delete_invalidate(self):
+        board = create_board(self.user)
+        self.assertEqual(membership.load_board_ids(self.user), {board.id})
+        self.assertEqual(membership.load_board_ids(self.other), set())
+
+        board = Board.objects.get(pk=board.pk)
+        board.owner = self.other
+        board.save()
+        self.assertEqual(membership.load_board_ids(self.user), set())
+        self.assertEqual(membership.load_board_ids(self.other), {board.id})
+
+        board.delete()
+        self.assertEqual(membership.load_board_ids(self.other), set())
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Plan lines are checked in SQLite EXPLAIN QUERY PLAN format.')
+class QueryPlanTests(APITestCase):
+    """
+    Reads the database query plan of every query the read endpoints run and
+    fails if one of them needs a full table scan instead of an index.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.board = create_board(self.user, members=[self.other], tasks=4)
+        self.task = self.board.tasks.first()
+        self.task.assignee = self.user
+        self.task.reviewer = self.other
+        self.task.save()
+        Comment.objects.create(task=self.task, author=self.user, content='Note')
+        self.client.force_authenticate(self.user)
+
+    def capture_queries(self, url):
+        """Request `url` and return the (sql, params) of every statement it ran."""
+        queries = []
+
+        def record(execute, sql, params, many, context):
+            queries.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+        return queries
+
+    def explain(self, sql, params):
+        """Return the plan lines of `sql` as reported by the database."""
+        prefix = connection.ops.explain_query_prefix()
+        with connection.cursor() as cursor:
+            cursor.execute(f'{prefix} {sql}', params)
+            return [' '.join(str(column) for column in row) for row in cursor.fetchall()]
+
+    def test_read_endpoints_use_indexes(self):
+        urls = [
+            reverse('boards-list'),
+            reverse('board-detail', args=[self.board.id]),
+            reverse('tasks-list'),
+            reverse('tasks-assigned-to-me'),
+            reverse('tasks-reviewing'),
+            reverse('comments-list', args=[self.task.id]),
+            reverse('email-check') + '?email=member@example.com',
+            reverse('board-changes', args=[self.board.id]) + '?since=1',
+            reverse('tasks-list') + f'?board={self.board.id}&priority=high&due_from=2020-01-01&due_to=2030-01-01',
+            reverse('tasks-list') + '?status=to_do,review&ordering=-due_date',
+            reverse('tasks-assigned-to-me') + '?due_from=2020-01-01&due_to=2030-01-01&ordering=due_date',
+            reverse('dashboard'),
+            reverse('tasks-inbox') + '?ordering=-due_date&status=to_do',
+        ]
+        for url in urls:
+            for sql, params in self.capture_queries(url):
+                plan = self.explain(sql, params)
+                scans = [line for line in plan if ' SCAN ' in f' {line} ' and 'INDEX' not in line]
+                self.assertEqual(scans, [], f'{url}: {sql}')
+
+
+class TaskBatchViewTests(APITestCase):
+    """
+    Tests for POST /api/boards/<pk>/tasks/batch/.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.board = create_board(self.user, members=[self.other], tasks=3)
+        self.client.force_authenticate(self.user)
+
+    def new_task(self, index):
+        return {
+            'title': f'New {index}',
+            'description': 'Imported',
+            'status': Task.TO_DO,
+            'priority': Task.HIGH,
+            'assignee_id': self.other.id,
+            'due_date': '2030-01-01'
+        }
+
+    def test_batch_is_applied_and_stats_rebuilt(self):
+        first, second, third = self.board.tasks.order_by('id')
+        url = reverse('board-tasks-batch', args=[self.board.id])
+
+        response = self.client.post(url, {
+            'create': [self.new_task(index) for index in range(50)],
+            'update': [{'id': first.id, 'status': Task.DONE, 'reviewer_id': self.user.id}],
+            'delete': [second.id]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['create']), 50)
+        self.assertEqual(response.data['update'], [{'id': first.id, 'result': 'updated'}])
+        self.assertEqual(response.data['delete'], [{'id': second.id, 'result': 'deleted'}])
+        first.refresh_from_db()
+        self.assertEqual((first.status, first.reviewer_id), (Task.DONE, self.user.id))
+        self.assertFalse(Task.objects.filter(pk=second.pk).exists())
+        stats = BoardStats.objects.get(board=self.board)
+        self.assertEqual(stats.task_count, 52)
+        self.assertEqual(stats.to_do_count, 50 + (third.status == Task.TO_DO))
+
+    def test_invalid_items_reject_the_whole_batch(self):
+        foreign = create_board(self.other, tasks=1).tasks.get()
+        url = reverse('board-tasks-batch', args=[self.board.id])
+
+        response = self.client.post(url, {
+            'create': [self.new_task(0), {**self.new_task(1), 'assignee_id': 999999}],
+            'update': [{'id': foreign.id, 'title': 'Stolen'}],
+            'delete': [foreign.id]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['create'][0], {})
+        self.assertIn('assignee_id', response.data['create'][1])
+        self.assertIn('id', response.data['update'][0])
+        self.assertIn('id', response.data['delete'][0])
+        self.assertEqual(self.board.tasks.count(), 3)
+
+    def test_field_errors_are_reported_per_item(self):
+        task = self.board.tasks.first()
+        url = reverse('board-tasks-batch', args=[self.board.id])
+
+        response = self.client.post(url, {
+            'create': [self.new_task(0), {'title': 'Incomplete'}, {**self.new_task(2), 'due_date': 'soon'}],
+            'update': [{'id': 'first', 'title': 'Renamed'}, {'id': task.id, 'status': 'later'}]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        create, update = response.data['create'], response.data['update']
+        self.assertEqual(create[0], {})
+        self.assertEqual(set(create[1]), {'description', 'status', 'priority', 'due_date'})
+        self.assertEqual(set(create[2]), {'due_date'})
+        self.assertEqual(set(update[0]), {'id'})
+        self.assertEqual(set(update[1]), {'status'})
+        self.assertEqual(response.data['delete'], [])
+        self.assertEqual(self.board.tasks.count(), 3)
+
+    def test_non_members_are_rejected(self):
+        board = create_board(self.other)
+        url = reverse('board-tasks-batch', args=[board.id])
+
+        response = self.client.post(url, {'create': [self.new_task(0)]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ConditionalGetTests(APITestCase):
+    """
+    Tests for the ETag / If-None-Match handling of BoardDetail, TaskDetail and CommentsView.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.board = create_board(self.user, members=[self.other], tasks=2)
+        self.task = self.board.tasks.first()
+        self.client.force_authenticate(self.user)
+
+    def assertNotModifiedUntilChange(self, url, change, queries=2):
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(queries):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        change()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_board_detail_changes_with_members(self):
+        url = reverse('board-detail', args=[self.board.id])
+        self.assertNotModifiedUntilChange(url, lambda: self.board.members.remove(self.other))
+
+    def test_board_detail_changes_with_board(self):
+        def rename():
+            board = Board.objects.get(pk=self.board.pk)
+            board.title = 'Renamed'
+            board.save()
+
+        url = reverse('board-detail', args=[self.board.id])
+        self.assertNotModifiedUntilChange(url, rename)
+
+    def test_task_detail_changes_when_a_referenced_user_is_deleted(self):
+        reviewer = create_user('reviewer')
+        Task.objects.filter(pk=self.task.pk).update(reviewer=reviewer)
+
+        url = reverse('task-detail', args=[self.task.id])
+        self.assertNotModifiedUntilChange(url, reviewer.delete)
+
+    def test_comments_change_when_their_author_is_deleted(self):
+        author = create_user('author')
+        Comment.objects.bulk_create([Comment(task=self.task, author=author, content='Note')])
+
+        url = reverse('comments-list', args=[self.task.id])
+        self.assertNotModifiedUntilChange(url, author.delete, queries=1)
+
+    def test_task_detail_changes_with_tasks(self):
+        url = reverse('task-detail', args=[self.task.id])
+        self.assertNotModifiedUntilChange(url, lambda: self.board.tasks.last().delete())
+
+    def test_comments_change_with_comments(self):
+        url = reverse('comments-list', args=[self.task.id])
+        # Board version and membership are loaded in one query.
+        self.assertNotModifiedUntilChange(
+            url, lambda: Comment.objects.create(task=self.task, author=self.other, content='New'), queries=1
+        )
+
+    def test_non_members_get_no_etag(self):
+        self.client.force_authenticate(create_user('stranger'))
+
+        response = self.client.get(reverse('board-detail', args=[self.board.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertNotIn('ETag', response)
+
+
+class AsyncViewsTests(APITestCase):
+    """
+    Tests that the async read views return exactly what their synchronous counterparts return.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.board = create_board(self.user, members=[self.other], tasks=3)
+        self.task = self.board.tasks.first()
+        self.task.assignee = self.user
+        self.task.reviewer = self.other
+        self.task.save()
+        Comment.objects.create(task=self.task, author=self.other, content='Note')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    async def test_responses_match_sync_views(self):
+        routes = [
+            ('boards-list', [], ''),
+            ('board-detail', [self.board.id], ''),
+            ('tasks-assigned-to-me', [], ''),
+            ('tasks-assigned-to-me', [], '?status=to_do,done&ordering=-title'),
+            ('tasks-reviewing', [], ''),
+            ('tasks-reviewing', [], '?priority=urgent'),
+            ('comments-list', [self.task.id], ''),
+        ]
+        for name, args, query in routes:
+            sync_response = await sync_to_async(self.client.get)(reverse(name, args=args) + query)
+            async_response = await self.async_client.get(
+                reverse(f'async-{name}', args=args) + query,
+                headers={'Authorization': f'Token {self.token.key}'}
+            )
+            self.assertEqual(async_response.status_code, sync_response.status_code, name)
+            self.assertEqual(async_response.content, sync_response.content, name)
+            self.assertEqual(async_response.get('ETag'), sync_response.get('ETag'), name)
+
+    async def test_requires_token(self):
+        response = await self.async_client.get(reverse('async-boards-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_non_members_are_rejected(self):
+        stranger = await sync_to_async(create_user)('stranger')
+        token = await Token.objects.acreate(user=stranger)
+
+        response = await self.async_client.get(
+            reverse('async-board-detail', args=[self.board.id]),
+            headers={'Authorization': f'Token {token.key}'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class BoardChangesViewTests(APITestCase):
+    """
+    Tests for GET /api/boards/<pk>/changes/?since=<cursor>.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.board = create_board(self.user, tasks=3)
+        self.url = reverse('board-changes', args=[self.board.id])
+        self.client.force_authenticate(self.user)
+
+    def sync(self, seconds_later, since=''):
+        """Request the changes since the cursor `since`, `seconds_later` seconds from now."""
+        with patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(seconds=seconds_later)):
+            response = self.client.get(self.url, {'since': since})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_delta_contains_only_changes(self):
+        initial = self.sync(5)
+        self.assertEqual(len(initial['tasks']), 3)
+
+        changed, deleted, untouched = self.board.tasks.order_by('pk')
+        with patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(seconds=10)):
+            changed.title = 'Changed'
+            changed.save()
+            comment = Comment.objects.create(task=untouched, author=self.user, content='Note')
+            deleted_id = deleted.id
+            deleted.delete()
+            self.board.members.add(self.other)
+        data = self.sync(15, initial['cursor'])
+
+        self.assertEqual([task['id'] for task in data['tasks']], [changed.id])
+        self.assertEqual([item['id'] for item in data['comments']], [comment.id])
+        self.assertEqual(data['comments'][0]['task'], untouched.id)
+        self.assertEqual(data['removed_tasks'], [deleted_id])
+        self.assertEqual([user['id'] for user in data['members_added']], [self.other.id])
+        self.assertEqual(data['members_removed'], [])
+
+        self.assertEqual(self.sync(20, data['cursor'])['tasks'], [])
+
+    def test_deleting_a_user_records_their_removals(self):
+        initial = self.sync(5)
+        author = create_user('author')
+        task = self.board.tasks.first()
+        with patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(seconds=10)):
+            self.board.members.add(author)
+            comment = Comment.objects.create(task=task, author=author, content='Note')
+        data = self.sync(15, initial['cursor'])
+        self.assertEqual([item['id'] for item in data['comments']], [comment.id])
+
+        author_id = author.id
+        with patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(seconds=20)):
+            author.delete()
+        data = self.sync(25, data['cursor'])
+
+        self.assertEqual(data['removed_comments'], [comment.id])
+        self.assertEqual(data['members_removed'], [author_id])
+
+    def test_board_deletion_removes_change_log(self):
+        self.board.members.add(self.other)
+        self.board.tasks.first().delete()
+        self.assertTrue(BoardChange.objects.filter(board=self.board).exists())
+
+        self.board.delete()
+
+        self.assertFalse(BoardChange.objects.exists())
+
+    def test_invalid_cursor_and_non_members(self):
+        response = self.client.get(self.url, {'since': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(self.other)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+class ResponseCacheTests(APITestCase):
+    """
+    Tests for the per-user response cache of the read endpoints.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.board = create_board(self.user, members=[self.other], tasks=2)
+        self.task = self.board.tasks.first()
+        self.task.assignee = self.user
+        self.task.save()
+        self.client.force_authenticate(self.user)
+        response_cache.reset_stats()
+
+    def test_views_must_declare_their_cache_versions(self):
+        class UnversionedView(ResponseCacheMixin, APIView):
+            pass
+
+        request = RequestFactory().get('/unversioned/')
+        with self.assertRaisesMessage(ImproperlyConfigured, 'UnversionedView'):
+            UnversionedView().get_cached_response(lambda request: Response({}), request)
+
+    def test_hits_until_a_write_changes_the_board(self):
+        urls = [
+            reverse('boards-list'),
+            reverse('board-detail', args=[self.board.id]),
+            reverse('tasks-assigned-to-me'),
+            reverse('tasks-reviewing'),
+        ]
+        misses = [self.client.get(url) for url in urls]
+        hits = [self.client.get(url) for url in urls]
+
+        for miss, hit in zip(misses, hits):
+            self.assertEqual(miss['X-Cache'], 'MISS')
+            self.assertEqual(hit['X-Cache'], 'HIT')
+            self.assertEqual(hit.content, miss.content)
+        self.assertEqual(response_cache.get_stats(), {'hits': 4, 'misses': 4})
+
+        response = self.client.patch(reverse('task-detail', args=[self.task.id]), {'title': 'Renamed'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for url in urls[:3]:
+            self.assertEqual(self.client.get(url)['X-Cache'], 'MISS', url)
+        self.assertEqual(self.client.get(urls[2]).data[0]['title'], 'Renamed')
+        # The user reviews no task, so no board version is part of that key.
+        self.assertEqual(self.client.get(urls[3])['X-Cache'], 'HIT')
+
+    def test_comments_invalidate_the_board(self):
+        url = reverse('board-detail', args=[self.board.id])
+        self.client.get(url)
+
+        self.client.post(reverse('comments-list', args=[self.task.id]), {'content': 'Note'})
+
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        counts = {task['id']: task['comments_count'] for task in response.data['tasks']}
+        self.assertEqual(counts[self.task.id], 1)
+
+    def test_entries_are_per_user(self):
+        url = reverse('board-detail', args=[self.board.id])
+        self.client.get(url)
+
+        self.client.force_authenticate(self.other)
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+
+        self.client.force_authenticate(create_user('stranger'))
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+class RequestInstrumentationTests(APITestCase):
+    """
+    Tests for core.middleware.RequestInstrumentationMiddleware.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.board = create_board(self.user, tasks=3)
+        self.client.force_authenticate(self.user)
+
+    def test_server_timing_and_log(self):
+        with self.assertLogs('kanmind.requests', 'INFO') as logs:
+            response = self.client.get(reverse('board-detail', args=[self.board.id]))
+
+        self.assertIn('db;dur=', response['Server-Timing'])
+        self.assertIn('serializer;dur=', response['Server-Timing'])
+        report = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(report['path'], reverse('board-detail', args=[self.board.id]))
+        self.assertEqual(report['queries'], 4)
+        self.assertGreater(report['serializer_ms'], 0)
+        self.assertFalse(report['slow'])
+        self.assertEqual(report['n_plus_one'], [])
+
+    @override_settings(KANMIND_INSTRUMENTATION={'N_PLUS_ONE_THRESHOLD': 2, 'SLOW_REQUEST_MS': 0})
+    def test_repeated_sql_shapes_are_flagged(self):
+        recorder = RequestRecorder()
+        with connection.execute_wrapper(recorder):
+            for task in self.board.tasks.all():
+                Comment.objects.filter(task=task).count()
+            Task.objects.filter(pk__in=[1, 2]).count()
+            Task.objects.filter(pk__in=[1, 2, 3]).count()
+
+        request = RequestFactory().get('/api/tasks/')
+        report = recorder.get_report(request, HttpResponse())
+
+        self.assertTrue(report['slow'])
+        self.assertEqual(report['queries'], 6)
+        self.assertEqual([item['count'] for item in report['n_plus_one']], [3])
+        self.assertIn('kanban_app_comment', report['n_plus_one'][0]['sql'])
+
+    async def test_async_requests_are_recorded(self):
+        token = await Token.objects.acreate(user=self.user)
+
+        with self.assertLogs('kanmind.requests', 'INFO') as logs:
+            response = await self.async_client.get(
+                reverse('async-boards-list'),
+                headers={'Authorization': f'Token {token.key}'}
+            )
+
+        self.assertIn('db;dur=', response['Server-Timing'])
+        self.assertEqual(json.loads(logs.records[-1].getMessage())['queries'], 2)
+
+    async def test_concurrent_async_requests_record_only_their_own_queries(self):
+        token = await Token.objects.acreate(user=self.user)
+        headers = {'Authorization': f'Token {token.key}'}
+        paths = [reverse('async-boards-list'), reverse('async-board-detail', args=[self.board.id])] * 3
+
+        async def get_reports(requests):
+            with self.assertLogs('kanmind.requests', 'INFO') as logs:
+                await requests
+            return [json.loads(record.getMessage()) for record in logs.records]
+
+        # Warm the token and membership caches, then measure each path alone.
+        await get_reports(asyncio.gather(*[self.async_client.get(path, headers=headers) for path in paths[:2]]))
+        alone = {}
+        for path in paths[:2]:
+            [report] = await get_reports(self.async_client.get(path, headers=headers))
+            alone[path] = report['queries']
+
+        reports = await get_reports(asyncio.gather(*[self.async_client.get(path, headers=headers) for path in paths]))
+
+        self.assertEqual(len(reports), len(paths))
+        self.assertNotEqual(*alone.values())
+        for report in reports:
+            self.assertEqual(report['queries'], alone[report['path']])
+
+
+class ValuesSerializerTests(APITestCase):
+    """
+    Tests that the `.values()` based serializers render the same JSON as the ModelSerializers.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.nameless = User.objects.create_user(username='nameless', email='', password='secret-pass')
+        self.board = create_board(self.user, members=[self.nameless], tasks=4)
+        tasks = list(self.board.tasks.order_by('pk'))
+        tasks[0].assignee, tasks[0].reviewer = self.user, self.nameless
+        tasks[1].assignee = self.nameless
+        for task in tasks:
+            task.save()
+        Comment.objects.create(task=tasks[0], author=self.user, content='First')
+        Comment.objects.create(task=tasks[0], author=self.nameless, content='Ümlaut & <html>')
+
+    def assertSameJSON(self, serializer, values_serializer, queryset):
+        expected = JSONRenderer().render(serializer(queryset, many=True).data)
+        actual = JSONRenderer().render(values_serializer(queryset.values(*values_serializer.values)).data)
+        self.assertEqual(actual, expected)
+
+    def test_output_is_byte_identical(self):
+        tasks = Task.objects.order_by('pk').select_related('assignee', 'reviewer').with_comments_count()
+
+        self.assertSameJSON(TaskSerializer, TaskValuesSerializer, tasks)
+        self.assertSameJSON(TaskAssignedOrReviewingSerializer, TaskAssignedOrReviewingValuesSerializer, tasks)
+        self.assertSameJSON(CommentSerializer, CommentValuesSerializer, Comment.objects.order_by('pk').select_related('author'))
+        self.assertSameJSON(UserMiniSerializer, UserMiniValuesSerializer, User.objects.order_by('pk'))
+
+    def test_list_views_use_one_query(self):
+        self.client.force_authenticate(self.user)
+        task = self.board.tasks.order_by('pk').first()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('tasks-list'))
+        self.assertEqual(response.data['results'][0]['reviewer']['fullname'], '')
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('comments-list', args=[task.id]))
+        self.assertEqual([comment['author'] for comment in response.data['results']], ['Owner Tester', ''])
+
+
+class CommentsViewTests(APITestCase):
+    """
+    Tests for the paginated comment list of GET /api/tasks/<pk>/comments/.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.board = create_board(self.user, tasks=1)
+        self.task = self.board.tasks.get()
+        started = timezone.now()
+        self.comments = [
+            Comment.objects.create(task=self.task, author=self.user, content=f'Comment {index}',
+                                   created_at=started - timedelta(minutes=index // 2))
+            for index in range(7)
+        ]
+        self.client.force_authenticate(self.user)
+
+    def test_pages_follow_creation_time(self):
+        expected = [comment.id for comment in sorted(self.comments, key=lambda c: (c.created_at, c.id))]
+        url = reverse('comments-list', args=[self.task.id]) + '?page_size=3'
+
+        ids = []
+        while url:
+            with self.assertNumQueries(2):
+                response = self.client.get(url)
+            ids.extend(comment['id'] for comment in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(ids, expected)
+
+    def test_non_members_and_missing_tasks(self):
+        self.client.force_authenticate(create_user('stranger'))
+
+        self.assertEqual(
+            self.client.get(reverse('comments-list', args=[self.task.id])).status_code,
+            status.HTTP_403_FORBIDDEN
+        )
+        self.assertEqual(
+            self.client.get(reverse('comments-list', args=[999999])).status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+
+
+class BoardTransferTests(APITestCase):
+    """
+    Tests for the NDJSON board export (endpoint and command) and the import_board command.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.member = create_user('member')
+        self.board = create_board(self.user, members=[self.member], tasks=3, title='Roadmap')
+        self.task = self.board.tasks.order_by('pk').first()
+        self.task.assignee = self.member
+        self.task.save()
+        Comment.objects.create(task=self.task, author=self.member, content='Looks good')
+        self.client.force_authenticate(self.user)
+
+    def export(self):
+        response = self.client.get(reverse('board-export', args=[self.board.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        return b''.join(response.streaming_content)
+
+    def test_export_streams_one_record_per_line(self):
+        records = [json.loads(line) for line in self.export().decode().splitlines()]
+
+        self.assertEqual([record['type'] for record in records], ['board', 'member', 'task', 'task', 'task', 'comment'])
+        self.assertEqual(records[0]['owner'], 'owner@example.com')
+        self.assertEqual(records[2]['assignee'], 'member@example.com')
+        self.assertEqual(records[-1]['task'], self.task.id)
+
+    def test_export_requires_membership(self):
+        self.client.force_authenticate(create_user('stranger'))
+
+        # One lookup of the board decides between 404 and 403, plus the membership check.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('board-export', args=[self.board.id]))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('board-export', args=[self.board.id + 1]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_and_import_round_trip(self):
+        new_owner = create_user('importer')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'board.ndjson')
+            call_command('export_board', self.board.id, output=path, chunk_size=1)
+            with open(path, 'rb') as exported:
+                self.assertEqual(exported.read(), self.export())
+            call_command('import_board', path, owner=new_owner.email, batch_size=2, stdout=StringIO())
+
+        board = Board.objects.select_related('stats').get(owner=new_owner)
+        self.assertEqual(board.title, 'Roadmap')
+        self.assertEqual(set(board.members.values_list('email', flat=True)), {'owner@example.com', 'member@example.com'})
+        self.assertEqual(
+            sorted(board.tasks.values_list('title', 'assignee__email')),
+            sorted(self.board.tasks.values_list('title', 'assignee__email'))
+        )
+        comment = Comment.objects.get(task__board=board)
+        self.assertEqual((comment.author, comment.content), (self.member, 'Looks good'))
+        self.assertEqual((board.stats.task_count, board.stats.member_count), (3, 2))
+
+    def test_invalid_files_leave_nothing_behind(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'board.ndjson')
+            with open(path, 'wb') as broken:
+                broken.write(self.export().replace(b'"to_do"', b'"someday"'))
+            with self.assertRaisesMessage(CommandError, 'Line 3'):
+                call_command('import_board', path, owner=self.member.email, stdout=StringIO())
+
+        self.assertFalse(Board.objects.filter(owner=self.member).exists())
+
+
+class SearchViewTests(APITestCase):
+    """
+    Tests for the full-text search of GET /api/search/ and its trigger-maintained index.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.board = create_board(self.user)
+        self.release = Task.objects.create(board=self.board, title='Release planning', description='Agenda')
+        self.other = Task.objects.create(board=self.board, title='Cleanup', description='Prepare the release notes')
+        self.comment = Comment.objects.create(task=self.other, author=self.user, content='Release is on Friday')
+        foreign = create_board(create_user('stranger'))
+        Task.objects.create(board=foreign, title='Release secrets', description='Hidden')
+        self.client.force_authenticate(self.user)
+
+    def search(self, text, **params):
+        return self.client.get(reverse('search'), {'q': text, **params})
+
+    def test_ranked_results_of_own_boards(self):
+        with self.assertNumQueries(1):
+            response = self.search('releas')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = [(result['type'], result['id']) for result in response.data['results']]
+        self.assertEqual(results[0], ('task', self.release.id))
+        self.assertCountEqual(results, [('task', self.release.id), ('task', self.other.id), ('comment', self.comment.id)])
+        self.assertEqual(self.search('secrets').data['results'], [])
+
+    def test_pagination_and_invalid_queries(self):
+        first = self.search('release', page_size=2)
+        second = self.client.get(first.data['next'])
+
+        self.assertEqual(len(first.data['results']), 2)
+        self.assertEqual(len(second.data['results']), 1)
+        self.assertIsNone(second.data['next'])
+        self.assertEqual(self.search('" * -').status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_index_follows_updates_and_deletes(self):
+        self.release.title = 'Roadmap'
+        self.release.save()
+        self.comment.delete()
+        Task.objects.filter(pk=self.other.pk).update(description='Nothing to see')
+
+        self.assertEqual(self.search('release').data['results'], [])
+        self.assertEqual(self.search('roadmap').data['results'][0]['id'], self.release.id)
+
+    def test_rebuild_command_restores_the_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM kanban_search')
+        self.assertEqual(self.search('release').data['results'], [])
+
+        call_command('rebuild_search_index', batch_size=1, stdout=StringIO())
+
+        self.assertEqual(len(self.search('release').data['results']), 3)
+
+
+class SQLitePragmaTests(APITestCase):
+    """
+    Tests for the SQLite connection hook in core.sqlite.
+    """
+
+    def test_new_connections_are_configured(self):
+        with connection.cursor() as cursor:
+            values = {}
+            for name in ('busy_timeout', 'synchronous', 'temp_store', 'cache_size'):
+                cursor.execute(f'PRAGMA {name}')
+                values[name] = cursor.fetchone()[0]
+
+        # synchronous=NORMAL is 1, temp_store=MEMORY is 2.
+        self.assertEqual(values, {'busy_timeout': 5000, 'synchronous': 1, 'temp_store': 2, 'cache_size': -65536})
+
+    def test_file_databases_switch_to_wal(self):
+        with tempfile.TemporaryDirectory() as directory:
+            database = sqlite3.connect(os.path.join(directory, 'test.sqlite3'))
+            try:
+                apply_pragmas(database.cursor(), {'journal_mode': 'WAL', 'mmap_size': 1024})
+                self.assertEqual(database.execute('PRAGMA journal_mode').fetchone(), ('wal',))
+            finally:
+                database.close()
+
+    @override_settings(KANMIND_SQLITE_PRAGMAS={'mmap_size': None, 'temp_store': 'MEMORY; DROP TABLE auth_user'})
+    def test_disabled_and_invalid_pragmas(self):
+        self.assertNotIn('mmap_size', get_pragmas())
+        with self.assertRaises(ImproperlyConfigured):
+            get_statements(get_pragmas())
+
+
+@override_settings(KANMIND_READ_REPLICAS={'ALIASES': ['replica'], 'STICKY_SECONDS': 5, 'CACHE_ALIAS': 'default'})
+class ReplicaRoutingTests(APITestCase):
+    """
+    Tests for the read-replica routing in core.routers.
+
+    The replica test database is a separate, empty SQLite database, so
+    reads that were routed to it do not see the rows written to the primary.
+    """
+
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user('owner')
+        self.board = create_board(self.user, tasks=1)
+        self.client.force_authenticate(self.user)
+
+    def test_reads_of_replica_views_use_the_replica(self):
+        self.assertEqual(self.client.get(reverse('boards-list')).data, [])
+        self.assertEqual(self.client.get(reverse('tasks-list')).data['results'], [])
+
+    def test_other_views_read_from_the_primary(self):
+        task = self.board.tasks.get()
+
+        response = self.client.get(reverse('task-detail', args=[task.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_writers_are_pinned_to_the_primary(self):
+        response = self.client.post(reverse('boards-list'), {'title': 'New board'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        titles = [board['title'] for board in self.client.get(reverse('boards-list')).data]
+
+        self.assertEqual(sorted(titles), ['Board', 'New board'])
+        self.client.force_authenticate(create_user('other'))
+        self.assertEqual(self.client.get(reverse('boards-list')).data, [])
+
+    @override_settings(KANMIND_READ_REPLICAS={'ALIASES': []})
+    def test_without_replicas_everything_uses_the_primary(self):
+        self.assertEqual(len(self.client.get(reverse('boards-list')).data), 1)
+
+
+class SeedDataCommandTests(APITestCase):
+    """
+    Tests for the seed_data management command.
+    """
+
+    def test_seeds_requested_shape(self):
+        call_command(
+            'seed_data', users=6, boards=3, members=2, tasks=4, comments=2, batch_size=5, seed=1,
+            stdout=StringIO()
+        )
+
+        self.assertEqual(User.objects.count(), 6)
+        self.assertEqual(Task.objects.count(), 12)
+        self.assertEqual(Comment.objects.count(), 24)
+        for board in Board.objects.select_related('stats'):
+            self.assertEqual(board.members.count(), 2)
+            self.assertNotIn(board.owner, board.members.all())
+            self.assertEqual(board.stats.task_count, 4)
+            self.assertEqual(board.stats.member_count, 2)
+
+class RecordingBackend:
+    """Event backend that records published events instead of delivering them."""
+
+    def __init__(self, hub, **options):
+        self.events = []
+
+    def publish(self, event):
+        self.events.append(event)
+
+    def start(self):
+        pass
+
+
+class BoardEventsTests(APITestCase):
+    """
+    Tests for the board events published by model hooks and streamed as Server-Sent Events.
+    """
+
+    def setUp(self):
+        self.user = create_user('owner')
+        self.other = create_user('member')
+        self.board = create_board(self.user, tasks=1)
+        self.token = Token.objects.create(user=self.user)
+
+    @override_settings(KANMIND_EVENTS_BACKEND='kanban_app.tests.RecordingBackend')
+    def test_writes_publish_events_on_commit(self):
+        task = self.board.tasks.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            task.title = 'Renamed'
+            task.save()
+            comment = Comment.objects.create(task=task, author=self.user, content='Note')
+            self.board.members.add(self.other)
+            task_id, comment_id = task.id, comment.id
+            task.delete()
+
+        self.assertEqual(get_hub().backend.events, [
+            {'type': 'task.updated', 'board': self.board.id, 'id': task_id},
+            {'type': 'comment.created', 'board': self.board.id, 'id': comment_id, 'task': task_id},
+            {'type': 'members.added', 'board': self.board.id, 'users': [self.other.id]},
+            {'type': 'task.deleted', 'board': self.board.id, 'id': task_id},
+        ])
+
+    async def test_stream_delivers_board_events(self):
+        response = await self.async_client.get(
+            reverse('async-board-events', args=[self.board.id]),
+            headers={'Authorization': f'Token {self.token.key}'}
+        )
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b'retry: 3000\n\n')
+
+        event = {'type': 'task.updated', 'board': self.board.id, 'id': 1}
+        get_hub().publish({'type': 'task.updated', 'board': 0, 'id': 2})
+        get_hub().publish(event)
+        get_hub().publish({'type': 'board.deleted', 'board': self.board.id})
+
+        chunk = (await anext(stream)).decode()
+        self.assertTrue(chunk.startswith('event: task.updated\ndata: '))
+        self.assertEqual(json.loads(chunk.split('data: ')[1]), event)
+        self.assertTrue((await anext(stream)).startswith(b'event: board.deleted'))
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+        self.assertNotIn(self.board.id, get_hub().subscriptions)
+
+    async def test_non_members_cannot_subscribe(self):
+        token = await Token.objects.acreate(user=self.other)
+
+        response = await self.async_client.get(
+            reverse('async-board-events', args=[self.board.id]),
+            headers={'Authorization': f'Token {token.key}'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_members_get_a_ticket(self):
+        self.client.force_authenticate(user=self.other)
+        url = reverse('board-events-ticket', args=[self.board.id])
+        self.assertEqual(self.client.post(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(url)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(read_ticket(response.data['ticket'], self.board.id), self.user.id)
+        self.assertIsNone(read_ticket(response.data['ticket'], self.board.id + 1))
+
+    async def test_stream_accepts_a_ticket_instead_of_the_header(self):
+        url = reverse('async-board-events', args=[self.board.id])
+
+        response = await self.async_client.get(url, {'ticket': make_ticket(self.user.id, self.board.id)})
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b'retry: 3000\n\n')
+        get_hub().publish({'type': 'board.deleted', 'board': self.board.id})
+        self.assertTrue((await anext(stream)).startswith(b'event: board.deleted'))
+
+        for ticket in ['forged', make_ticket(self.user.id, self.board.id + 1)]:
+            response = await self.async_client.get(url, {'ticket': ticket})
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+            self.assertEqual(json.loads(response.content), {'detail': 'Invalid or expired ticket.'})
+
+    def test_file_backend_rotates_the_spool_without_losing_events(self):
+        received = []
+        hub = type('Hub', (), {'dispatch': staticmethod(received.append)})()
+
+        def wait_for(event):
+            for _ in range(500):
+                if event in received:
+                    return
+                time.sleep(0.01)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'events.log')
+            backend = FileBackend(hub, PATH=path, POLL_INTERVAL=0.01, MAX_BYTES=100)
+            backend.start()
+            try:
+                # The reader starts at the end of the spool; wait until it is there.
+                while not received:
+                    backend.publish({'type': 'ping', 'board': 0})
+                    wait_for({'type': 'ping', 'board': 0})
+                events = [{'type': 'task.updated', 'board': 1, 'id': number} for number in range(10)]
+                for event in events:
+                    backend.publish(event)
+                    wait_for(event)
+            finally:
+                backend.stop()
+                backend.thread.join()
+
+            self.assertEqual([event for event in received if event['type'] != 'ping'], events)
+            self.assertLess(os.path.getsize(path), 200)
+            self.assertTrue(os.path.exists(path + '.1'))
+
+    @skipUnless(os.name == 'posix', 'The spool lock uses flock().')
+    def test_file_backend_does_not_rotate_while_a_publisher_writes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'events.log')
+            backend = FileBackend(None, PATH=path, MAX_BYTES=1)
+            backend.publish({'type': 'ping', 'board': 0})
+            rotation = threading.Thread(target=backend.rotate)
+            with backend.spool_lock(shared=True):
+                rotation.start()
+                rotation.join(0.1)
+                self.assertFalse(os.path.exists(path + '.1'))
+            rotation.join()
+
+            self.assertTrue(os.path.exists(path + '.1'))
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class QueryBudgetTests(APITestCase):
+    """
+    Enforces the `query_budget` declared on every API view.
+
+    Every method of every view in kanban_app/api/views.py and
+    auth_app/api/views.py is requested against a small and a large data set
+    (more boards, members, tasks and comments, and larger request payloads)
+    and must run exactly the declared number of queries for both. Requests
+    are made with force_authenticate and cold caches, and each one is rolled
+    back so they all see the same data.
+    """
+
+    sizes = (1, 6)
+
+    def seed(self, size):
+        """Create a user with `size` boards, members and comments per task, and `size` + 1 tasks per board."""
+        self.user = create_user(f'user{size}')
+        self.members = [create_user(f'member{size}-{index}') for index in range(size)]
+        self.outsider = create_user(f'outsider{size}')
+        Token.objects.create(user=self.user)
+        boards = [
+            create_board(self.user, members=self.members, tasks=size + 1, title=f'Board {index}')
+            for index in range(size)
+        ]
+        self.board = boards[0]
+        self.tasks = list(self.board.tasks.order_by('pk'))
+        for task in Task.objects.filter(board__in=boards):
+            task.assignee = self.user
+            task.reviewer = self.user
+            task.save()
+            for index in range(size):
+                Comment.objects.create(task=task, author=self.user, content=f'Comment {index}')
+        self.task = self.tasks[0]
+        self.comment = self.task.comments.order_by('pk').first()
+        self.client.force_authenticate(self.user)
+
+    def get_requests(self, size):
+        """Return (route name, URL args, method, data) for every method of every route."""
+        member_ids = [member.pk for member in self.members]
+        task_data = {
+            'board': self.board.pk,
+            'title': 'Budget',
+            'description': 'Checked by the query budget tests.',
+            'status': Task.TO_DO,
+            'priority': Task.HIGH,
+            'assignee_id': self.user.pk,
+            'reviewer_id': self.members[0].pk,
+            'due_date': '2030-01-01'
+        }
+        batch_item = {key: value for key, value in task_data.items() if key != 'board'}
+        board, task, comment = self.board.pk, self.task.pk, self.comment.pk
+        return [
+            ('registration', [], 'post', {
+                'fullname': 'New User',
+                'email': 'new-user@example.com',
+                'password': 'secret-pass',
+                'repeated_password': 'secret-pass'
+            }),
+            ('login', [], 'post', {'email': self.user.email, 'password': 'secret-pass'}),
+            ('logout', [], 'post', None),
+            ('boards-list', [], 'get', None),
+            ('boards-list', [], 'post', {'title': 'New board', 'members': member_ids}),
+            ('board-detail', [board], 'get', None),
+            ('board-detail', [board], 'put', {'title': 'Renamed', 'members': member_ids}),
+            ('board-detail', [board], 'patch', {'members': member_ids[1:] + [self.outsider.pk]}),
+            ('board-detail', [board], 'delete', None),
+            ('board-tasks-batch', [board], 'post', {
+                'create': [batch_item] * size,
+                'update': [{'id': task.pk, 'status': Task.DONE} for task in self.tasks[:-1]],
+                'delete': [self.tasks[-1].pk]
+            }),
+            ('board-changes', [board], 'get', None),
+            ('board-export', [board], 'get', None),
+            ('board-events-ticket', [board], 'post', None),
+            ('email-check', [], 'get', {'email': self.members[0].email}),
+            ('tasks-list', [], 'get', None),
+            ('tasks-list', [], 'post', task_data),
+            ('task-detail', [task], 'get', None),
+            ('task-detail', [task], 'put', task_data),
+            ('task-detail', [task], 'patch', {'status': Task.DONE, 'assignee_id': self.members[-1].pk}),
+            ('task-detail', [task], 'delete', None),
+            ('tasks-assigned-to-me', [], 'get', None),
+            ('tasks-reviewing', [], 'get', None),
+            ('tasks-inbox', [], 'get', None),
+            ('comments-list', [task], 'get', None),
+            ('comments-list', [task], 'post', {'content': 'New comment'}),
+            ('comment-detail', [task, comment], 'get', None),
+            ('comment-detail', [task, comment], 'delete', None),
+            ('search', [], 'get', {'q': 'Task'}),
+            ('dashboard', [], 'get', None),
+        ]
+
+    def measure(self, size):
+        """Return {(view class, method): (queries, status code)} for the data set of `size`."""
+        self.seed(size)
+        results = {}
+        for name, args, method, data in self.get_requests(size):
+            url = reverse(name, args=args)
+            view = resolve(url).func.view_class
+            cache.clear()
+            with transaction.atomic(), CaptureQueriesContext(connection) as queries:
+                if method == 'get':
+                    response = self.client.get(url, data)
+                else:
+                    response = getattr(self.client, method)(url, data, format='json')
+                if response.streaming:
+                    b''.join(response.streaming_content)
+                transaction.set_rollback(True)
+            self.assertLess(response.status_code, 400, f'{method.upper()} {url}: {getattr(response, "data", None)}')
+            results[(view, method.upper())] = len(queries)
+        return results
+
+    def test_views_stay_within_their_query_budget(self):
+        results = [self.measure(size) for size in self.sizes]
+
+        for (view, method), count in results[0].items():
+            with self.subTest(view=view.__name__, method=method):
+                counts = [result[(view, method)] for result in results]
+                self.assertEqual(counts, [view.query_budget[method]] * len(counts))
+
+    def test_every_view_declares_a_budget_for_every_method(self):
+        self.seed(1)
+        exercised = {(resolve(reverse(name, args=args)).func.view_class, method.upper())
+                     for name, args, method, _ in self.get_requests(1)}
+
+        for module in (kanban_views, auth_views):
+            for view in vars(module).values():
+                if not (isinstance(view, type) and issubclass(view, APIView) and view.__module__ == module.__name__):
+                    continue
+                methods = {method.upper() for method in view.http_method_names if hasattr(view, method)} - {'HEAD', 'OPTIONS'}
+                with self.subTest(view=view.__name__):
+                    self.assertEqual(set(getattr(view, 'query_budget', {})), methods)
+                    self.assertLessEqual({(view, method) for method in methods}, exercised)
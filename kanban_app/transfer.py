@@ -0,0 +1,260 @@
+"""
+Export and import of whole boards as NDJSON for Kanmind.
+
+An export is one JSON object per line, in this order:
+
+    {"type": "board", "format": 1, "id": ..., "title": ..., "owner": <email>}
+    {"type": "member", "email": ..., "first_name": ..., "last_name": ...}
+    {"type": "task", "id": ..., "title": ..., "description": ..., "status": ...,
+     "priority": ..., "due_date": ..., "assignee": <email>, "reviewer": <email>}
+    {"type": "comment", "id": ..., "task": <task id>, "author": <email>,
+     "content": ..., "created_at": ...}
+
+Users are referenced by email, so a board can be moved between environments
+whose user IDs differ. Task and comment IDs only link comments to their tasks
+inside the file; the import assigns new IDs.
+
+export_board() reads members, tasks and comments with `.values()` and
+`.iterator(chunk_size=...)`, one query each, and yields the records one by
+one, so memory stays flat for any board size (the export endpoint and the
+export_board command stream them). The queries are not run in one
+transaction; comments whose task is not part of the export are skipped by
+the import.
+
+BoardImporter writes the records back with batched bulk_create inside one
+transaction. Members and users that do not exist in the target database are
+skipped: tasks lose such an assignee or reviewer and their comments are
+dropped. The original owner, if found, becomes a member of the new board.
+Model save() methods and signal handlers do not run, so the importer
+rebuilds the board statistics and drops the cached memberships itself; the
+search index is filled by its database triggers.
+"""
+
+import json
+from datetime import date
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+from kanban_app import membership
+from kanban_app.models import Board, BoardStats, Task, Comment
+
+
+FORMAT = 1
+CHUNK_SIZE = 2000
+
+TASK_COLUMNS = ('id', 'title', 'description', 'status', 'priority', 'due_date', 'assignee__email', 'reviewer__email')
+
+
+class BoardImportError(ValueError):
+    """Raised for an invalid export file; the message names the offending line."""
+
+
+def export_board(board, chunk_size=CHUNK_SIZE):
+    """
+    Yield the NDJSON records of `board`, its members, tasks and comments.
+
+    Args:
+        board (Board): The board to export, with its owner loaded (select_related('owner')).
+        chunk_size (int): Rows fetched from the database at a time.
+    """
+
+    yield {
+        'type': 'board',
+        'format': FORMAT,
+        'id': board.pk,
+        'title': board.title,
+        'owner': board.owner.email
+    }
+
+    members = board.members.order_by('pk').values('email', 'first_name', 'last_name')
+    for member in members.iterator(chunk_size=chunk_size):
+        yield {'type': 'member', **member}
+
+    tasks = Task.objects.filter(board=board).order_by('pk').values(*TASK_COLUMNS)
+    for task in tasks.iterator(chunk_size=chunk_size):
+        yield {
+            'type': 'task',
+            'id': task['id'],
+            'title': task['title'],
+            'description': task['description'],
+            'status': task['status'],
+            'priority': task['priority'],
+            'due_date': task['due_date'],
+            'assignee': task['assignee__email'],
+            'reviewer': task['reviewer__email']
+        }
+
+    comments = (
+        Comment.objects.filter(task__board=board)
+        .order_by('pk')
+        .values('id', 'task_id', 'author__email', 'content', 'created_at')
+    )
+    for comment in comments.iterator(chunk_size=chunk_size):
+        yield {
+            'type': 'comment',
+            'id': comment['id'],
+            'task': comment['task_id'],
+            'author': comment['author__email'],
+            'content': comment['content'],
+            'created_at': comment['created_at']
+        }
+
+
+def to_ndjson(records):
+    """Yield every record as one encoded JSON line."""
+    for record in records:
+        yield (json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n').encode()
+
+
+class BoardImporter:
+    """
+    Creates a board from the lines of an export with batched bulk_create.
+
+    Usage:
+        board = BoardImporter(owner, batch_size=1000).run(lines)
+
+    Args:
+        owner (User): Owner of the imported board.
+        batch_size (int): Rows written per INSERT statement.
+
+    Attributes:
+        counts (dict): Imported and skipped members, tasks and comments.
+    """
+
+    def __init__(self, owner, batch_size=1000):
+        self.owner = owner
+        self.batch_size = batch_size
+        self.board = None
+        self.user_ids = {owner.email: owner.pk}
+        self.task_ids = {}
+        self.pending_members = []
+        self.pending_tasks = []
+        self.pending_comments = []
+        self.counts = dict.fromkeys(['members', 'tasks', 'comments', 'skipped_members', 'skipped_comments'], 0)
+
+    def run(self, lines):
+        """
+        Import the export in `lines` (str or bytes) and return the new board.
+
+        Raises:
+            BoardImportError: If a line is not a valid record or the records are out of order.
+        """
+
+        with transaction.atomic():
+            for number, line in enumerate(lines, start=1):
+                if isinstance(line, bytes):
+                    line = line.decode()
+                if not line.strip():
+                    continue
+                try:
+                    self.add(json.loads(line))
+                except (ValueError, KeyError, TypeError, ValidationError) as error:
+                    raise BoardImportError(f'Line {number}: {error}') from error
+            if self.board is None:
+                raise BoardImportError('The file contains no board.')
+            self.flush_members()
+            self.flush_tasks()
+            self.flush_comments()
+            BoardStats.rebuild([self.board.pk])
+            membership.invalidate(self.user_ids.values())
+        return self.board
+
+    def add(self, record):
+        kind = record['type']
+        if kind == 'board':
+            if self.board is not None:
+                raise ValueError('Only one board per file is supported.')
+            if record.get('format') != FORMAT:
+                raise ValueError(f'Unsupported format {record.get("format")!r}.')
+            self.board = Board(owner=self.owner, title=record['title'])
+            self.board.full_clean(exclude=['members'])
+            self.board.save()
+            if record.get('owner'):
+                self.pending_members.append(record['owner'])
+        elif self.board is None:
+            raise ValueError('The board record must come first.')
+        elif kind == 'member':
+            self.pending_members.append(record['email'])
+            if len(self.pending_members) >= self.batch_size:
+                self.flush_members()
+        elif kind == 'task':
+            self.flush_members()
+            self.pending_tasks.append((record['id'], self.build_task(record)))
+            if len(self.pending_tasks) >= self.batch_size:
+                self.flush_tasks()
+        elif kind == 'comment':
+            self.flush_tasks()
+            comment = self.build_comment(record)
+            if comment is None:
+                self.counts['skipped_comments'] += 1
+                return
+            self.pending_comments.append(comment)
+            if len(self.pending_comments) >= self.batch_size:
+                self.flush_comments()
+        else:
+            raise ValueError(f'Unknown record type {kind!r}.')
+
+    def flush_members(self):
+        """Add the pending members that exist in this database to the board."""
+        if not self.pending_members:
+            return
+        emails = set(self.pending_members) - {self.owner.email}
+        found = dict(User.objects.filter(email__in=emails).values_list('email', 'pk'))
+        new = {email: user_id for email, user_id in found.items() if email not in self.user_ids}
+        Board.members.through.objects.bulk_create(
+            [Board.members.through(board_id=self.board.pk, user_id=user_id) for user_id in new.values()],
+            batch_size=self.batch_size
+        )
+        self.user_ids.update(new)
+        self.counts['members'] += len(new)
+        self.counts['skipped_members'] += len(emails - found.keys())
+        self.pending_members = []
+
+    def build_task(self, record):
+        """Return the validated, unsaved Task of a task record."""
+        task = Task(
+            board=self.board,
+            title=record['title'],
+            description=record['description'],
+            status=record['status'],
+            priority=record['priority'],
+            due_date=date.fromisoformat(record['due_date']),
+            assignee_id=self.user_ids.get(record.get('assignee')),
+            reviewer_id=self.user_ids.get(record.get('reviewer'))
+        )
+        task.full_clean(exclude=['board', 'assignee', 'reviewer'])
+        return task
+
+    def flush_tasks(self):
+        """Create the pending tasks and remember their new IDs."""
+        if not self.pending_tasks:
+            return
+        tasks = [task for _, task in self.pending_tasks]
+        Task.objects.bulk_create(tasks, batch_size=self.batch_size)
+        for old_id, task in self.pending_tasks:
+            self.task_ids[old_id] = task.pk
+        self.counts['tasks'] += len(tasks)
+        self.pending_tasks = []
+
+    def build_comment(self, record):
+        """Return the validated, unsaved Comment of a comment record, or None if its task or author is unknown."""
+        task_id = self.task_ids.get(record['task'])
+        author_id = self.user_ids.get(record['author'])
+        if task_id is None or author_id is None:
+            return None
+        created_at = parse_datetime(record['created_at'])
+        if created_at is None:
+            raise ValueError(f'Invalid created_at {record["created_at"]!r}.')
+        comment = Comment(task_id=task_id, author_id=author_id, content=record['content'], created_at=created_at)
+        comment.full_clean(exclude=['task', 'author'])
+        return comment
+
+    def flush_comments(self):
+        """Create the pending comments."""
+        if not self.pending_comments:
+            return
+        Comment.objects.bulk_create(self.pending_comments, batch_size=self.batch_size)
+        self.counts['comments'] += len(self.pending_comments)
+        self.pending_comments = []